@@ -1,11 +1,20 @@
-from typing import Any, Callable
+import os
+from threading import Lock
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
 from contextlib import contextmanager
+from orionis.luminate.console.output.console import Console
 from orionis.luminate.contracts.foundation.i_bootstraper import IBootstrapper
 from orionis.luminate.container.container import Container
+from orionis.luminate.container.dependency_graph import DependencyEdge, DependencyGraph
 from orionis.luminate.foundation.config.config_bootstrapper import ConfigBootstrapper
 from orionis.luminate.foundation.console.command_bootstrapper import CommandsBootstrapper
 from orionis.luminate.foundation.environment.environment_bootstrapper import EnvironmentBootstrapper
+from orionis.luminate.foundation.exceptions.exception_bootstrapper import BootstrapRuntimeError
+from orionis.luminate.foundation.manifest.boot_manifest import BootManifest
+from orionis.luminate.foundation.memory.gc_tuner import GcTuner
 from orionis.luminate.foundation.providers.service_providers_bootstrapper import ServiceProvidersBootstrapper
+from orionis.luminate.foundation.reload.module_reloader import ModuleReloader
+from orionis.luminate.foundation.tracing.boot_tracer import BootTracer
 from orionis.luminate.patterns.singleton import SingletonMeta
 from orionis.luminate.providers.service_provider import ServiceProvider
 
@@ -88,15 +97,206 @@ class Application(metaclass=SingletonMeta):
         # Class attributes
         self._before_boot_service_providers: list = []
         self._after_boot_service_providers: list = []
+        self._deferred_service_providers: list = []
         self._config: dict = {}
         self._commands: dict = {}
         self._environment_vars: dict = {}
         self._booted: bool = False
+        self._warmup: bool = False
+        self._warmup_workers: Optional[int] = None
+        self._boot_trace_path: Optional[str] = None
+        self._boot_tracer: Optional[BootTracer] = None
+        self._gc_tuner: Optional[GcTuner] = None
+        self._provider_workers: Optional[int] = None
+        self._loaded_providers: Dict[str, type] = {}
+        self._hot_reload: Optional[Dict[str, Any]] = None
+        self._file_watcher = None
+        self._reload_hooks: List[Callable[[Dict[str, Any]], Any]] = []
+        self._reload_lock = Lock()
 
         # Initialize the application container
         self.container = container
         self.container.instance(container)
 
+        # Record every resolution when the container profiler is requested
+        if os.getenv('ORIONIS_CONTAINER_PROFILE', '').lower() in ('1', 'true', 'yes'):
+            self.container.enableProfiling()
+
+        # Trace the boot when requested with ORIONIS_PROFILE_BOOT, whose value may be the
+        # path of the trace file. The reactor sets it for the '--profile-boot' flag
+        profile_boot = os.getenv('ORIONIS_PROFILE_BOOT', '')
+        if profile_boot and profile_boot.lower() not in ('0', 'false', 'no'):
+            self.withBootProfiling(None if profile_boot.lower() in ('1', 'true', 'yes') else profile_boot)
+
+        # Watch the sources of the application when requested with ORIONIS_HOT_RELOAD
+        if os.getenv('ORIONIS_HOT_RELOAD', '').lower() in ('1', 'true', 'yes'):
+            self.withHotReload()
+
+    def withWarmup(self, max_workers: Optional[int] = None) -> 'Application':
+        """
+        Builds every registered singleton during boot instead of on first use.
+
+        The singletons are built following the dependency graph, with independent
+        branches running concurrently on a thread pool, so their first-use latency
+        and construction errors surface at boot.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The maximum number of threads used to build independent singletons.
+
+        Returns
+        -------
+        Application
+            The application instance, for chaining before `boot()`.
+        """
+        self._warmup = True
+        self._warmup_workers = max_workers
+        return self
+
+    def withProviderWorkers(self, max_workers: Optional[int] = None) -> 'Application':
+        """
+        Sets the number of threads booting independent service providers.
+
+        Providers whose dependencies are all booted are booted concurrently, so
+        providers waiting on I/O (creating directories, reading files, opening
+        connections) overlap. A single worker boots them one at a time, in the
+        same dependency order.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The maximum number of threads, by default that of `ThreadPoolExecutor`.
+
+        Returns
+        -------
+        Application
+            The application instance, for chaining before `boot()`.
+        """
+        self._provider_workers = max_workers
+        return self
+
+    def withHotReload(self, interval: float = 1.0, backend: str = 'auto') -> 'Application':
+        """
+        Reloads the configuration, the commands and the task manager when their files change.
+
+        Once booted, the application watches `config/`, `app/console/commands` and
+        `app/console/tasks_manager.py` on a background thread, and `reload()` imports
+        again only the changed modules, so long-running processes such as
+        `schedule:work` pick up the changes without a restart.
+
+        Parameters
+        ----------
+        interval : float, optional
+            The number of seconds between two scans when inotify is not available.
+        backend : str, optional
+            'inotify', 'poll' or 'auto' to use inotify when available.
+
+        Returns
+        -------
+        Application
+            The application instance, for chaining before `boot()`.
+        """
+        self._hot_reload = {'interval': interval, 'backend': backend}
+        return self
+
+    def onReload(self, hook: Callable[[Dict[str, Any]], Any]) -> None:
+        """
+        Register a function called after each reload with its summary, as returned
+        by `reload()`.
+
+        Parameters
+        ----------
+        hook : Callable[[Dict[str, Any]], Any]
+            The function to call.
+        """
+        self._reload_hooks.append(hook)
+
+    def getFileWatcher(self):
+        """
+        Retrieve the watcher of the application sources.
+
+        Returns
+        -------
+        Optional[FileWatcher]
+            The watcher started by the boot, or None unless enabled with `withHotReload()`.
+        """
+        return self._file_watcher
+
+    def withBootProfiling(self, path: Optional[str] = None) -> 'Application':
+        """
+        Records the time taken by each phase of the boot.
+
+        Once booted, the spans are written to a Chrome trace file, which can be opened
+        in `chrome://tracing` or Perfetto, and the slowest ones are printed.
+
+        Parameters
+        ----------
+        path : str, optional
+            The location of the trace file, `storage/logs/boot_trace.json` by default.
+
+        Returns
+        -------
+        Application
+            The application instance, for chaining before `boot()`.
+        """
+        self._boot_trace_path = path or os.path.join('storage', 'logs', 'boot_trace.json')
+        return self
+
+    def withGcTuning(
+        self,
+        thresholds: Optional[Tuple[int, ...]] = None,
+        freeze: bool = True,
+        on_pause: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ) -> 'Application':
+        """
+        Tunes the garbage collector once booted.
+
+        A full collection runs at the end of the boot, the surviving objects are
+        frozen so the collector never scans them again, and the thresholds are set.
+        Long-running processes, such as `schedule:work`, then see fewer and shorter
+        collection pauses.
+
+        Parameters
+        ----------
+        thresholds : Tuple[int, ...], optional
+            The thresholds given to `gc.set_threshold()`, unchanged if None.
+        freeze : bool, optional
+            Whether to freeze the objects surviving the boot.
+        on_pause : Callable[[Dict[str, Any]], Any], optional
+            The function receiving the 'generation', 'duration', 'collected' and
+            'uncollectable' of every collection run after the boot.
+
+        Returns
+        -------
+        Application
+            The application instance, for chaining before `boot()`.
+        """
+        self._gc_tuner = GcTuner(thresholds, freeze, on_pause)
+        return self
+
+    def getGcTuner(self) -> Optional[GcTuner]:
+        """
+        Retrieve the tuner of the garbage collector.
+
+        Returns
+        -------
+        Optional[GcTuner]
+            The tuner recording the collection pauses, or None if not enabled.
+        """
+        return self._gc_tuner
+
+    def getBootTracer(self) -> Optional[BootTracer]:
+        """
+        Retrieve the tracer of the last traced boot.
+
+        Returns
+        -------
+        Optional[BootTracer]
+            The tracer holding the boot spans, or None if the boot was not traced.
+        """
+        return self._boot_tracer
+
     def isBooted(self) -> bool:
         """
         Check if the application has been booted.
@@ -108,7 +308,7 @@ class Application(metaclass=SingletonMeta):
         """
         return self._booted
 
-    def bind(self, concrete: Callable[..., Any]) -> str:
+    def bind(self, concrete: Callable[..., Any], lazy: bool = False) -> str:
         """
         Bind a callable to the container.
         This method ensures that the provided callable is not the main function,
@@ -117,23 +317,25 @@ class Application(metaclass=SingletonMeta):
         the callable in the container's bindings.
         Args:
             concrete (Callable[..., Any]): The callable to be bound to the container.
+            lazy (bool): Whether dependents receive a proxy that builds the service on first use.
         Returns:
             str: The unique key generated for the callable.
         """
-        return self.container.bind(concrete)
+        return self.container.bind(concrete, lazy)
 
-    def transient(self, concrete: Callable[..., Any]) -> str:
+    def transient(self, concrete: Callable[..., Any], lazy: bool = False) -> str:
         """
         Registers a transient service in the container.
         A transient service is created each time it is requested.
         Args:
             concrete (Callable[..., Any]): The callable that defines the service.
+            lazy (bool): Whether dependents receive a proxy that builds the service on first use.
         Returns:
             str: The unique key generated for the callable.
         """
-        return self.container.transient(concrete)
+        return self.container.transient(concrete, lazy)
 
-    def singleton(self, concrete: Callable[..., Any]) -> str:
+    def singleton(self, concrete: Callable[..., Any], lazy: bool = False) -> str:
         """
         Registers a callable as a singleton in the container.
         This method ensures that the provided callable is not the main module,
@@ -141,12 +343,13 @@ class Application(metaclass=SingletonMeta):
         the callable as a singleton, storing it in the container's singleton registry.
         Args:
             concrete (Callable[..., Any]): The callable to be registered as a singleton.
+            lazy (bool): Whether dependents receive a proxy that builds the service on first use.
         Returns:
             str: The key under which the singleton is registered in the container.
         """
-        return self.container.singleton(concrete)
+        return self.container.singleton(concrete, lazy)
 
-    def scoped(self, concrete: Callable[..., Any]) -> str:
+    def scoped(self, concrete: Callable[..., Any], lazy: bool = False) -> str:
         """
         Registers a callable as a scoped service.
         This method ensures that the provided callable is not the main service,
@@ -154,10 +357,32 @@ class Application(metaclass=SingletonMeta):
         scoped services dictionary with relevant metadata.
         Args:
             concrete (Callable[..., Any]): The callable to be registered as a scoped service.
+            lazy (bool): Whether dependents receive a proxy that builds the service on first use.
         Returns:
             str: The key under which the callable is registered in the scoped services dictionary.
         """
-        return self.container.scoped(concrete)
+        return self.container.scoped(concrete, lazy)
+
+    def pooled(
+        self,
+        concrete: Callable[..., Any],
+        max_size: int = 10,
+        block: bool = True,
+        timeout: Optional[float] = None,
+        reset: Optional[Callable[[Any], None]] = None
+    ) -> str:
+        """
+        Registers a callable as a pooled service, borrowed with `borrow()`.
+        Args:
+            concrete (Callable[..., Any]): The callable that defines the service.
+            max_size (int): The maximum number of instances alive at the same time.
+            block (bool): Whether borrowing waits for a release when the pool is exhausted, or fails.
+            timeout (Optional[float]): The maximum number of seconds to wait when blocking.
+            reset (Optional[Callable[[Any], None]]): A hook clearing the state of an instance when it is returned.
+        Returns:
+            str: The key under which the pooled service is registered in the container.
+        """
+        return self.container.pooled(concrete, max_size, block, timeout, reset)
 
     def instance(self, instance: Any) -> str:
         """
@@ -196,6 +421,22 @@ class Application(metaclass=SingletonMeta):
         """
         return self.container.has(obj)
 
+    def borrow(self, abstract: Any) -> ContextManager[Any]:
+        """
+        Check out an instance of a pooled service for the duration of a `with` block.
+
+        Parameters
+        ----------
+        abstract : Any
+            The pooled service class or alias.
+
+        Returns
+        -------
+        ContextManager[Any]
+            A context manager yielding the instance and returning it to the pool on exit.
+        """
+        return self.container.borrow(abstract)
+
     def make(self, abstract: Any) -> Any:
         """
         Create and return an instance of a registered service.
@@ -217,12 +458,67 @@ class Application(metaclass=SingletonMeta):
         """
         return self.container.make(abstract)
 
+    def call(self, target: Callable[..., Any], overrides: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Call a function or bound method, injecting its dependencies from the container.
+
+        Parameters
+        ----------
+        target : Callable[..., Any]
+            The function or bound method to call.
+        overrides : Dict[str, Any], optional
+            Values of parameters by name, taking precedence over injection.
+
+        Returns
+        -------
+        Any
+            The value returned by the call.
+
+        Raises
+        ------
+        OrionisContainerException
+            If a parameter without value cannot be resolved.
+        """
+        return self.container.call(target, overrides)
+
+    async def makeAsync(self, abstract: Any) -> Any:
+        """
+        Asynchronously create and return an instance of a registered service.
+
+        Parameters
+        ----------
+        abstract : Any
+            The service class or alias to instantiate.
+
+        Returns
+        -------
+        Any
+            An instance of the requested service.
+
+        Raises
+        ------
+        OrionisContainerException
+            If the service is not found in the container.
+        """
+        return await self.container.makeAsync(abstract)
+
     def forgetScopedInstances(self) -> None:
         """
         Reset scoped instances at the beginning of a new request.
         """
         return self.container.forgetScopedInstances()
 
+    def scope(self):
+        """
+        Open an isolated scope for scoped services.
+
+        Returns
+        -------
+        ContextManager[Container]
+            A context manager whose scoped instances are dropped on exit.
+        """
+        return self.container.scope()
+
     def boot(self):
         """
         Bootstraps the application by loading environment configuration and core providers.
@@ -234,17 +530,70 @@ class Application(metaclass=SingletonMeta):
         3. Initializing core components.
         4. Executing post-bootstrap provider hooks.
         5. Loading command-line interface commands.
-        After these steps, the application is marked as booted.
+        6. Checking the dependency graph for circular dependencies.
+        7. Building every singleton ahead of time, when enabled with `withWarmup()`.
+        8. Freezing the boot objects and tuning the garbage collector, when enabled
+           with `withGcTuning()`.
+        9. Watching the application sources, when enabled with `withHotReload()`.
+        After these steps, the application is marked as booted. When enabled with
+        `withBootProfiling()`, each step is traced and the trace is reported.
         """
         # Mark the application as booted
         Application.started()
 
+        tracer = BootTracer.active()
+        if self._boot_trace_path is not None:
+            tracer = self._boot_tracer = BootTracer.activate(BootTracer())
+
         # Bootstrapping process
-        self._bootServices()
-        self._beforeBootstrapProviders()
-        self._bootstrapping()
-        self._afterBootstrapProviders()
-        self._loadCommands()
+        try:
+            with tracer.span('boot', 'application'):
+                for step in (
+                    self._bootServices,
+                    self._beforeBootstrapProviders,
+                    self._bootstrapping,
+                    self._afterBootstrapProviders,
+                    self._loadCommands,
+                    self._checkDependencies,
+                    self._warmUpSingletons,
+                    self._tuneGarbageCollector,
+                    self._startFileWatcher
+                ):
+                    with tracer.span(step.__name__, 'application'):
+                        step()
+        finally:
+            if self._boot_tracer is tracer:
+                BootTracer.deactivate()
+                self._reportBootTrace()
+
+    def _reportBootTrace(self):
+        """
+        Writes the boot trace and prints its slowest spans.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        path = self._boot_tracer.export(self._boot_trace_path)
+        rows = [
+            [
+                span['name'],
+                span['category'],
+                f"{span['duration'] * 1e3:.3f}",
+                f"{span['self'] * 1e3:.3f}"
+            ]
+            for span in self._boot_tracer.summary(limit=25)
+        ]
+
+        Console.newLine()
+        Console.textSuccessBold(" (Boot) Slowest Spans: ")
+        Console.table(["Span", "Category", "Total (ms)", "Self (ms)"], rows)
+        Console.info(f"Boot trace written to {path}, open it in chrome://tracing or Perfetto.")
+        Console.newLine()
 
     def _bootServices(self):
         """
@@ -252,7 +601,10 @@ class Application(metaclass=SingletonMeta):
 
         This method is responsible for loading the application's services. It reads all the
         ServiceProviders from the Core and those defined by the developer. Then, it stores
-        in class dictionaries the services that need to be loaded before and after the Bootstrap.
+        in class dictionaries the services that need to be loaded before and after the Bootstrap,
+        and defers the providers that are only loaded when their services are requested.
+        The boot manifest is registered first, so every bootstrapper can skip its
+        discovery when the manifest generated by the `optimize` command is valid.
 
         Parameters
         ----------
@@ -262,10 +614,210 @@ class Application(metaclass=SingletonMeta):
         -------
         None
         """
+        self.singleton(BootManifest)
         services_bootstrapper_key = self.singleton(ServiceProvidersBootstrapper)
-        services_bootstrapper: ServiceProvidersBootstrapper = self.make(services_bootstrapper_key)
+        with BootTracer.active().span(ServiceProvidersBootstrapper.__name__, 'bootstrapper'):
+            services_bootstrapper: ServiceProvidersBootstrapper = self.make(services_bootstrapper_key)
         self._before_boot_service_providers = services_bootstrapper.getBeforeServiceProviders()
         self._after_boot_service_providers = services_bootstrapper.getAfterServiceProviders()
+        self._deferred_service_providers = services_bootstrapper.getDeferredServiceProviders()
+        self._deferProviders()
+
+    def _deferProviders(self):
+        """
+        Postpones the deferred service providers until their services are requested.
+
+        Each deferred provider is only instantiated, registered and booted the first
+        time one of the services listed in its `provides` attribute is resolved from
+        the container, so unused providers cost nothing at boot.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        for service in self._deferred_service_providers:
+            self.container.defer(service.provides, lambda service=service: self._loadProvider(service))
+
+    def _loadProvider(self, service: type):
+        """
+        Instantiates, registers and boots a service provider.
+
+        Parameters
+        ----------
+        service : type
+            The service provider class to load.
+
+        Returns
+        -------
+        None
+        """
+        tracer = BootTracer.active()
+        _service_provider : ServiceProvider = service(app=self.container)
+        with tracer.span(f"{service.__name__}.register", 'provider'):
+            _service_provider.register()
+        with tracer.span(f"{service.__name__}.boot", 'provider'):
+            _service_provider.boot()
+        self._loaded_providers[self._providerKey(service)] = service
+
+    def _loadProviders(self, providers: list):
+        """
+        Registers and boots a group of service providers following their dependencies.
+
+        The providers are loaded layer by layer: each layer only holds providers whose
+        dependencies were registered and booted in the previous layers or groups. The
+        providers of a layer are registered one at a time, since registering only
+        records bindings, then booted concurrently on a thread pool, so a provider is
+        always registered and booted after its dependencies, as when loading them one
+        by one. Every failure is collected, the dependents of a failed provider are
+        not loaded, and the failures are reported together, sorted by provider.
+
+        Parameters
+        ----------
+        providers : list
+            The service provider classes to load.
+
+        Raises
+        ------
+        BootstrapRuntimeError
+            If a dependency is unknown or circular, or any provider fails to boot.
+        """
+        graph = self._providerGraph(providers)
+        cycles = graph.findCycles()
+        if cycles:
+            paths = "; ".join(" -> ".join(cycle) for cycle in cycles)
+            raise BootstrapRuntimeError(f"Circular dependency between service providers: {paths}")
+        layers = graph.layers()
+
+        tracer = BootTracer.active()
+        by_key = {self._providerKey(service): service for service in providers}
+        instances: Dict[str, ServiceProvider] = {}
+
+        def boot(key: str) -> None:
+            with tracer.span(f"{by_key[key].__name__}.boot", 'provider'):
+                instances[key].boot()
+
+        errors: Dict[str, Exception] = {}
+        executor = None
+        try:
+            for layer in layers:
+                pending = []
+                for key in layer:
+                    if any(edge.target in errors for edge in graph.dependenciesOf(key)):
+                        errors[key] = RuntimeError("A dependency failed to boot.")
+                        continue
+                    try:
+                        instances[key] = by_key[key](app=self.container)
+                        with tracer.span(f"{by_key[key].__name__}.register", 'provider'):
+                            instances[key].register()
+                        pending.append(key)
+                    except Exception as e:
+                        errors[key] = e
+
+                if len(pending) > 1 and self._provider_workers != 1:
+                    if executor is None:
+                        # Imported on first use, a thread pool is only needed by independent providers
+                        from concurrent.futures import ThreadPoolExecutor
+                        executor = ThreadPoolExecutor(max_workers=self._provider_workers, thread_name_prefix='orionis-providers')
+                    futures = [(key, executor.submit(boot, key)) for key in pending]
+                else:
+                    futures = [(key, None) for key in pending]
+
+                for key, future in futures:
+                    try:
+                        boot(key) if future is None else future.result()
+                        self._loaded_providers[key] = by_key[key]
+                    except Exception as e:
+                        errors[key] = e
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if errors:
+            details = "; ".join(f"{key}: {errors[key]}" for key in sorted(errors))
+            raise BootstrapRuntimeError(f"Failed to boot {len(errors)} service provider(s): {details}")
+
+    def _providerGraph(self, providers: list) -> DependencyGraph:
+        """
+        Builds the dependency graph of a group of service providers.
+
+        Dependencies already loaded, or deferred and thus loaded on first use of
+        their services, are satisfied and left out of the graph.
+
+        Parameters
+        ----------
+        providers : list
+            The service provider classes of the group.
+
+        Returns
+        -------
+        DependencyGraph
+            The graph whose nodes are the qualified names of the providers.
+
+        Raises
+        ------
+        BootstrapRuntimeError
+            If a dependency is not a discovered provider, or is loaded after the
+            provider depending on it.
+        """
+        group = {self._providerKey(service): service for service in providers}
+        known = {
+            self._providerKey(service): service
+            for service in (
+                self._before_boot_service_providers
+                + self._after_boot_service_providers
+                + self._deferred_service_providers
+            )
+        }
+        known.update(group)
+
+        edges = []
+        for key, service in group.items():
+            for dependency in service.dependencies:
+                target = self._resolveProviderDependency(dependency, known)
+                if target is None:
+                    raise BootstrapRuntimeError(f"Service provider {key} depends on {dependency!r}, which is not a discovered service provider.")
+                if target in group:
+                    edges.append(DependencyEdge(key, target, 'dependencies'))
+                elif target not in self._loaded_providers and not known[target].deferred:
+                    raise BootstrapRuntimeError(f"Service provider {key} depends on {target}, which is loaded after it.")
+
+        return DependencyGraph({key: 'provider' for key in group}, edges)
+
+    @staticmethod
+    def _resolveProviderDependency(dependency: Any, known: Dict[str, type]) -> Optional[str]:
+        """
+        Retrieve the qualified name of the provider designated by a dependency.
+
+        Parameters
+        ----------
+        dependency : Any
+            A provider class, its qualified name or its class name.
+        known : Dict[str, type]
+            The discovered providers, by qualified name.
+
+        Returns
+        -------
+        Optional[str]
+            The qualified name of the provider, or None if it is unknown or ambiguous.
+        """
+        if isinstance(dependency, type):
+            key = Application._providerKey(dependency)
+            return key if key in known else None
+        if dependency in known:
+            return dependency
+        matches = [key for key, service in known.items() if service.__name__ == dependency]
+        return matches[0] if len(matches) == 1 else None
+
+    @staticmethod
+    def _providerKey(service: type) -> str:
+        """
+        Retrieve the qualified name identifying a service provider class.
+        """
+        return f"{service.__module__}.{service.__qualname__}"
 
     def _beforeBootstrapProviders(self):
         """
@@ -276,10 +828,7 @@ class Application(metaclass=SingletonMeta):
         of service providers that need to be initialized early, registers them, and
         then boots them to make sure they are ready for use.
         """
-        for service in self._before_boot_service_providers:
-            _environment_provider : ServiceProvider = service(app=self.container)
-            _environment_provider.register()
-            _environment_provider.boot()
+        self._loadProviders(self._before_boot_service_providers)
 
     def _bootstrapping(self):
         """
@@ -298,7 +847,8 @@ class Application(metaclass=SingletonMeta):
         for bootstrapper in singletons_bootstrappers:
             property_cls, bootstrapper_class = bootstrapper
             bootstrapper_key = self.singleton(bootstrapper_class)
-            bootstrapper_instance : IBootstrapper = self.make(bootstrapper_key)
+            with BootTracer.active().span(bootstrapper_class.__name__, 'bootstrapper'):
+                bootstrapper_instance : IBootstrapper = self.make(bootstrapper_key)
             property_cls.update(bootstrapper_instance.get())
 
     def _loadCommands(self):
@@ -306,7 +856,9 @@ class Application(metaclass=SingletonMeta):
         Loads CLI commands, including both core system commands and those defined by the developer.
 
         This method iterates over the commands stored in the `_commands` attribute, binds each command 
-        to its corresponding concrete implementation, and registers the command alias.
+        to its corresponding concrete implementation, and registers the command alias. Commands
+        registered from the boot manifest are not imported yet, so their binding is deferred
+        until the command is resolved, and only the module of the executed command is imported.
 
         Parameters
         ----------
@@ -316,18 +868,201 @@ class Application(metaclass=SingletonMeta):
         -------
         None
         """
+        commands_bootstrapper : CommandsBootstrapper = self.make(CommandsBootstrapper)
         for command in self._commands.keys():
             data_command:dict = self._commands[command]
-            id_container_concrete = self.bind(data_command.get('concrete'))
+            if data_command.get('concrete') is None:
+                id_container_concrete = f"{data_command['module']}.{data_command['class']}"
+                self.container.defer(
+                    [id_container_concrete],
+                    lambda command=command: self.bind(commands_bootstrapper.load(command)['concrete'])
+                )
+            else:
+                id_container_concrete = self.bind(data_command.get('concrete'))
             self.alias(alias=command, concrete=id_container_concrete)
 
+    def _checkDependencies(self):
+        """
+        Verifies that no registered service depends on itself.
+
+        The dependency graph is built from every binding once registration is over, so a
+        circular constructor dependency fails the boot with its full path instead of
+        exhausting the recursion limit the first time the service is resolved.
+
+        Raises
+        ------
+        OrionisContainerException
+            If a circular dependency is found.
+        """
+        self.container.graph().ensureAcyclic()
+
+    def _warmUpSingletons(self):
+        """
+        Builds the registered singletons when the warm-up is enabled.
+
+        The construction time of each singleton is available afterwards through
+        `container.getWarmupTimes()`.
+
+        Raises
+        ------
+        OrionisContainerException
+            If any singleton fails to build, reporting every failed service.
+        """
+        if self._warmup:
+            self.container.warmUp(self._warmup_workers)
+
+    def _tuneGarbageCollector(self):
+        """
+        Freezes the objects created by the boot and tunes the garbage collector,
+        when enabled with `withGcTuning()`.
+        """
+        if self._gc_tuner is not None:
+            self._gc_tuner.apply()
+
+    def _startFileWatcher(self):
+        """
+        Starts watching the sources reloaded by `reload()`, when enabled with `withHotReload()`.
+        """
+        if self._hot_reload is None or self._file_watcher is not None:
+            return
+
+        # Imported on first use, the watcher is only needed when hot reloading
+        from orionis.luminate.foundation.reload.file_watcher import FileWatcher
+        self._file_watcher = FileWatcher(
+            [
+                'config',
+                os.path.join('app', 'console', 'commands'),
+                os.path.join('app', 'console', 'tasks_manager.py')
+            ],
+            interval=self._hot_reload['interval'],
+            backend=self._hot_reload['backend']
+        )
+        self._file_watcher.start(self.reload)
+
+    def reload(self, files: List[str]) -> Dict[str, Any]:
+        """
+        Imports again the changed configuration, command and task manager modules.
+
+        Each bootstrapper rebuilds the entries of the changed modules in a copy and
+        swaps it in at once, then the container is updated: the configuration
+        service is rebuilt on its next resolution, changed commands are bound to
+        their new class, and removed commands are forgotten. The services already
+        built keep the configuration they read. The hooks registered with
+        `onReload()` are called when anything changed.
+
+        Parameters
+        ----------
+        files : List[str]
+            The paths of the changed files.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The configuration sections reloaded or removed ('config'), the signatures
+            of the commands 'loaded' and 'removed' ('commands'), and whether the task
+            manager was reloaded ('tasks').
+
+        Raises
+        ------
+        BootstrapRuntimeError
+            If a changed module cannot be loaded. The configuration, the commands and
+            the task manager are reloaded independently, so the other parts are still
+            reloaded, and the part that failed keeps its previous entries.
+        """
+        with self._reload_lock:
+            summary = {'config': [], 'commands': {'loaded': [], 'removed': []}, 'tasks': False}
+            errors = []
+            for area, step in (('config', self._reloadConfig), ('commands', self._reloadCommands), ('tasks', self._reloadTasks)):
+                try:
+                    summary[area] = step(files)
+                except Exception as e:
+                    errors.append(e)
+
+            if summary['config'] or summary['commands']['loaded'] or summary['commands']['removed'] or summary['tasks']:
+                for hook in self._reload_hooks:
+                    hook(summary)
+
+            if errors:
+                details = "; ".join(f"{error}: {error.__cause__}" if error.__cause__ else str(error) for error in errors)
+                raise BootstrapRuntimeError(f"Failed to reload {len(errors)} part(s) of the application: {details}") from errors[0]
+            return summary
+
+    def _reloadConfig(self, files: List[str]) -> List[str]:
+        """
+        Reloads the changed configuration modules and rebuilds the configuration service.
+
+        Returns
+        -------
+        List[str]
+            The sections reloaded or removed.
+        """
+        config_bootstrapper : ConfigBootstrapper = self.make(ConfigBootstrapper)
+        sections = config_bootstrapper.reload(files)
+        if sections:
+            from orionis.luminate.services.config.config_service import ConfigService
+            self._config = dict(config_bootstrapper.get())
+            if self.container.bound(ConfigService):
+                self.container.replace(ConfigService)
+        return sections
+
+    def _reloadCommands(self, files: List[str]) -> Dict[str, List[str]]:
+        """
+        Reloads the changed command modules, binding the new classes and forgetting
+        the removed commands.
+
+        Returns
+        -------
+        Dict[str, List[str]]
+            The signatures of the commands 'loaded' and 'removed'.
+        """
+        commands_bootstrapper : CommandsBootstrapper = self.make(CommandsBootstrapper)
+        previous = commands_bootstrapper.get()
+        commands = commands_bootstrapper.reload(files)
+        self._commands = dict(commands_bootstrapper.get())
+
+        loaded_keys = set()
+        for signature in commands['loaded']:
+            concrete = self._commands[signature]['concrete']
+            key = f"{concrete.__module__}.{concrete.__name__}"
+            loaded_keys.add(key)
+            if self.container.bound(key):
+                self.container.replace(concrete)
+            else:
+                self.bind(concrete)
+            self.alias(alias=signature, concrete=key)
+
+        for signature in commands['removed']:
+            self.container.forget(signature)
+            key = f"{previous[signature]['module']}.{previous[signature]['class']}"
+            if key not in loaded_keys:
+                self.container.forget(key)
+        return commands
+
+    def _reloadTasks(self, files: List[str]) -> bool:
+        """
+        Reloads the task manager when its file changed.
+
+        Returns
+        -------
+        bool
+            Whether the task manager was reloaded.
+        """
+        tasks_manager = os.path.abspath(os.path.join('app', 'console', 'tasks_manager.py'))
+        if not os.path.exists(tasks_manager) or all(os.path.abspath(file) != tasks_manager for file in files):
+            return False
+        try:
+            ModuleReloader.load('app.console.tasks_manager')
+        except Exception as e:
+            raise BootstrapRuntimeError("Error reloading app.console.tasks_manager") from e
+        return True
+
     def _afterBootstrapProviders(self):
         """
         Loads services into the container that depend on the Bootstrap process being completed.
 
-        This method iterates over the list of service providers that need to be loaded after the
-        Bootstrap process. For each service provider, it creates an instance, registers it, and
-        then boots it.
+        The service providers that need to be loaded after the Bootstrap process are
+        registered, then booted following their `dependencies`, independent providers
+        being booted concurrently.
 
         Parameters
         ----------
@@ -337,10 +1072,7 @@ class Application(metaclass=SingletonMeta):
         -------
         None
         """
-        for service in self._after_boot_service_providers:
-            _environment_provider : ServiceProvider = service(app=self.container)
-            _environment_provider.register()
-            _environment_provider.boot()
+        self._loadProviders(self._after_boot_service_providers)
 
 @contextmanager
 def app_context():
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Optional
 
 @dataclass
 class App:
@@ -33,6 +33,10 @@ class App:
         The encryption key used for cryptographic operations.
     custom : dict
         A dictionary for storing additional custom properties. Defaults to an empty dictionary.
+    worker_max_jobs : int, optional
+        The number of jobs a worker process handles before it is replaced by a fresh fork.
+    worker_max_memory : int, optional
+        The resident memory, in megabytes, above which a worker process is replaced.
     """
 
     name: str
@@ -48,3 +52,7 @@ class App:
 
     # Holds additional custom properties, initialized as an empty dictionary
     custom: Dict[str, any] = field(default_factory=dict)
+
+    # Limits after which the prefork workers are replaced, unlimited by default
+    worker_max_jobs: Optional[int] = None
+    worker_max_memory: Optional[int] = None
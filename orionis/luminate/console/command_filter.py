@@ -3,6 +3,7 @@ from orionis.luminate.contracts.console.i_command_filter import ICommandFilter
 # List of commands to exclude from output formatting
 EXCLUDED_COMMANDS = [
     'schedule:work',   # Command to handle scheduled work
+    'daemon:start',    # Command to keep the application booted between commands
     'help',            # Command to show help information
     'version',         # Command to display version information
     'tests:run'        # Command to run tests
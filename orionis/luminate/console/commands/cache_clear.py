@@ -2,13 +2,16 @@ import os
 import shutil
 from orionis.luminate.console.base.command import BaseCommand
 from orionis.luminate.console.exceptions.cli_exception import CLIOrionisRuntimeError
+from orionis.luminate.foundation.discovery.static_discovery import StaticDiscovery
+from orionis.luminate.foundation.manifest.boot_manifest import BootManifest
 
 class CacheClearCommand(BaseCommand):
     """
-    Clears Python bytecode caches (__pycache__) within the project directory.
+    Clears Python bytecode caches (__pycache__) and the boot manifest within the project directory.
 
     This command recursively searches for and removes all `__pycache__` directories
-    in the project folder to ensure that no stale bytecode files persist.
+    in the project folder to ensure that no stale bytecode files persist, and removes
+    the boot manifest generated by the `optimize` command and the discovery cache.
 
     Attributes
     ----------
@@ -22,7 +25,7 @@ class CacheClearCommand(BaseCommand):
     signature = 'cache:clear'
 
     # A brief description of the command.
-    description = 'Clears the project cache by removing all __pycache__ directories.'
+    description = 'Clears the project cache by removing all __pycache__ directories and the boot manifest.'
 
     def handle(self) -> None:
         """
@@ -31,6 +34,7 @@ class CacheClearCommand(BaseCommand):
         This method performs the following actions:
         - Recursively searches the project directory for `__pycache__` directories.
         - Deletes all found `__pycache__` directories and their contents.
+        - Deletes the boot manifest and the discovery cache, if any.
         - Logs a success message if the process completes successfully, or an error message if an exception occurs.
         """
         try:
@@ -58,6 +62,13 @@ class CacheClearCommand(BaseCommand):
                     except OSError as e:
                         self.fail(f"Error removing {pycache_path}: {e}")
 
+            # Remove the boot manifest and the discovery cache, so the next boot parses the directories again
+            manifest = BootManifest()
+            manifest.clear()
+            discovery_cache = manifest.cachePath(StaticDiscovery.CACHE_FILE)
+            if os.path.exists(discovery_cache):
+                os.remove(discovery_cache)
+
             # Log a success message once all caches are cleared
             self.success(message='The application cache has been successfully cleared.')
 
@@ -0,0 +1,68 @@
+from orionis.luminate.application import app_context
+from orionis.luminate.console.base.command import BaseCommand
+from orionis.luminate.console.exceptions.cli_exception import CLIOrionisRuntimeError
+
+class ContainerGraphCommand(BaseCommand):
+    """
+    Command class to inspect the dependency graph of the services in the container.
+
+    This command lists every registered (and autowired) service with its lifetime,
+    depth and fan-out, then reports circular dependencies and singletons capturing
+    scoped services.
+    """
+
+    # Command signature used for execution.
+    signature = "container:graph"
+
+    # Brief description of the command.
+    description = "Displays the dependency graph of the container, its cycles and lifetime mismatches."
+
+    def handle(self) -> None:
+        """
+        Execute the container graph command.
+
+        Raises
+        ------
+        CLIOrionisRuntimeError
+            If an unexpected error occurs during execution.
+        """
+        try:
+
+            # Build the graph from the container IoC
+            with app_context() as app:
+                graph = app.container.graph()
+
+            # Display the services in construction order when possible
+            cycles = graph.findCycles()
+            nodes = graph.nodes() if cycles else graph.topologicalOrder()
+
+            rows = []
+            for node in nodes:
+                rows.append([
+                    node,
+                    graph.lifetimeOf(node) or '-',
+                    graph.depth(node),
+                    graph.fanOut(node),
+                    graph.fanIn(node)
+                ])
+
+            self.newLine()
+            self.textSuccessBold(" (Container) Dependency Graph: ")
+            self.table(["Service", "Lifetime", "Depth", "Fan-out", "Fan-in"], rows)
+            self.newLine()
+
+            # Report circular dependencies
+            for cycle in cycles:
+                self.error(f"Circular dependency: {' -> '.join(cycle)}")
+
+            # Report singletons capturing scoped services
+            for mismatch in graph.lifetimeMismatches():
+                self.warning(f"Singleton '{mismatch.consumer}' captures scoped '{mismatch.dependency}': {' -> '.join(mismatch.path)}")
+
+            if not cycles:
+                self.success(message=f"No circular dependencies found among {len(rows)} services.")
+
+        except Exception as e:
+
+            # Handle any unexpected error and display the error message
+            raise CLIOrionisRuntimeError(f"An unexpected error occurred: {e}") from e
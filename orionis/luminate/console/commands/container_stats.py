@@ -0,0 +1,79 @@
+from orionis.luminate.application import app_context
+from orionis.luminate.console.base.command import BaseCommand
+from orionis.luminate.console.exceptions.cli_exception import CLIOrionisRuntimeError
+
+class ContainerStatsCommand(BaseCommand):
+    """
+    Command class to display how the services of the container have been resolved.
+
+    The statistics are only collected when the container profiler is enabled, for
+    example by running the reactor with `ORIONIS_CONTAINER_PROFILE=1`. The time taken
+    by each singleton built at boot is also displayed when the warm-up is enabled.
+    """
+
+    # Command signature used for execution.
+    signature = "container:stats"
+
+    # Brief description of the command.
+    description = "Displays the resolution statistics of the container services (requires ORIONIS_CONTAINER_PROFILE=1)."
+
+    def handle(self) -> None:
+        """
+        Execute the container stats command.
+
+        This method retrieves the measurements recorded by the container profiler and
+        displays them in a table, slowest services first.
+
+        Raises
+        ------
+        CLIOrionisRuntimeError
+            If an unexpected error occurs during execution.
+        """
+        try:
+
+            # Fetch the measurements from the container IoC
+            with app_context() as app:
+                stats : dict = app.container.getResolutionStats()
+                warmup : dict = app.container.getWarmupTimes()
+
+            # Display the construction time of the singletons built at boot
+            if warmup:
+                self.newLine()
+                self.textSuccessBold(" (Container) Singleton Warm-up: ")
+                self.table(
+                    ["Service", "Time (ms)"],
+                    [[key, f"{seconds * 1e3:.3f}"] for key, seconds in sorted(warmup.items(), key=lambda item: item[1], reverse=True)]
+                )
+                self.newLine()
+
+            if not stats:
+                self.warning("No resolution statistics available, run the command with ORIONIS_CONTAINER_PROFILE=1 to enable the profiler.")
+                return
+
+            # Initialize an empty list to store the rows, slowest services first.
+            rows = []
+            for key, service in stats.items():
+                rows.append([
+                    key,
+                    service['lifetime'] or '-',
+                    service['resolutions'],
+                    service['hits'],
+                    f"{service['total_time'] * 1e3:.3f}",
+                    f"{service['p50'] * 1e3:.3f}",
+                    f"{service['p99'] * 1e3:.3f}",
+                    service['max_depth']
+                ])
+
+            # Display the statistics in a table format
+            self.newLine()
+            self.textSuccessBold(" (Container) Resolution Statistics: ")
+            self.table(
+                ["Service", "Lifetime", "Resolutions", "Hits", "Total (ms)", "p50 (ms)", "p99 (ms)", "Depth"],
+                rows
+            )
+            self.newLine()
+
+        except Exception as e:
+
+            # Handle any unexpected error and display the error message
+            raise CLIOrionisRuntimeError(f"An unexpected error occurred: {e}") from e
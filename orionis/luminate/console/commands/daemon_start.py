@@ -0,0 +1,77 @@
+from orionis.luminate.console.base.command import BaseCommand
+from orionis.luminate.console.daemon.reactor_daemon import ReactorDaemon
+from orionis.luminate.console.exceptions.cli_exception import CLIOrionisRuntimeError
+from orionis.luminate.services.commands.reactor_commands_service import ReactorCommandsService
+from orionis.luminate.services.config.config_service import ConfigService
+
+class DaemonStartCommand(BaseCommand):
+    """
+    Command class to keep the application booted between reactor commands.
+
+    The daemon listens on `bootstrap/cache/reactor.sock` (or the socket given by
+    `ORIONIS_REACTOR_SOCKET`), and the `reactor` scripts forwarding their command
+    line with `ReactorClient.forward()` run their commands in it, without starting
+    an interpreter or booting the application. The daemon restarts by itself when
+    the sources of the application change.
+
+    With `app.workers` greater than 1, the commands run concurrently in worker
+    processes forked from the booted daemon, replaced after `app.worker_max_jobs`
+    commands or above `app.worker_max_memory` megabytes when these are set.
+    """
+
+    # Command signature used for execution.
+    signature = "daemon:start"
+
+    # Brief description of the command.
+    description = "Starts a daemon keeping the application booted to run the reactor commands faster."
+
+    def __init__(self, reactor: ReactorCommandsService, config: ConfigService) -> None:
+        """
+        Initialize a new instance of the DaemonStartCommand class.
+
+        Parameters
+        ----------
+        reactor : ReactorCommandsService
+            The service running the commands received by the daemon.
+        config : ConfigService
+            The configuration giving the number of workers and their limits.
+        """
+        self.reactor = reactor
+        self.config = config
+
+    def handle(self) -> None:
+        """
+        Execute the daemon start command.
+
+        This method blocks until the daemon is stopped by `daemon:stop`, and replaces
+        the process with a new daemon when the sources change.
+
+        Raises
+        ------
+        CLIOrionisRuntimeError
+            If another daemon is running or an unexpected error occurs.
+        """
+        try:
+
+            workers = int(self.config.get('app.workers', 1) or 1)
+            max_jobs = self.config.get('app.worker_max_jobs')
+            max_memory = self.config.get('app.worker_max_memory')
+
+            daemon = ReactorDaemon(self.reactor)
+            self.info(f"Reactor daemon listening on {daemon.path()} with {workers} worker(s).")
+
+            reload = daemon.serve(
+                workers=workers,
+                max_jobs=int(max_jobs) if max_jobs else None,
+                max_memory=int(max_memory) * 1024 * 1024 if max_memory else None
+            )
+            if reload:
+                self.info("The sources have changed, reloading the reactor daemon.")
+                daemon.reload()
+
+            self.info("Reactor daemon stopped.")
+
+        except Exception as e:
+
+            # Handle any unexpected error and display the error message
+            raise CLIOrionisRuntimeError(f"An unexpected error occurred while running the reactor daemon: {e}") from e
@@ -0,0 +1,36 @@
+from orionis.luminate.console.base.command import BaseCommand
+from orionis.luminate.console.daemon.reactor_client import ReactorClient
+from orionis.luminate.console.exceptions.cli_exception import CLIOrionisRuntimeError
+
+class DaemonStopCommand(BaseCommand):
+    """
+    Command class to stop the reactor daemon started by `daemon:start`.
+    """
+
+    # Command signature used for execution.
+    signature = "daemon:stop"
+
+    # Brief description of the command.
+    description = "Stops the reactor daemon once the command it is running completes."
+
+    def handle(self) -> None:
+        """
+        Execute the daemon stop command.
+
+        Raises
+        ------
+        CLIOrionisRuntimeError
+            If an unexpected error occurs during execution.
+        """
+        try:
+
+            client = ReactorClient()
+            if client.send({'control': 'stop'}) is None:
+                self.warning(f"No reactor daemon is listening on {ReactorClient.socketPath()}.")
+            else:
+                self.success("The reactor daemon has been stopped.")
+
+        except Exception as e:
+
+            # Handle any unexpected error and display the error message
+            raise CLIOrionisRuntimeError(f"An unexpected error occurred while stopping the reactor daemon: {e}") from e
@@ -0,0 +1,64 @@
+from orionis.luminate.application import app_context
+from orionis.luminate.console.base.command import BaseCommand
+from orionis.luminate.console.exceptions.cli_exception import CLIOrionisRuntimeError
+from orionis.luminate.foundation.config.config_bootstrapper import ConfigBootstrapper
+from orionis.luminate.foundation.console.command_bootstrapper import CommandsBootstrapper
+from orionis.luminate.foundation.manifest.boot_manifest import BootManifest
+from orionis.luminate.foundation.providers.service_providers_bootstrapper import ServiceProvidersBootstrapper
+
+class OptimizeCommand(BaseCommand):
+    """
+    Command class to cache the commands, service providers and configuration modules.
+
+    The directories are scanned again and the result is stored in the boot manifest,
+    which the next boots load instead of repeating the discovery, until any of the
+    scanned files changes. The manifest is removed by `cache:clear`.
+    """
+
+    # Command signature used for execution.
+    signature = "optimize"
+
+    # Brief description of the command.
+    description = "Caches the discovered commands, service providers and configuration modules to speed up the boot."
+
+    def handle(self) -> None:
+        """
+        Execute the optimize command.
+
+        This method discards the current manifest, runs the discovery of every
+        bootstrapper and writes its result to `bootstrap/cache/manifest.json`.
+
+        Raises
+        ------
+        CLIOrionisRuntimeError
+            If an unexpected error occurs during execution.
+        """
+        try:
+
+            # Discard the current manifest, so the bootstrappers scan their directories
+            manifest = BootManifest()
+            manifest.clear()
+
+            with app_context() as app:
+                sections = {
+                    'commands': CommandsBootstrapper(manifest).describe(),
+                    'providers': ServiceProvidersBootstrapper(app.container, manifest).describe(),
+                    'config': ConfigBootstrapper(manifest).describe()
+                }
+
+            path = manifest.write(sections)
+
+            # Display what has been cached
+            self.newLine()
+            self.textSuccessBold(" (Boot) Manifest: ")
+            self.table(
+                ["Section", "Entries", "Files"],
+                [[name, len(section['entries']), len(section['files'])] for name, section in sections.items()]
+            )
+            self.newLine()
+            self.success(message=f"The boot manifest has been written to {path}.")
+
+        except Exception as e:
+
+            # Handle any unexpected error and display the error message
+            raise CLIOrionisRuntimeError(f"An unexpected error occurred while optimizing the application: {e}") from e
@@ -1,7 +1,9 @@
 import importlib
+from orionis.luminate.application import Application
 from orionis.luminate.console.base.command import BaseCommand
 from orionis.luminate.console.exceptions.cli_exception import CLIOrionisRuntimeError
 from orionis.luminate.contracts.console.i_task_manager import ITaskManager
+from orionis.luminate.facades.app_facade import app
 from orionis.luminate.facades.commands.scheduler_facade import Schedule
 
 
@@ -33,7 +35,10 @@ class ScheduleWorkCommand(BaseCommand):
         Execute the scheduled tasks.
 
         This method initializes a Schedule instance, creates a TaskManager (Kernel),
-        registers the schedule, and starts the execution of scheduled tasks.
+        registers the schedule through the container (so `schedule()` may also receive
+        services), and starts the execution of scheduled tasks. When the application
+        reloads a changed task manager, the jobs are replaced by those it schedules,
+        without stopping the worker.
 
         Raises
         ------
@@ -43,11 +48,9 @@ class ScheduleWorkCommand(BaseCommand):
         """
         try:
 
-            # Create an instance of the TaskManager to manage the scheduling.
-            tasks_manager = importlib.import_module("app.console.tasks_manager")
-            TaskManager = getattr(tasks_manager, "TaskManager")
-            kernel: ITaskManager = TaskManager()
-            kernel.schedule(self.schedule)
+            # Register the tasks defined by the TaskManager.
+            self._schedule()
+            Application.getCurrentInstance().onReload(self._reschedule)
 
             # Start running the scheduled tasks using the schedule runner.
             self.schedule.start()
@@ -55,4 +58,25 @@ class ScheduleWorkCommand(BaseCommand):
         except Exception as e:
 
             # Handle any unexpected error and display the error message
-            raise CLIOrionisRuntimeError(f"An unexpected error occurred: {e}") from e
\ No newline at end of file
+            raise CLIOrionisRuntimeError(f"An unexpected error occurred: {e}") from e
+
+    def _schedule(self) -> None:
+        """
+        Create an instance of the TaskManager and let it define the scheduled tasks.
+        """
+        tasks_manager = importlib.import_module("app.console.tasks_manager")
+        TaskManager = getattr(tasks_manager, "TaskManager")
+        kernel: ITaskManager = TaskManager()
+        app().call(kernel.schedule, {'schedule': self.schedule})
+
+    def _reschedule(self, changes: dict) -> None:
+        """
+        Replace the scheduled tasks once the task manager was reloaded.
+
+        Parameters
+        ----------
+        changes : dict
+            The summary of the reload, as returned by `Application.reload()`.
+        """
+        if changes['tasks']:
+            self.schedule.reschedule(self._schedule)
@@ -0,0 +1,208 @@
+import json
+import os
+import socket
+import struct
+import sys
+from typing import BinaryIO, Dict, List, Optional, TextIO, Tuple
+
+class ReactorClient:
+    """
+    Forwards a reactor command to a running reactor daemon.
+
+    The client sends the command line, the environment and the working directory
+    of the current process to the daemon listening on a Unix socket, then writes
+    the output streamed back to its own stdout and stderr. It only relies on the
+    standard library, so a `reactor` script calling `ReactorClient.forward()` before
+    importing the application does not pay for the framework imports when a daemon
+    is running:
+
+        import sys
+        from orionis.luminate.console.daemon.reactor_client import ReactorClient
+
+        code = ReactorClient.forward(sys.argv)
+        if code is not None:
+            sys.exit(code)
+
+        # No daemon is running, boot the application and run the command here
+
+    Messages are framed as a one byte kind followed by the length of the payload as
+    a 4 bytes big-endian integer and the payload itself.
+
+    Parameters
+    ----------
+    path : str, optional
+        The location of the daemon socket, `bootstrap/cache/reactor.sock` under the
+        working directory by default, or the `ORIONIS_REACTOR_SOCKET` variable.
+    """
+
+    # Location of the socket, relative to the root of the application
+    DEFAULT_SOCKET = os.path.join('bootstrap', 'cache', 'reactor.sock')
+
+    # Kinds of the frames exchanged with the daemon
+    REQUEST = b'q'
+    STDOUT = b'o'
+    STDERR = b'e'
+    EXIT = b'x'
+    REJECT = b'r'
+
+    # Commands managing the daemon itself, which always run in the calling process
+    CONTROL_PREFIX = 'daemon:'
+
+    # Flag tracing the boot of the application, which a daemon has already booted
+    PROFILE_BOOT_FLAG = '--profile-boot'
+
+    _HEADER = struct.Struct('>cI')
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self._path = path or self.socketPath()
+
+    @classmethod
+    def socketPath(cls) -> str:
+        """
+        Retrieve the default location of the daemon socket.
+
+        Returns
+        -------
+        str
+            The value of `ORIONIS_REACTOR_SOCKET`, or `bootstrap/cache/reactor.sock`.
+        """
+        return os.environ.get('ORIONIS_REACTOR_SOCKET') or cls.DEFAULT_SOCKET
+
+    @classmethod
+    def forward(cls, argv: List[str]) -> Optional[int]:
+        """
+        Run a command line through the daemon, if one is running.
+
+        A command line with the `--profile-boot` flag always runs in the current
+        process, with ORIONIS_PROFILE_BOOT set so the application traces its boot.
+        The reactor then ignores the flag when it parses the command.
+
+        Parameters
+        ----------
+        argv : List[str]
+            The command line, the program name followed by the signature and the
+            arguments of the command.
+
+        Returns
+        -------
+        Optional[int]
+            The exit status of the command, or None if no daemon accepted it and the
+            command must run in the current process.
+        """
+        if len(argv) > 1 and argv[1].startswith(cls.CONTROL_PREFIX):
+            return None
+        if cls.PROFILE_BOOT_FLAG in argv:
+            os.environ.setdefault('ORIONIS_PROFILE_BOOT', '1')
+            return None
+        return cls().send({'argv': list(argv), 'env': dict(os.environ), 'cwd': os.getcwd()})
+
+    def connect(self) -> Optional[socket.socket]:
+        """
+        Open a connection to the daemon.
+
+        Returns
+        -------
+        Optional[socket.socket]
+            The connected socket, or None if no daemon listens on the socket.
+        """
+        if not os.path.exists(self._path):
+            return None
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            connection.connect(self._path)
+        except OSError:
+            connection.close()
+            return None
+        return connection
+
+    def send(self, request: Dict[str, object], stdout: Optional[TextIO] = None, stderr: Optional[TextIO] = None) -> Optional[int]:
+        """
+        Send a request to the daemon and relay its output.
+
+        Parameters
+        ----------
+        request : Dict[str, object]
+            The request, with the 'argv', 'env' and 'cwd' of the command, or the
+            'control' action to perform.
+        stdout : TextIO, optional
+            The stream receiving the standard output of the command, sys.stdout by default.
+        stderr : TextIO, optional
+            The stream receiving the error output of the command, sys.stderr by default.
+
+        Returns
+        -------
+        Optional[int]
+            The exit status sent by the daemon, or None if it is not running.
+        """
+        connection = self.connect()
+        if connection is None:
+            return None
+
+        with connection:
+            try:
+                self.writeFrame(connection, self.REQUEST, json.dumps(request).encode('utf-8'))
+            except OSError:
+                # The daemon is shutting down, nothing has been run
+                return None
+
+            stream = connection.makefile('rb')
+            streams = {self.STDOUT: stdout or sys.stdout, self.STDERR: stderr or sys.stderr}
+            while True:
+                frame = self.readFrame(stream)
+                if frame is None:
+                    streams[self.STDERR].write("The reactor daemon closed the connection before the command completed.\n")
+                    return 1
+                kind, payload = frame
+                if kind == self.REJECT:
+                    # The daemon is reloading, nothing has been run
+                    return None
+                if kind == self.EXIT:
+                    return int(payload)
+                output = streams.get(kind)
+                if output is not None:
+                    try:
+                        output.write(payload.decode('utf-8', errors='replace'))
+                        output.flush()
+                    except BrokenPipeError:
+                        # The reader of the output went away, the command still runs to completion
+                        streams[kind] = None
+
+    @classmethod
+    def writeFrame(cls, connection: socket.socket, kind: bytes, payload: bytes) -> None:
+        """
+        Send a frame over a connection.
+
+        Parameters
+        ----------
+        connection : socket.socket
+            The connection to write to.
+        kind : bytes
+            The kind of the frame, a single byte.
+        payload : bytes
+            The content of the frame.
+        """
+        connection.sendall(cls._HEADER.pack(kind, len(payload)) + payload)
+
+    @classmethod
+    def readFrame(cls, stream: BinaryIO) -> Optional[Tuple[bytes, bytes]]:
+        """
+        Receive a frame from a connection.
+
+        Parameters
+        ----------
+        stream : BinaryIO
+            The buffered reader of the connection.
+
+        Returns
+        -------
+        Optional[Tuple[bytes, bytes]]
+            The kind and the payload of the frame, or None if the connection closed.
+        """
+        header = stream.read(cls._HEADER.size)
+        if len(header) < cls._HEADER.size:
+            return None
+        kind, length = cls._HEADER.unpack(header)
+        payload = stream.read(length)
+        if len(payload) < length:
+            return None
+        return kind, payload
@@ -0,0 +1,370 @@
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Any, Dict, Optional
+from orionis.luminate.console.daemon.reactor_client import ReactorClient
+from orionis.luminate.container.container import Container
+from orionis.luminate.foundation.prefork.prefork_supervisor import PreforkSupervisor, PreforkWorker
+from orionis.luminate.contracts.services.commands.i_reactor_commands_service import IReactorCommandsService
+
+class ReactorDaemon:
+    """
+    Keeps a booted application listening for reactor commands on a Unix socket.
+
+    Commands sent by a `ReactorClient` run in the daemon process with the command
+    line, environment and working directory of the client, inside their own
+    container scope, and their stdout and stderr are streamed back to the client
+    with the exit status. Each process runs one command at a time, since commands
+    share its standard streams and environment; commands run concurrently when
+    the daemon forks several workers (see `serve()`).
+
+    The daemon polls the modification times of the Python sources and the `.env`
+    file of the application. Once any of them changes, it declines new commands
+    (the clients then run them in their own process), stops listening and
+    `reload()` replaces the process with a freshly booted one.
+
+    Parameters
+    ----------
+    reactor : IReactorCommandsService
+        The service running the commands.
+    path : str, optional
+        The location of the socket, as given by `ReactorClient.socketPath()` by default.
+    root : str, optional
+        The directory whose sources are watched, the working directory by default.
+    reload_interval : float, optional
+        The number of seconds between two checks of the sources.
+    """
+
+    # Number of seconds between two checks of the sources
+    RELOAD_INTERVAL = 1.0
+
+    # Directories never containing sources of the application
+    IGNORED_DIRECTORIES = {'__pycache__', 'bootstrap', 'storage', 'node_modules', 'venv'}
+
+    def __init__(
+        self,
+        reactor: IReactorCommandsService,
+        path: Optional[str] = None,
+        root: Optional[str] = None,
+        reload_interval: Optional[float] = None
+    ) -> None:
+        self._reactor = reactor
+        self._path = path or ReactorClient.socketPath()
+        self._root = os.path.abspath(root or os.getcwd())
+        self._interval = self.RELOAD_INTERVAL if reload_interval is None else reload_interval
+        self._stopping = threading.Event()
+        self._changed = threading.Event()
+        self._listener: Optional[socket.socket] = None
+        self._worker: Optional[PreforkWorker] = None
+
+    def path(self) -> str:
+        """
+        Retrieve the location of the socket.
+
+        Returns
+        -------
+        str
+            The path of the socket, as given to the clients.
+        """
+        return self._path
+
+    def isRunning(self) -> bool:
+        """
+        Check whether a daemon already listens on the socket.
+
+        Returns
+        -------
+        bool
+            True if a connection to the socket is accepted.
+        """
+        connection = ReactorClient(self._path).connect()
+        if connection is None:
+            return False
+        connection.close()
+        return True
+
+    def serve(self, workers: int = 1, max_jobs: Optional[int] = None, max_memory: Optional[int] = None) -> bool:
+        """
+        Accept commands until the daemon is stopped or the sources change.
+
+        With several workers, or any worker limit, the commands are accepted by
+        worker processes forked from the booted daemon by a `PreforkSupervisor`,
+        each running one command at a time, and the daemon only supervises them
+        and watches the sources.
+
+        Parameters
+        ----------
+        workers : int, optional
+            The number of worker processes accepting commands.
+        max_jobs : int, optional
+            The number of commands after which a worker is replaced.
+        max_memory : int, optional
+            The resident memory, in bytes, above which a worker is replaced.
+
+        Returns
+        -------
+        bool
+            True if the daemon stopped because the sources changed and should be
+            reloaded, False if it was asked to stop.
+
+        Raises
+        ------
+        RuntimeError
+            If another daemon already listens on the socket.
+        """
+        self._bind()
+        try:
+            if workers > 1 or max_jobs is not None or max_memory is not None:
+                self._supervise(PreforkSupervisor(self._work, workers, max_jobs, max_memory))
+            else:
+                watcher = threading.Thread(target=self._watch, name='reactor-daemon-watcher', daemon=True)
+                watcher.start()
+                self._work()
+        finally:
+            self._stopping.set()
+            self._close()
+        return self._changed.is_set()
+
+    def _supervise(self, supervisor: PreforkSupervisor) -> None:
+        """
+        Keep the workers running until the daemon is stopped or the sources change.
+
+        The sources are checked between two supervision rounds rather than by a
+        thread, so the workers are never forked from a multi-threaded process.
+
+        Parameters
+        ----------
+        supervisor : PreforkSupervisor
+            The supervisor of the worker processes.
+        """
+        # A worker receiving a stop request signals the daemon
+        previous = signal.signal(signal.SIGTERM, lambda *_: self.stop())
+        try:
+            initial = self.fingerprint()
+            supervisor.start()
+            while not self._stopping.is_set():
+                supervisor.supervise(self._interval)
+                if self.fingerprint() != initial:
+                    self._changed.set()
+                    break
+        finally:
+            supervisor.stop()
+            signal.signal(signal.SIGTERM, previous)
+
+    def _work(self, worker: Optional[PreforkWorker] = None) -> None:
+        """
+        Accept and serve commands one at a time.
+
+        Parameters
+        ----------
+        worker : PreforkWorker, optional
+            The worker process running the loop, if the daemon forked workers.
+        """
+        self._worker = worker
+        while not self._stopping.is_set() and not self._changed.is_set():
+            if worker is not None and worker.shouldStop():
+                return
+            try:
+                connection, _ = self._listener.accept()
+            except socket.timeout:
+                continue
+            connection.settimeout(None)
+            with connection:
+                self._handle(connection)
+            if worker is not None:
+                worker.jobDone()
+
+    def stop(self) -> None:
+        """
+        Stop accepting commands, the command being run is completed first.
+        """
+        self._stopping.set()
+
+    def reload(self) -> None:
+        """
+        Replace the current process with a new daemon, booting the application again.
+        """
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execv(sys.executable, [sys.executable] + sys.argv)
+
+    def fingerprint(self) -> int:
+        """
+        Compute a value changing whenever a watched source is added, removed or modified.
+
+        Returns
+        -------
+        int
+            The hash of the path, modification time and size of every watched file.
+        """
+        entries = []
+        for directory, directories, files in os.walk(self._root):
+            directories[:] = sorted(
+                name for name in directories
+                if name not in self.IGNORED_DIRECTORIES and not name.startswith('.')
+            )
+            for name in sorted(files):
+                if not name.endswith('.py') and name != '.env':
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, stat.st_mtime_ns, stat.st_size))
+        return hash(tuple(entries))
+
+    def _watch(self) -> None:
+        """
+        Flag the sources as changed once their fingerprint differs from the initial one.
+        """
+        initial = self.fingerprint()
+        while not self._stopping.wait(self._interval):
+            if self.fingerprint() != initial:
+                self._changed.set()
+                return
+
+    def _bind(self) -> None:
+        """
+        Listen on the socket, replacing the socket file left by a daemon that died.
+        """
+        if self.isRunning():
+            raise RuntimeError(f"A reactor daemon is already listening on {self._path}.")
+        if os.path.exists(self._path):
+            os.remove(self._path)
+        os.makedirs(os.path.dirname(os.path.abspath(self._path)), exist_ok=True)
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        # Only the owner of the application may run commands through the socket
+        umask = os.umask(0o177)
+        try:
+            listener.bind(self._path)
+        finally:
+            os.umask(umask)
+
+        listener.listen(128)
+        listener.settimeout(min(self._interval, 0.5))
+        self._listener = listener
+
+    def _close(self) -> None:
+        """
+        Stop listening and remove the socket file.
+        """
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass
+
+    def _handle(self, connection: socket.socket) -> None:
+        """
+        Serve a single request.
+
+        Parameters
+        ----------
+        connection : socket.socket
+            The connection of the client.
+        """
+        frame = ReactorClient.readFrame(connection.makefile('rb'))
+        if frame is None or frame[0] != ReactorClient.REQUEST:
+            return
+
+        try:
+            request = json.loads(frame[1])
+            if request.get('control') == 'stop':
+                if self._worker is not None:
+                    os.kill(os.getppid(), signal.SIGTERM)
+                self.stop()
+                code = 0
+            elif self._changed.is_set():
+                ReactorClient.writeFrame(connection, ReactorClient.REJECT, b'')
+                return
+            else:
+                code = self._dispatch(request, connection)
+            ReactorClient.writeFrame(connection, ReactorClient.EXIT, str(code).encode('ascii'))
+        except OSError:
+            # The client went away, there is nobody left to report to
+            pass
+
+    def _dispatch(self, request: Dict[str, Any], connection: socket.socket) -> int:
+        """
+        Run a command in the context of the client.
+
+        The environment, working directory and command line of the process are
+        replaced by those of the client while the command runs, then restored.
+
+        Parameters
+        ----------
+        request : Dict[str, Any]
+            The 'argv', 'env' and 'cwd' of the client.
+        connection : socket.socket
+            The connection the output of the command is streamed to.
+
+        Returns
+        -------
+        int
+            The exit status of the command.
+        """
+        environ = dict(os.environ)
+        cwd = os.getcwd()
+        argv = sys.argv
+        stdout = _FrameWriter(connection, ReactorClient.STDOUT)
+        stderr = _FrameWriter(connection, ReactorClient.STDERR)
+
+        try:
+            os.environ.clear()
+            os.environ.update(request.get('env', {}))
+            os.chdir(request.get('cwd', cwd))
+            sys.argv = list(request['argv'])
+
+            with redirect_stdout(stdout), redirect_stderr(stderr), Container().scope():
+                try:
+                    return self._reactor.run(sys.argv)
+                except SystemExit as e:
+                    if e.code is None or isinstance(e.code, int):
+                        return e.code or 0
+                    print(e.code, file=sys.stderr)
+                    return 1
+                except Exception:
+                    traceback.print_exc()
+                    return 1
+        finally:
+            sys.argv = argv
+            os.chdir(cwd)
+            os.environ.clear()
+            os.environ.update(environ)
+
+class _FrameWriter(io.TextIOBase):
+    """
+    A text stream sending everything written to it as frames of a given kind.
+    """
+
+    def __init__(self, connection: socket.socket, kind: bytes) -> None:
+        self._connection = connection
+        self._kind = kind
+        self._closed_by_peer = False
+
+    @property
+    def encoding(self) -> str:
+        return 'utf-8'
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text and not self._closed_by_peer:
+            try:
+                ReactorClient.writeFrame(self._connection, self._kind, text.encode('utf-8'))
+            except OSError:
+                # The command goes on even if the client stopped listening
+                self._closed_by_peer = True
+        return len(text)
@@ -1,9 +1,21 @@
 import inspect
-from collections import deque
-from threading import Lock
-from typing import Callable, Any, Dict, get_args, get_origin
+import time
+import types
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock, RLock
+from types import MappingProxyType
+from weakref import WeakSet
+from typing import Annotated, Callable, Any, ContextManager, Dict, Iterator, List, Optional, Union, get_args, get_origin
 from orionis.luminate.contracts.container.i_container import IContainer
+from orionis.luminate.container.dependency_graph import AUTOWIRED, DEFERRED, DependencyEdge, DependencyGraph
 from orionis.luminate.container.exception import OrionisContainerException, OrionisContainerValueError, OrionisContainerTypeError
+from orionis.luminate.container.factory_compiler import FactoryCompiler
+from orionis.luminate.container.introspection import ServiceIntrospector
+from orionis.luminate.container.lazy import LazyMarker, LazyProxy
+from orionis.luminate.container.object_pool import ObjectPool
+from orionis.luminate.container.profiler import ContainerProfiler
+from orionis.luminate.container.resolution_plan import AUTOWIRE, SERVICE, UNRESOLVED, InvocationPlan, PlannedParameter, ResolutionPlan
 from orionis.luminate.container.types import Types
 
 BINDING = 'binding'
@@ -11,13 +23,37 @@ TRANSIENT = 'transient'
 SINGLETON = 'singleton'
 SCOPED = 'scoped'
 INSTANCE = 'instance'
+POOLED = 'pooled'
+
+# Scoped instances of the unit of work (command, job or request) running in the current context
+_active_scope: ContextVar[Optional[Dict[str, Any]]] = ContextVar('orionis_container_scope', default=None)
+
+# Result of a pending asynchronous construction whose task was cancelled, so a waiter builds the instance
+_RETRY_CONSTRUCTION = object()
 
 class Container(IContainer):
     """
     Service container and dependency injection manager.
 
     This class follows the singleton pattern to manage service bindings, instances,
-    and different lifecycle types such as transient, singleton, and scoped.
+    and different lifecycle types such as transient, singleton, scoped and pooled.
+
+    Every service is stored in a single index that maps its key to a descriptor
+    holding the concrete (or instance) and its lifetime type, so lookups are a
+    single dictionary access regardless of the lifetime.
+
+    Singleton and scoped services are constructed under a per-key lock with a
+    double check, so concurrent threads build each instance only once while
+    already built singletons are returned without locking.
+
+    Scoped services are cached per `scope()`, which is backed by a context variable
+    so that concurrent threads and asyncio tasks each get their own instances.
+
+    Once bindings are final, `freeze()` makes the registry read-only and replaces
+    resolution with generated factory functions.
+
+    `child()` creates a container that resolves through this one and only holds its
+    own overrides, for cheap per-tenant or per-test isolation.
     """
 
     _instance = None
@@ -36,16 +72,79 @@ class Container(IContainer):
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
-                    cls._instance._bindings = {}
-                    cls._instance._transients = {}
-                    cls._instance._singletons = {}
-                    cls._instance._scoped_services = {}
-                    cls._instance._instances = {}
-                    cls._instance._aliases = {}
-                    cls._instance._scoped_instances = {}
-                    cls._instance._validate_types = Types()
+                    cls._instance._initialize(None)
         return cls._instance
 
+    def _initialize(self, parent: Optional['Container']) -> None:
+        """
+        Create the registries of a root or child container.
+
+        Every registry starts empty, so the cost does not depend on the size of the
+        parent; the reflection caches of the parent are shared by its children.
+
+        Parameters
+        ----------
+        parent : Container, optional
+            The container a child resolves through, None for the root container.
+        """
+        self._parent = parent
+        self._children = WeakSet()
+        self._services = {}
+        self._aliases = {}
+        self._scoped_instances = {}
+        self._scope_namespace = None if parent is None else object()
+        self._resolution_plans = {}
+        self._invocation_plans = {}
+        self._construction_locks = {}
+        self._construction_contentions = {}
+        self._construction_guard = Lock()
+        self._pending_constructions = {}
+        self._factories = None
+        self._deferred = {}
+        self._deferred_guard = RLock()
+        self._profiler = None
+        self._warmup_times = {}
+        if parent is None:
+            self._factory_compiler = FactoryCompiler()
+            self._introspector = ServiceIntrospector()
+            self._validate_types = Types()
+        else:
+            self._factory_compiler = parent._factory_compiler
+            self._introspector = parent._introspector
+            self._validate_types = parent._validate_types
+
+    def child(self) -> 'Container':
+        """
+        Create a child container that resolves through this one.
+
+        The child starts without registrations and looks up every service it does not
+        override in its parent, so creating it costs the same regardless of how many
+        services the parent holds. Services registered in the child override those of
+        the parent for the child only: transient and scoped services of the parent
+        are built with the overrides of the child, while singletons and instances of
+        the parent are shared and keep the dependencies of the parent.
+
+        Returns
+        -------
+        Container
+            The new child container.
+        """
+        child = object.__new__(Container)
+        child._initialize(self)
+        self._children.add(child)
+        return child
+
+    def parent(self) -> Optional['Container']:
+        """
+        Retrieve the container a child resolves through.
+
+        Returns
+        -------
+        Container, optional
+            The parent container, or None for the root container.
+        """
+        return self._parent
+
     def _ensureNotMain(self, concrete: Callable[..., Any]) -> str:
         """
         Ensure that a class is not defined in the main script.
@@ -82,7 +181,7 @@ class Container(IContainer):
         OrionisContainerValueError
             If the service is already registered.
         """
-        if self.has(obj):
+        if self._hasLocal(obj):
             raise OrionisContainerValueError(f"The service ({str(obj)}) is already registered in the container.")
 
     def _ensureIsCallable(self, concrete: Callable[..., Any]) -> None:
@@ -119,13 +218,63 @@ class Container(IContainer):
         if not isinstance(instance, object) or instance.__class__.__module__ in ['builtins', 'abc']:
             raise OrionisContainerValueError(f"The instance '{str(instance)}' must be a valid object.")
 
+    def _ensureNotFrozen(self) -> None:
+        """
+        Ensure that the container still accepts registrations.
+
+        Raises
+        ------
+        OrionisContainerException
+            If the container has been frozen.
+        """
+        if self._factories is not None:
+            raise OrionisContainerException("The container is frozen, no services can be registered after calling freeze().")
+
     def forgetScopedInstances(self) -> None:
         """
         Reset scoped instances at the beginning of a new request.
+
+        Inside an active `scope()`, only the instances of that scope are discarded.
         """
-        self._scoped_instances = {}
+        active_scope = _active_scope.get()
+        if active_scope is not None:
+            active_scope.clear()
+        else:
+            self._scoped_instances = {}
+
+    @contextmanager
+    def scope(self) -> Iterator['Container']:
+        """
+        Open an isolated scope for scoped services.
 
-    def bind(self, concrete: Callable[..., Any]) -> str:
+        Scoped services resolved inside the block are cached for the current thread or
+        asyncio task only, and the whole cache is dropped when the block exits. Outside
+        any scope, scoped services share the container-wide cache.
+
+        Yields
+        ------
+        Container
+            The container itself.
+        """
+        token = _active_scope.set({})
+        try:
+            yield self
+        finally:
+            _active_scope.reset(token)
+
+    def _forgetResolutionPlans(self) -> None:
+        """
+        Discard every compiled resolution plan.
+
+        Plans decide at compile time whether a dependency is resolved through the
+        container or autowired, so they must be rebuilt whenever bindings change.
+        """
+        self._resolution_plans.clear()
+        self._invocation_plans.clear()
+        for child in list(self._children):
+            child._forgetResolutionPlans()
+
+    def bind(self, concrete: Callable[..., Any], lazy: bool = False) -> str:
         """
         Bind a callable to the container.
         This method ensures that the provided callable is not the main function,
@@ -134,47 +283,55 @@ class Container(IContainer):
         the callable in the container's bindings.
         Args:
             concrete (Callable[..., Any]): The callable to be bound to the container.
+            lazy (bool): Whether dependents receive a proxy that builds the service on first use.
         Returns:
             str: The unique key generated for the callable.
         """
+        self._ensureNotFrozen()
         self._ensureNotMain(concrete)
         self._ensureUniqueService(concrete)
         self._ensureIsCallable(concrete)
 
-        key = f"{concrete.__module__}.{concrete.__name__}"
-        self._bindings[key] = {
+        key = self._introspector.key(concrete)
+        self._forgetResolutionPlans()
+        self._services[key] = {
             'concrete': concrete,
             'module': concrete.__module__,
             'name': concrete.__name__,
-            'type': BINDING
+            'type': BINDING,
+            'lazy': lazy
         }
 
         return key
 
-    def transient(self, concrete: Callable[..., Any]) -> str:
+    def transient(self, concrete: Callable[..., Any], lazy: bool = False) -> str:
         """
         Registers a transient service in the container.
         A transient service is created each time it is requested.
         Args:
             concrete (Callable[..., Any]): The callable that defines the service.
+            lazy (bool): Whether dependents receive a proxy that builds the service on first use.
         Returns:
             str: The unique key generated for the callable.
         """
+        self._ensureNotFrozen()
         self._ensureNotMain(concrete)
         self._ensureUniqueService(concrete)
         self._ensureIsCallable(concrete)
 
-        key = f"{concrete.__module__}.{concrete.__name__}"
-        self._transients[key] = {
+        key = self._introspector.key(concrete)
+        self._forgetResolutionPlans()
+        self._services[key] = {
             'concrete': concrete,
             'module': concrete.__module__,
             'name': concrete.__name__,
-            'type': TRANSIENT
+            'type': TRANSIENT,
+            'lazy': lazy
         }
 
         return key
 
-    def singleton(self, concrete: Callable[..., Any]) -> str:
+    def singleton(self, concrete: Callable[..., Any], lazy: bool = False) -> str:
         """
         Registers a callable as a singleton in the container.
         This method ensures that the provided callable is not the main module,
@@ -182,24 +339,28 @@ class Container(IContainer):
         the callable as a singleton, storing it in the container's singleton registry.
         Args:
             concrete (Callable[..., Any]): The callable to be registered as a singleton.
+            lazy (bool): Whether dependents receive a proxy that builds the service on first use.
         Returns:
             str: The key under which the singleton is registered in the container.
         """
+        self._ensureNotFrozen()
         self._ensureNotMain(concrete)
         self._ensureUniqueService(concrete)
         self._ensureIsCallable(concrete)
 
-        key = f"{concrete.__module__}.{concrete.__name__}"
-        self._singletons[key] = {
+        key = self._introspector.key(concrete)
+        self._forgetResolutionPlans()
+        self._services[key] = {
             'concrete': concrete,
             'module': concrete.__module__,
             'name': concrete.__name__,
-            'type': SINGLETON
+            'type': SINGLETON,
+            'lazy': lazy
         }
 
         return key
 
-    def scoped(self, concrete: Callable[..., Any]) -> str:
+    def scoped(self, concrete: Callable[..., Any], lazy: bool = False) -> str:
         """
         Registers a callable as a scoped service.
         This method ensures that the provided callable is not the main service,
@@ -207,19 +368,62 @@ class Container(IContainer):
         scoped services dictionary with relevant metadata.
         Args:
             concrete (Callable[..., Any]): The callable to be registered as a scoped service.
+            lazy (bool): Whether dependents receive a proxy that builds the service on first use.
         Returns:
             str: The key under which the callable is registered in the scoped services dictionary.
         """
+        self._ensureNotFrozen()
+        self._ensureNotMain(concrete)
+        self._ensureUniqueService(concrete)
+        self._ensureIsCallable(concrete)
+
+        key = self._introspector.key(concrete)
+        self._forgetResolutionPlans()
+        self._services[key] = {
+            'concrete': concrete,
+            'module': concrete.__module__,
+            'name': concrete.__name__,
+            'type': SCOPED,
+            'lazy': lazy
+        }
+
+        return key
+
+    def pooled(
+        self,
+        concrete: Callable[..., Any],
+        max_size: int = 10,
+        block: bool = True,
+        timeout: Optional[float] = None,
+        reset: Optional[Callable[[Any], None]] = None
+    ) -> str:
+        """
+        Registers a callable as a pooled service.
+        Instances are built on demand up to `max_size`, checked out with `borrow()`
+        and returned to the pool on exit, so expensive services that are not
+        thread-safe can be reused without being shared.
+        Args:
+            concrete (Callable[..., Any]): The callable that defines the service.
+            max_size (int): The maximum number of instances alive at the same time.
+            block (bool): Whether borrowing waits for a release when the pool is exhausted, or fails.
+            timeout (Optional[float]): The maximum number of seconds to wait when blocking.
+            reset (Optional[Callable[[Any], None]]): A hook clearing the state of an instance when it is returned.
+        Returns:
+            str: The key under which the pooled service is registered in the container.
+        """
+        self._ensureNotFrozen()
         self._ensureNotMain(concrete)
         self._ensureUniqueService(concrete)
         self._ensureIsCallable(concrete)
 
-        key = f"{concrete.__module__}.{concrete.__name__}"
-        self._scoped_services[key] = {
+        key = self._introspector.key(concrete)
+        self._forgetResolutionPlans()
+        self._services[key] = {
             'concrete': concrete,
             'module': concrete.__module__,
             'name': concrete.__name__,
-            'type': SCOPED
+            'type': POOLED,
+            'pool': ObjectPool(lambda: self._resolve(concrete), max_size, block, timeout, reset)
         }
 
         return key
@@ -232,13 +436,15 @@ class Container(IContainer):
         Returns:
             str: The key under which the instance is registered in the container.
         """
+        self._ensureNotFrozen()
         self._ensureNotMain(instance.__class__)
         self._ensureUniqueService(instance)
         self._ensureIsInstance(instance)
 
         concrete = instance.__class__
-        key = f"{concrete.__module__}.{concrete.__name__}"
-        self._instances[key] = {
+        key = self._introspector.key(concrete)
+        self._forgetResolutionPlans()
+        self._services[key] = {
             'instance': instance,
             'module': concrete.__module__,
             'name': concrete.__name__,
@@ -247,6 +453,131 @@ class Container(IContainer):
 
         return key
 
+    def defer(self, services: List[Any], loader: Callable[[], None]) -> None:
+        """
+        Register services whose registration is postponed until first requested.
+
+        The loader (typically registering and booting a deferred service provider)
+        runs once, the first time any of the given services is resolved.
+
+        Args:
+            services (List[Any]): The service classes or keys provided by the loader.
+            loader (Callable[[], None]): The callable registering those services.
+        Raises:
+            OrionisContainerValueError: If one of the services is already registered.
+        """
+        self._ensureNotFrozen()
+        self._ensureIsCallable(loader)
+
+        keys = [service if isinstance(service, str) else self._introspector.key(service) for service in services]
+        record = {'keys': keys, 'loader': loader}
+        for key in keys:
+            self._ensureUniqueService(key)
+            self._deferred[key] = record
+
+        self._forgetResolutionPlans()
+
+    def _loadDeferred(self, key: str) -> None:
+        """
+        Run the loader of a deferred service, once.
+
+        The keys of the loader are forgotten before it runs, so that it can register
+        them as regular services. In a frozen container, the registry accepts the
+        registrations of the loader while it runs, then the factories of the new
+        services are generated and the registry becomes read-only again.
+
+        Parameters
+        ----------
+        key : str
+            The key of the deferred service being requested.
+        """
+        with self._deferred_guard:
+            record = self._deferred.get(key)
+            if record is None:
+                return
+            for deferred_key in record['keys']:
+                self._deferred.pop(deferred_key, None)
+
+            factories = self._factories
+            if factories is None:
+                record['loader']()
+                return
+
+            # The factories loading the services are replaced by the compiled ones
+            loading = {id(factories[deferred_key]) for deferred_key in record['keys'] if deferred_key in factories}
+            self._factories = None
+            self._services = dict(self._services)
+            self._aliases = dict(self._aliases)
+            try:
+                record['loader']()
+            finally:
+                self._compileFactories({abstract: factory for abstract, factory in factories.items() if id(factory) not in loading})
+
+    def replace(self, concrete: Any) -> Optional[str]:
+        """
+        Swap the implementation of a registered service, keeping its lifetime.
+
+        The service registered under the same key, such as the previous version of a
+        class whose module was reloaded, is replaced in a single assignment, so
+        concurrent resolutions get either the old or the new implementation. Its
+        built singleton and scoped instances are discarded, and the next resolution
+        builds the new implementation. Instances replace registered instances.
+        Args:
+            concrete (Any): The new class, callable or instance of the service.
+        Returns:
+            Optional[str]: The key of the replaced service, or None if it is deferred and not loaded yet.
+        Raises:
+            OrionisContainerException: If the service is not registered or is pooled.
+        """
+        self._ensureNotFrozen()
+
+        key = self._serviceKey(concrete)
+        service = self._services.get(key)
+        if service is None:
+            if key in self._deferred:
+                return None
+            raise OrionisContainerException(f"Service '{key}' is not registered in the container.")
+
+        lifetime = service['type']
+        if lifetime == POOLED:
+            raise OrionisContainerException(f"Service '{key}' is pooled, forget it and register it again instead of replacing it.")
+
+        if lifetime == INSTANCE:
+            self._ensureIsInstance(concrete)
+            descriptor = {'instance': concrete}
+            concrete = concrete.__class__
+        else:
+            self._ensureIsCallable(concrete)
+            descriptor = {'concrete': concrete, 'lazy': service.get('lazy', False)}
+        descriptor.update({'module': concrete.__module__, 'name': concrete.__name__, 'type': lifetime})
+
+        self._services[key] = descriptor
+        self._scoped_instances = {scope_key: instance for scope_key, instance in self._scoped_instances.items() if scope_key != key}
+        self._forgetResolutionPlans()
+        return key
+
+    def forget(self, abstract: Any) -> None:
+        """
+        Remove a service and the aliases pointing to it.
+
+        Given an alias, only the alias is removed.
+        Args:
+            abstract (Any): The service class, instance, key or alias.
+        """
+        self._ensureNotFrozen()
+
+        if isinstance(abstract, str) and abstract in self._aliases:
+            del self._aliases[abstract]
+            return
+
+        key = self._serviceKey(abstract)
+        self._services.pop(key, None)
+        self._deferred.pop(key, None)
+        self._scoped_instances.pop(key, None)
+        for alias in [alias for alias, target in self._aliases.items() if target == key]:
+            del self._aliases[alias]
+        self._forgetResolutionPlans()
+
     def alias(self, alias: str, concrete: Any) -> None:
         """
         Creates an alias for a registered service.
@@ -256,6 +587,7 @@ class Container(IContainer):
         Raises:
             OrionisContainerException: If the concrete instance is not a valid object or if the alias is a primitive type.
         """
+        self._ensureNotFrozen()
 
         if self._instance._validate_types.isPrimitive(alias):
             raise OrionisContainerException(f"Cannot use primitive type '{alias}' as an alias.")
@@ -265,11 +597,10 @@ class Container(IContainer):
                 current_key = concrete
             else:
                 raise OrionisContainerException(f"Service '{concrete}' is not registered in the container.")
-        elif isinstance(concrete, object) and concrete.__class__.__module__ not in ['builtins', 'abc']:
-            cls_concrete = concrete.__class__
-            current_key = f"{cls_concrete.__module__}.{cls_concrete.__name__}"
-        elif callable(concrete):
-            current_key = f"{concrete.__module__}.{concrete.__name__}"
+        else:
+            current_key = self._serviceKey(concrete)
+            if not isinstance(current_key, str):
+                raise OrionisContainerException(f"Cannot create an alias for '{concrete}', it is not a class, callable or valid object.")
 
         self._aliases[alias] = current_key
 
@@ -287,20 +618,30 @@ class Container(IContainer):
         bool
             True if the service is registered, False otherwise.
         """
-        if isinstance(obj, str):
-            return obj in self._aliases or obj in (
-                self._bindings | self._transients | self._singletons | self._scoped_services | self._instances
-            )
+        if self._hasLocal(obj):
+            return True
+        return self._parent is not None and self._parent.has(obj)
+
+    def _hasLocal(self, obj: Any) -> bool:
+        """
+        Check if a service is registered in this container, ignoring its parent.
+
+        Parameters
+        ----------
+        obj : Any
+            The service class, instance, or alias to check.
 
-        if isinstance(obj, object) and obj.__class__.__module__ not in {'builtins', 'abc'}:
-            key = f"{obj.__class__.__module__}.{obj.__class__.__name__}"
-            return key in self._instances
+        Returns
+        -------
+        bool
+            True if the service is registered locally, False otherwise.
+        """
+        if isinstance(obj, str):
+            return obj in self._services or obj in self._aliases or obj in self._deferred
 
-        if callable(obj):
-            key = f"{obj.__module__}.{obj.__name__}"
-            return key in (
-                self._bindings | self._transients | self._singletons | self._scoped_services | self._aliases
-            )
+        key = self._serviceKey(obj)
+        if isinstance(key, str):
+            return key in self._services or key in self._aliases or key in self._deferred
 
         return False
 
@@ -320,6 +661,32 @@ class Container(IContainer):
         """
         return self.has(abstract)
 
+    def borrow(self, abstract: Any) -> ContextManager[Any]:
+        """
+        Check out an instance of a pooled service for the duration of a `with` block.
+
+        Parameters
+        ----------
+        abstract : Any
+            The pooled service class or alias.
+
+        Returns
+        -------
+        ContextManager[Any]
+            A context manager yielding the instance and returning it to the pool on exit.
+
+        Raises
+        ------
+        OrionisContainerException
+            If the service is not registered as pooled, or its pool is exhausted.
+        """
+        key = self._serviceKey(abstract)
+        service = self._findService(key)
+        if service is None or service['type'] != POOLED:
+            raise OrionisContainerException(f"Service '{abstract}' is not registered in the container as a pooled service.")
+
+        return service['pool'].borrow()
+
     def make(self, abstract: Any) -> Any:
         """
         Create and return an instance of a registered service.
@@ -340,44 +707,906 @@ class Container(IContainer):
             If the service is not found in the container.
         """
 
-        key = abstract
+        factories = self._factories
+        if factories is not None:
+            try:
+                factory = factories.get(abstract)
+            except TypeError:
+                factory = None
+            if factory is not None:
+                return factory()
+
+        key = self._serviceKey(abstract)
+        service = self._services.get(key)
+        if service is None:
+            service = self._findService(key)
+            if service is None:
+                raise OrionisContainerException(f"Service '{abstract}' is not registered in the container.")
+
+        lifetime = service['type']
+
+        if lifetime == INSTANCE:
+            return service['instance']
+
+        if lifetime == SINGLETON:
+            # Singletons belong to the container that registered them.
+            if service is not self._services.get(key):
+                return self._parent.make(key)
+            if 'instance' not in service:
+                lock = self._acquireConstructionLock(key)
+                try:
+                    if 'instance' not in service:
+                        service['instance'] = self._resolve(service['concrete'])
+                finally:
+                    lock.release()
+            return service['instance']
+
+        if lifetime == SCOPED:
+            scoped_instances = _active_scope.get()
+            if scoped_instances is None:
+                scoped_instances = self._scoped_instances
+            scope_key = key if self._scope_namespace is None else (self._scope_namespace, key)
+            if scope_key not in scoped_instances:
+                lock = self._acquireConstructionLock(key)
+                try:
+                    if scope_key not in scoped_instances:
+                        scoped_instances[scope_key] = self._resolve(service['concrete'])
+                finally:
+                    lock.release()
+            return scoped_instances[scope_key]
+
+        if lifetime == POOLED:
+            raise OrionisContainerException(f"Service '{key}' is pooled, borrow an instance with borrow() instead of make().")
+
+        return self._resolve(service['concrete'])
+
+    def call(self, target: Callable[..., Any], overrides: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Call a function or bound method, injecting its dependencies from the container.
+
+        Parameters annotated with a class are resolved like constructor dependencies,
+        unless a value is given for them in `overrides`. Positional-only parameters are
+        passed by position and the others by keyword, and parameters with a default
+        value keep it. The plan of each function is compiled once and reused until the
+        bindings change.
+
+        Parameters
+        ----------
+        target : Callable[..., Any]
+            The function or bound method to call.
+        overrides : Dict[str, Any], optional
+            Values of parameters by name, taking precedence over injection.
+
+        Returns
+        -------
+        Any
+            The value returned by the call (a coroutine for `async def` functions).
+
+        Raises
+        ------
+        OrionisContainerException
+            If a parameter without value cannot be resolved.
+        """
+        plan = self._invocation_plans.get(getattr(target, '__func__', target))
+        if plan is None:
+            plan = self._compileInvocationPlan(target)
+
+        kwargs = dict(overrides) if overrides else {}
+        for dependency in plan.dependencies:
+            if dependency.name in kwargs:
+                continue
+            if dependency.lazy:
+                kwargs[dependency.name] = self._lazyProxy(dependency)
+            elif dependency.strategy == SERVICE:
+                kwargs[dependency.name] = self.make(dependency.target)
+            elif dependency.strategy == AUTOWIRE:
+                kwargs[dependency.name] = self._resolve(dependency.target)
+            else:
+                raise OrionisContainerException(f"Cannot resolve parameter '{dependency.target}' of {target}")
+
+        if not plan.positional:
+            return target(**kwargs)
+
+        # Positional-only parameters are passed in order, up to the last one given a value
+        given = [index for index, (name, _) in enumerate(plan.positional) if name in kwargs]
+        args = []
+        for name, default in plan.positional[:given[-1] + 1] if given else ():
+            if name in kwargs:
+                args.append(kwargs.pop(name))
+            elif default is inspect.Parameter.empty:
+                raise OrionisContainerException(f"Cannot resolve parameter '{name}' of {target}")
+            else:
+                args.append(default)
+        return target(*args, **kwargs)
+
+    def _compileInvocationPlan(self, target: Callable[..., Any]) -> InvocationPlan:
+        """
+        Build and cache the invocation plan of a function or bound method.
+
+        Bound methods share the plan of their underlying function, without the
+        parameter receiving the instance (or class).
+
+        Parameters
+        ----------
+        target : Callable[..., Any]
+            The function or bound method to compile.
+
+        Returns
+        -------
+        InvocationPlan
+            The compiled plan, also stored in the plan cache.
+        """
+        function = getattr(target, '__func__', target)
+        plan = self._resolution_plans.get(function)
+        if plan is None:
+            plan = self._compileResolutionPlan(function)
+
+        # The receiver of a bound method is supplied by Python, not by the container
+        receiver = None
+        if inspect.ismethod(target):
+            receiver = next(iter(inspect.signature(function).parameters), None)
+
+        dependencies = tuple(dependency for dependency in plan.dependencies if dependency.name != receiver)
+        positional = tuple(
+            (parameter.name, parameter.default)
+            for parameter in inspect.signature(function).parameters.values()
+            if parameter.kind is inspect.Parameter.POSITIONAL_ONLY and parameter.name != receiver
+        )
+        invocation_plan = InvocationPlan(function=function, dependencies=dependencies, positional=positional)
+        self._invocation_plans[function] = invocation_plan
+        return invocation_plan
+
+    async def makeAsync(self, abstract: Any) -> Any:
+        """
+        Asynchronously create and return an instance of a registered service.
+
+        Independent dependencies are built concurrently with `asyncio.gather`, and
+        awaitable results are awaited: `async def` factories, or classes implementing
+        `__await__` to finish their setup asynchronously. Concurrent awaits
+        of the same singleton (or scoped service within a scope) share a single
+        construction.
+
+        Parameters
+        ----------
+        abstract : Any
+            The service class or alias to instantiate.
+
+        Returns
+        -------
+        Any
+            An instance of the requested service.
+
+        Raises
+        ------
+        OrionisContainerException
+            If the service is not found in the container.
+        """
+        key = self._serviceKey(abstract)
+        service = self._findService(key)
+        if service is None:
+            raise OrionisContainerException(f"Service '{abstract}' is not registered in the container.")
+
+        lifetime = service['type']
+
+        if lifetime == INSTANCE:
+            return service['instance']
+
+        if lifetime == SINGLETON:
+            # Singletons belong to the container that registered them.
+            if service is not self._services.get(key):
+                return await self._parent.makeAsync(key)
+            # Singletons are cached on their own descriptor under the 'instance' entry.
+            return await self._constructOnceAsync(service, 'instance', service['concrete'])
+
+        if lifetime == SCOPED:
+            scoped_instances = _active_scope.get()
+            if scoped_instances is None:
+                scoped_instances = self._scoped_instances
+            scope_key = key if self._scope_namespace is None else (self._scope_namespace, key)
+            return await self._constructOnceAsync(scoped_instances, scope_key, service['concrete'])
+
+        if lifetime == POOLED:
+            raise OrionisContainerException(f"Service '{key}' is pooled, borrow an instance with borrow() instead of makeAsync().")
+
+        return await self._resolveAsync(service['concrete'])
+
+    async def _constructOnceAsync(self, cache: Dict[str, Any], key: str, concrete: Callable[..., Any]) -> Any:
+        """
+        Build an instance asynchronously and store it in a cache, only once.
+
+        While the instance is being built, other coroutines of the same event loop
+        asking for it wait for the pending construction instead of starting another.
+        If the coroutine building it is cancelled, a waiting coroutine starts the
+        construction again rather than being cancelled as well.
+
+        Parameters
+        ----------
+        cache : Dict[str, Any]
+            The cache holding the built instance.
+        key : str
+            The entry of the cache to fill.
+        concrete : Callable[..., Any]
+            The class or callable that builds the instance.
+
+        Returns
+        -------
+        Any
+            The cached instance.
+        """
+        # Imported on first use, asyncio is only needed by asynchronous resolutions
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        pending_key = (id(cache), key)
+        while True:
+            if key in cache:
+                return cache[key]
+            pending = self._pending_constructions.get(pending_key)
+            if pending is None or pending.get_loop() is not loop:
+                break
+            instance = await asyncio.shield(pending)
+            if instance is not _RETRY_CONSTRUCTION:
+                return instance
+
+        future = loop.create_future()
+        self._pending_constructions[pending_key] = future
+        try:
+            instance = cache.setdefault(key, await self._resolveAsync(concrete))
+            future.set_result(instance)
+            return instance
+        except asyncio.CancelledError:
+            future.set_result(_RETRY_CONSTRUCTION)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else was waiting for it.
+            future.exception()
+            raise
+        finally:
+            self._pending_constructions.pop(pending_key, None)
+
+    def freeze(self) -> None:
+        """
+        Freeze the container once its bindings are final.
+
+        The service index and aliases become read-only, any further registration
+        fails fast, and a specialized factory with every dependency pre-wired is
+        generated for each service, so `make()` costs little more than calling the
+        constructor. Deferred services are not loaded: their factory runs the loader
+        on the first call, then the factories of the services it registered are
+        generated. Calling it again has no effect.
+
+        Raises
+        ------
+        OrionisContainerException
+            If a circular dependency is found while generating the factories, or the
+            container is a child container.
+        """
+        if self._factories is not None:
+            return
+
+        if self._parent is not None:
+            raise OrionisContainerException("Only the root container can be frozen, child containers resolve through their parent.")
+
+        self._compileFactories({})
+
+    def _compileFactories(self, factories: Dict[Any, Callable[[], Any]]) -> None:
+        """
+        Generate the missing factories and make the registry read-only.
+
+        Parameters
+        ----------
+        factories : Dict[Any, Callable[[], Any]]
+            The factories generated so far, completed in place.
+        """
+        # Deferred services are loaded by their factory, so their dependents can be compiled too
+        for key in self._deferred:
+            factories.setdefault(key, self._deferredFactory(key))
+        for key in self._services:
+            self._compileFactory(key, factories, set())
+
+        # Index the factories by service class and alias as well, so lookups are a single hit.
+        for key, service in self._services.items():
+            if service['type'] == INSTANCE:
+                factories.setdefault(service['instance'].__class__, factories[key])
+            else:
+                factories.setdefault(service['concrete'], factories[key])
+        for alias, key in self._aliases.items():
+            if key in factories:
+                factories[alias] = factories[key]
+
+        self._services = MappingProxyType(self._services)
+        self._aliases = MappingProxyType(self._aliases)
+        self._factories = factories
+
+    def isFrozen(self) -> bool:
+        """
+        Check if the container has been frozen.
+
+        Returns
+        -------
+        bool
+            True if `freeze()` has been called, False otherwise.
+        """
+        return self._factories is not None
+
+    def graph(self) -> DependencyGraph:
+        """
+        Build the dependency graph of every registered service.
+
+        The graph is derived from the resolution plans of the services (compiling the
+        missing ones), including those inherited by a child container, so it can be inspected for cycles, depth, fan-out and lifetime
+        mismatches before any service is resolved.
+
+        Returns
+        -------
+        DependencyGraph
+            The constructor dependencies between services and autowired classes.
+        """
+        # A child sees the services of its ancestors, overridden by its own.
+        chain = []
+        container = self
+        while container is not None:
+            chain.append(container)
+            container = container._parent
+
+        services: Dict[str, Dict[str, Any]] = {}
+        lifetimes: Dict[str, str] = {}
+        for container in reversed(chain):
+            services.update(container._services)
+            lifetimes.update({key: DEFERRED for key in container._deferred})
+        lifetimes.update({key: service['type'] for key, service in services.items()})
+        edges: List[DependencyEdge] = []
+
+        pending = [(key, service['concrete']) for key, service in services.items() if service['type'] != INSTANCE]
+        planned = set()
+        while pending:
+            node, concrete = pending.pop()
+            if concrete in planned:
+                continue
+            planned.add(concrete)
+
+            plan = self._resolution_plans.get(concrete)
+            if plan is None:
+                try:
+                    plan = self._compileResolutionPlan(concrete)
+                except OrionisContainerException:
+                    continue
+
+            for dependency in plan.dependencies:
+                if dependency.strategy == SERVICE:
+                    target = self._serviceKey(dependency.target)
+                elif dependency.strategy == AUTOWIRE:
+                    target = self._introspector.key(dependency.target)
+                    lifetimes.setdefault(target, AUTOWIRED)
+                    pending.append((target, dependency.target))
+                else:
+                    continue
+                edges.append(DependencyEdge(node, target, dependency.name, dependency.lazy))
+
+        return DependencyGraph(lifetimes, edges)
+
+    def warmUp(self, max_workers: Optional[int] = None) -> Dict[str, float]:
+        """
+        Build every registered singleton ahead of its first use.
+
+        Singletons are built following the layers of the dependency graph: each layer
+        only depends on the previous ones, so its singletons are built concurrently on a
+        thread pool once the previous layers are ready. Singletons registered as lazy
+        and those already built are skipped. Every failure is collected, and dependents
+        of a failed singleton are not attempted.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The maximum number of threads, by default that of `ThreadPoolExecutor`.
+
+        Returns
+        -------
+        Dict[str, float]
+            The construction time in seconds of each singleton built, in construction order.
+
+        Raises
+        ------
+        OrionisContainerException
+            If the graph has a circular dependency, or any singleton fails to build,
+            reporting every failed service.
+        """
+        graph = self.graph()
+        layers = graph.layers()
+        times: Dict[str, float] = {}
+        errors: Dict[str, Exception] = {}
+
+        def build(key: str) -> float:
+            start = time.perf_counter()
+            self.make(key)
+            return time.perf_counter() - start
+
+        # Imported on first use, the thread pool is only needed by the warm-up
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='orionis-warmup') as executor:
+            for layer in layers:
+                pending = []
+                for key in layer:
+                    service = self._services.get(key)
+                    if service is None or service['type'] != SINGLETON or service.get('lazy') or 'instance' in service:
+                        continue
+                    if any(edge.target in errors for edge in graph.dependenciesOf(key)):
+                        errors[key] = OrionisContainerException("A dependency failed to warm up.")
+                        continue
+                    pending.append(key)
+
+                futures = [(key, executor.submit(build, key)) for key in pending]
+                for key, future in futures:
+                    try:
+                        times[key] = future.result()
+                    except Exception as e:
+                        errors[key] = e
+
+        self._warmup_times = times
+        if errors:
+            details = "; ".join(f"{key}: {errors[key]}" for key in sorted(errors))
+            raise OrionisContainerException(f"Failed to warm up {len(errors)} singleton(s): {details}")
+        return dict(times)
+
+    def getWarmupTimes(self) -> Dict[str, float]:
+        """
+        Retrieve the construction times of the last warm-up.
+
+        Returns
+        -------
+        Dict[str, float]
+            The construction time in seconds of each singleton built by `warmUp()`.
+        """
+        return dict(self._warmup_times)
+
+    def _compileFactory(self, key: str, factories: Dict[Any, Callable[[], Any]], compiling: set) -> Callable[[], Any]:
+        """
+        Generate the factory of a registered service, honoring its lifetime.
+
+        Parameters
+        ----------
+        key : str
+            The key of the service.
+        factories : Dict[Any, Callable[[], Any]]
+            The factories generated so far, updated in place.
+        compiling : set
+            The keys whose factories are being generated, used to detect cycles.
+
+        Returns
+        -------
+        Callable[[], Any]
+            A function without parameters returning the service.
+        """
+        key = self._aliases.get(key, key)
+        factory = factories.get(key)
+        if factory is not None:
+            return factory
+
+        if key in compiling:
+            raise OrionisContainerException(f"Circular dependency detected while freezing service '{key}'.")
+        compiling.add(key)
+
+        service = self._services[key]
+        lifetime = service['type']
+
+        if lifetime == INSTANCE:
+            instance = service['instance']
+            factory = lambda: instance
+        else:
+            builder = self._compileBuilder(service['concrete'], factories, compiling)
+            if lifetime == POOLED:
+                factory = self._pooledFactory(key)
+            elif lifetime == SINGLETON:
+                factory = self._singletonFactory(key, service, builder)
+            elif lifetime == SCOPED:
+                factory = self._scopedFactory(key, builder)
+            else:
+                factory = builder
+
+        compiling.discard(key)
+        factories[key] = factory
+        return factory
+
+    def _compileBuilder(self, concrete: Callable[..., Any], factories: Dict[Any, Callable[[], Any]], compiling: set) -> Callable[[], Any]:
+        """
+        Generate a function building a new instance of a class or callable.
+
+        Parameters
+        ----------
+        concrete : Callable[..., Any]
+            The class or callable to instantiate.
+        factories : Dict[Any, Callable[[], Any]]
+            The factories generated so far, updated in place.
+        compiling : set
+            The keys whose factories are being generated, used to detect cycles.
+
+        Returns
+        -------
+        Callable[[], Any]
+            A function without parameters returning a new instance.
+        """
+        plan = self._resolution_plans.get(concrete)
+        if plan is None:
+            plan = self._compileResolutionPlan(concrete)
+
+        if concrete in compiling:
+            raise OrionisContainerException(f"Circular dependency detected while freezing {concrete}.")
+        compiling.add(concrete)
+
+        dependencies = []
+        for dependency in plan.dependencies:
+            if dependency.lazy:
+                dependencies.append((dependency.name, lambda dependency=dependency: self._lazyProxy(dependency)))
+            elif dependency.strategy == SERVICE:
+                dependencies.append((dependency.name, self._compileFactory(dependency.target, factories, compiling)))
+            elif dependency.strategy == AUTOWIRE:
+                dependencies.append((dependency.name, self._compileBuilder(dependency.target, factories, compiling)))
+            else:
+                dependencies.append((dependency.name, self._unresolvedFactory(dependency.target)))
+
+        compiling.discard(concrete)
+        return self._factory_compiler.compile(concrete, plan.defaults, dependencies)
+
+    def _singletonFactory(self, key: str, service: Dict[str, Any], builder: Callable[[], Any]) -> Callable[[], Any]:
+        """
+        Wrap a builder so that it runs once, returning the cached singleton afterwards.
+        """
+        def factory():
+            try:
+                return service['instance']
+            except KeyError:
+                lock = self._acquireConstructionLock(key)
+                try:
+                    if 'instance' not in service:
+                        service['instance'] = builder()
+                    return service['instance']
+                finally:
+                    lock.release()
+        return factory
+
+    def _scopedFactory(self, key: str, builder: Callable[[], Any]) -> Callable[[], Any]:
+        """
+        Wrap a builder so that it runs once per scope, returning the scoped instance afterwards.
+        """
+        def factory():
+            scoped_instances = _active_scope.get()
+            if scoped_instances is None:
+                scoped_instances = self._scoped_instances
+            try:
+                return scoped_instances[key]
+            except KeyError:
+                lock = self._acquireConstructionLock(key)
+                try:
+                    if key not in scoped_instances:
+                        scoped_instances[key] = builder()
+                    return scoped_instances[key]
+                finally:
+                    lock.release()
+        return factory
+
+    def _deferredFactory(self, key: str) -> Callable[[], Any]:
+        """
+        Create a factory loading a deferred service on its first call, then building it.
+        """
+        def factory():
+            factories = self._factories
+            compiled = None if factories is None else factories.get(key)
+            if compiled is None or compiled is factory:
+                # Waits for a load in progress, the service is then made from its compiled factory
+                with self._deferred_guard:
+                    self._loadDeferred(key)
+                return self.make(key)
+            return compiled()
+        return factory
+
+    def _pooledFactory(self, key: str) -> Callable[[], Any]:
+        """
+        Create a factory raising the error of a pooled service requested with `make()`.
+        """
+        def factory():
+            raise OrionisContainerException(f"Service '{key}' is pooled, borrow an instance with borrow() instead of make().")
+        return factory
 
+    def _unresolvedFactory(self, name: str) -> Callable[[], Any]:
+        """
+        Create a factory raising the error of a dependency that cannot be resolved.
+        """
+        def factory():
+            raise OrionisContainerException(f"Cannot resolve dependency of type {name}")
+        return factory
+
+    def _serviceKey(self, abstract: Any) -> str:
+        """
+        Retrieve the container key of a service class, instance or alias.
+
+        Parameters
+        ----------
+        abstract : Any
+            The service class, instance, key or alias.
+
+        Returns
+        -------
+        str
+            The key under which the service is registered.
+        """
         if isinstance(abstract, str):
-            key = self._aliases.get(key, key)
+            container = self
+            while container is not None:
+                key = container._aliases.get(abstract)
+                if key is not None:
+                    return key
+                container = container._parent
+            return abstract
+
+        # Classes (including those with a custom metaclass) and functions are keyed by themselves
+        if isinstance(abstract, type) or (callable(abstract) and hasattr(abstract, '__name__')):
+            return self._introspector.key(abstract)
+
+        # Any other object is keyed by its class
+        if abstract.__class__.__module__ not in {'builtins', 'abc'}:
+            return self._introspector.key(abstract.__class__)
+
+        return abstract
+
+    def _findService(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the descriptor of a service in this container or its ancestors.
+
+        Deferred services are loaded on the way, by the container that deferred them.
+
+        Parameters
+        ----------
+        key : str
+            The key of the service (aliases already resolved).
+
+        Returns
+        -------
+        Dict[str, Any], optional
+            The descriptor of the nearest registration, or None if there is none.
+        """
+        container = self
+        while container is not None:
+            service = container._services.get(key)
+            if service is not None:
+                return service
+            if key in container._deferred:
+                container._loadDeferred(key)
+                continue
+            container = container._parent
+        return None
 
-        if callable(abstract):
-            key = f"{abstract.__module__}.{abstract.__name__}"
+    def _acquireConstructionLock(self, key: str) -> RLock:
+        """
+        Acquire the construction lock of a service key.
 
-        if isinstance(abstract, object) and abstract.__class__.__module__ not in {'builtins', 'abc'}:
-            key = f"{abstract.__class__.__module__}.{abstract.__class__.__name__}"
+        Each key owns its own re-entrant lock, so threads building different services
+        never contend. When the lock is already held by another thread, the wait is
+        recorded in the contention counters before blocking.
 
-        if key in self._instances:
-            return self._instances[key]['instance']
+        Parameters
+        ----------
+        key : str
+            The key of the service being constructed.
 
-        if key in self._singletons:
-            self._instances[key] = {'instance': self._resolve(self._singletons[key]['concrete'])}
-            return self._instances[key]['instance']
+        Returns
+        -------
+        RLock
+            The acquired lock, which the caller must release.
+        """
+        with self._construction_guard:
+            lock = self._construction_locks.get(key)
+            if lock is None:
+                lock = self._construction_locks[key] = RLock()
 
-        if key in self._scoped_services:
-            if key not in self._scoped_instances:
-                self._scoped_instances[key] = self._resolve(self._scoped_services[key]['concrete'])
-            return self._scoped_instances[key]
+        if not lock.acquire(blocking=False):
+            with self._construction_guard:
+                self._construction_contentions[key] = self._construction_contentions.get(key, 0) + 1
+            lock.acquire()
 
-        if key in self._transients:
-            return self._resolve(self._transients[key]['concrete'])
+        return lock
 
-        if key in self._bindings:
-            return self._resolve(self._bindings[key]['concrete'])
+    def getConstructionContentions(self) -> Dict[str, int]:
+        """
+        Retrieve how many times threads blocked waiting to construct each service.
 
-        raise OrionisContainerException(f"Service '{abstract}' is not registered in the container.")
+        Returns
+        -------
+        Dict[str, int]
+            A mapping of service keys to the number of contended lock acquisitions.
+        """
+        with self._construction_guard:
+            return dict(self._construction_contentions)
+
+    def enableProfiling(self) -> ContainerProfiler:
+        """
+        Start recording how each service is resolved.
+
+        The `make` method of this container is replaced by an instrumented version that
+        records, per service key, the resolution count, the cache hits, the construction
+        times and the depth of nested resolutions. Without profiling, `make` runs with no
+        instrumentation at all. Factories of a frozen container build their dependencies
+        directly, so only the requested services are recorded once frozen.
+
+        Returns
+        -------
+        ContainerProfiler
+            The active profiler.
+        """
+        if self._profiler is None:
+            self._profiler = ContainerProfiler()
+            self.make = self._profiler.wrap(Container.make.__get__(self), self._describeResolution)
+        return self._profiler
+
+    def disableProfiling(self) -> None:
+        """
+        Stop recording resolutions and restore the original `make`.
+        """
+        if self._profiler is not None:
+            del self.make
+            self._profiler = None
+
+    def getResolutionStats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve the resolution measurements of every service.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            A mapping of service keys to their lifetime, resolutions, hits, constructions,
+            cumulative, p50 and p99 construction times (in seconds) and maximum dependency
+            depth, slowest first. Empty when profiling is disabled.
+        """
+        if self._profiler is None:
+            return {}
+        return self._profiler.getStats()
+
+    def _describeResolution(self, abstract: Any) -> tuple:
+        """
+        Classify a resolution before it runs, for the profiler.
+
+        Returns
+        -------
+        tuple
+            The service key, its lifetime and whether the instance is already cached.
+        """
+        key = self._serviceKey(abstract)
+        service = self._peekService(key)
+        if service is None:
+            return key, DEFERRED if self.has(key) else None, False
+
+        lifetime = service['type']
+        if lifetime == INSTANCE:
+            return key, lifetime, True
+        if lifetime == SINGLETON:
+            return key, lifetime, 'instance' in service
+        if lifetime == SCOPED:
+            scoped_instances = _active_scope.get()
+            if scoped_instances is None:
+                scoped_instances = self._scoped_instances
+            scope_key = key if self._scope_namespace is None else (self._scope_namespace, key)
+            return key, lifetime, scope_key in scoped_instances
+        return key, lifetime, False
 
     def _resolve(self, concrete: Callable[..., Any]) -> Any:
         """
         Resolve and instantiate a given service class or function.
 
-        This method analyzes the constructor of the given class (or callable),
-        retrieves its dependencies, and resolves them recursively, while respecting
-        the service lifecycle.
+        This method retrieves the compiled resolution plan of the given class (or
+        callable), resolves its dependencies recursively while respecting the service
+        lifecycle, and instantiates it. The plan is compiled on first use only.
+        """
+        plan = self._resolution_plans.get(concrete)
+        if plan is None:
+            plan = self._compileResolutionPlan(concrete)
+
+        resolved_dependencies: Dict[str, Any] = dict(plan.defaults)
+        for dependency in plan.dependencies:
+            if dependency.lazy:
+                resolved_dependencies[dependency.name] = self._lazyProxy(dependency)
+            elif dependency.strategy == SERVICE:
+                resolved_dependencies[dependency.name] = self.make(dependency.target)
+            elif dependency.strategy == AUTOWIRE:
+                resolved_dependencies[dependency.name] = self._resolve(dependency.target)
+            else:
+                raise OrionisContainerException(f"Cannot resolve dependency of type {dependency.target}")
+
+        try:
+            return concrete(**resolved_dependencies)
+        except Exception as e:
+            raise OrionisContainerException(f"Failed to instantiate {concrete}: {str(e)}")
+
+    async def _resolveAsync(self, concrete: Callable[..., Any]) -> Any:
+        """
+        Asynchronously resolve and instantiate a given service class or function.
+
+        The dependencies of the compiled plan are built concurrently, and those still
+        being built are cancelled as soon as one fails. If the class or factory returns
+        an awaitable (for example an `async def` factory), it is awaited.
+        """
+        import asyncio
+
+        plan = self._resolution_plans.get(concrete)
+        if plan is None:
+            plan = self._compileResolutionPlan(concrete)
+
+        resolved_dependencies: Dict[str, Any] = dict(plan.defaults)
+        eager = []
+        for dependency in plan.dependencies:
+            if dependency.strategy == UNRESOLVED:
+                raise OrionisContainerException(f"Cannot resolve dependency of type {dependency.target}")
+            if dependency.lazy:
+                resolved_dependencies[dependency.name] = self._lazyProxy(dependency)
+            else:
+                eager.append(dependency)
+
+        if eager:
+            pending = [
+                asyncio.ensure_future(self.makeAsync(dependency.target) if dependency.strategy == SERVICE else self._resolveAsync(dependency.target))
+                for dependency in eager
+            ]
+            try:
+                values = await asyncio.gather(*pending)
+            except BaseException:
+                # gather() leaves the other dependencies running when one fails
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                raise
+            for dependency, value in zip(eager, values):
+                resolved_dependencies[dependency.name] = value
+
+        try:
+            instance = concrete(**resolved_dependencies)
+            if inspect.isawaitable(instance):
+                instance = await instance
+            return instance
+        except Exception as e:
+            raise OrionisContainerException(f"Failed to instantiate {concrete}: {str(e)}")
+
+    def _lazyProxy(self, dependency: PlannedParameter) -> LazyProxy:
+        """
+        Create a proxy that resolves a planned dependency on first use.
+
+        Parameters
+        ----------
+        dependency : PlannedParameter
+            The lazy dependency to defer.
+
+        Returns
+        -------
+        LazyProxy
+            The proxy standing in for the dependency.
+        """
+        if dependency.strategy == SERVICE:
+            return LazyProxy(lambda: self.make(dependency.target))
+        if dependency.strategy == AUTOWIRE:
+            return LazyProxy(lambda: self._resolve(dependency.target))
+        raise OrionisContainerException(f"Cannot resolve dependency of type {dependency.target}")
+
+    def _compileResolutionPlan(self, concrete: Callable[..., Any]) -> ResolutionPlan:
+        """
+        Build and cache the resolution plan of a given service class or function.
+
+        This method analyzes the constructor of the given class (or callable) once,
+        recording parameter names, default values, dependency keys and their
+        lifetimes, so that later resolutions skip all reflection work.
+
+        Parameters
+        ----------
+        concrete : Callable[..., Any]
+            The class or callable to compile.
+
+        Returns
+        -------
+        ResolutionPlan
+            The compiled plan, also stored in the plan cache.
+
+        Raises
+        ------
+        OrionisContainerException
+            If the signature of the callable cannot be inspected.
         """
 
         # Step 1: Retrieve the constructor signature of the class or callable.
@@ -386,9 +1615,10 @@ class Container(IContainer):
         except ValueError as e:
             raise OrionisContainerException(f"Unable to inspect signature of {concrete}: {str(e)}")
 
-        # Step 2: Prepare a dictionary for resolved dependencies and a queue for unresolved ones.
-        resolved_dependencies: Dict[str, Any] = {}
-        unresolved_dependencies = deque()
+        # Step 2: Prepare the values known now and the dependencies resolved per call.
+        hints = self._introspector.typeHints(concrete)
+        defaults: Dict[str, Any] = {}
+        dependencies: List[PlannedParameter] = []
 
         # Step 3: Iterate through the parameters of the constructor.
         for param_name, param in signature.parameters.items():
@@ -403,56 +1633,112 @@ class Container(IContainer):
 
             # If parameter has no annotation and no default value, it's unresolved
             if param.annotation is param.empty and param.default is param.empty:
-                unresolved_dependencies.append(param_name)
+                dependencies.append(PlannedParameter(param_name, UNRESOLVED, param_name))
                 continue
 
             # Resolve parameters with default values (without annotations)
             if param.default is not param.empty:
-                resolved_dependencies[param_name] = param.default
+                defaults[param_name] = param.default
                 continue
 
-            # Resolve dependencies based on annotations (excluding primitive types)
-            if param.annotation is not param.empty:
-                param_type = param.annotation
+            # Resolve dependencies based on the evaluated annotations (excluding primitive types)
+            param_type = hints.get(param_name, param.annotation)
 
-                # Check if it's a generic type, get the origin type
-                if get_origin(param_type) is not None:
-                    param_type = get_args(param_type)[0]
+            # Forward references that could not be evaluated cannot be resolved
+            if isinstance(param_type, str):
+                dependencies.append(PlannedParameter(param_name, UNRESOLVED, param_name))
+                continue
 
-                if isinstance(param_type, type) and not issubclass(param_type, (int, str, bool, float)):
-                    if self.has(param_type):
-                        resolved_dependencies[param_name] = self.make(f"{param_type.__module__}.{param_type.__name__}")
-                    else:
-                        resolved_dependencies[param_name] = self._resolve_dependency(param_type)
-                else:
-                    resolved_dependencies[param_name] = param_type
+            # Dependencies annotated with Lazy[...] are injected through a proxy
+            candidates, lazy = self._annotationCandidates(param_type)
+            classes = [candidate for candidate in candidates if isinstance(candidate, type) and not issubclass(candidate, (int, str, bool, float))]
+
+            registered = next((candidate for candidate in classes if self.has(candidate)), None)
+            if registered is not None:
+                key = self._introspector.key(registered)
+                service = self._peekService(self._serviceKey(key)) or {}
+                dependencies.append(PlannedParameter(
+                    param_name, SERVICE, key, self._lifetimeOf(key), lazy or service.get('lazy', False)
+                ))
+            elif len(classes) == 1 and len(candidates) == 1:
+                dependencies.append(PlannedParameter(param_name, AUTOWIRE, classes[0], lazy=lazy))
+            elif classes:
+                dependencies.append(PlannedParameter(param_name, UNRESOLVED, param_name))
+            else:
+                defaults[param_name] = param_type
 
-        # Step 4: Resolve any remaining unresolved dependencies.
-        while unresolved_dependencies:
-            dep_name = unresolved_dependencies.popleft()
-            if dep_name not in resolved_dependencies:
-                resolved_dependencies[dep_name] = self._resolve_dependency(dep_name)
+        # Step 4: Store the plan for every later resolution.
+        plan = ResolutionPlan(concrete=concrete, defaults=defaults, dependencies=tuple(dependencies))
+        self._resolution_plans[concrete] = plan
+        return plan
 
-        # Step 5: Instantiate the class with resolved dependencies.
-        try:
-            return concrete(**resolved_dependencies)
-        except Exception as e:
-            raise OrionisContainerException(f"Failed to instantiate {concrete}: {str(e)}")
+    def _annotationCandidates(self, annotation: Any) -> tuple:
+        """
+        Unwrap an annotation into the types that may satisfy it.
+
+        `Annotated[...]` is unwrapped (recording the `Lazy` marker), `Optional[X]` and
+        unions yield each member except `None`, and parameterized user generics yield
+        their origin class. Builtin generics such as `list[int]` are kept as they are.
+
+        Parameters
+        ----------
+        annotation : Any
+            The evaluated annotation of a parameter.
 
-    def _resolve_dependency(self, dep_type: Any) -> Any:
+        Returns
+        -------
+        tuple
+            The list of candidate types and whether the dependency is lazy.
+        """
+        lazy = False
+        if get_origin(annotation) is Annotated:
+            lazy = any(isinstance(meta, LazyMarker) for meta in annotation.__metadata__)
+            annotation = annotation.__origin__
+
+        origin = get_origin(annotation)
+        if origin is Union or origin is types.UnionType:
+            candidates = []
+            for member in get_args(annotation):
+                if member is type(None):
+                    continue
+                member_candidates, member_lazy = self._annotationCandidates(member)
+                candidates.extend(member_candidates)
+                lazy = lazy or member_lazy
+            return candidates, lazy
+
+        if isinstance(origin, type) and origin.__module__ != 'builtins':
+            return [origin], lazy
+
+        return [annotation], lazy
+
+    def _lifetimeOf(self, key: str) -> str:
         """
-        Resolves a dependency based on the provided type.
+        Retrieve the lifetime of a registered service.
+
+        Parameters
+        ----------
+        key : str
+            The service key (aliases are resolved).
 
-        This method looks for the type in the container and returns the instance,
-        respecting the lifecycle of the service (transient, singleton, etc.).
+        Returns
+        -------
+        str
+            The lifetime type of the service, or None if it is not registered.
         """
-        # Check if the dependency exists in the container or create it if necessary, If it's a class type
-        if isinstance(dep_type, type):
-            if self.has(dep_type):
-                # Resolves the service through the container
-                return self.make(f"{dep_type.__module__}.{dep_type.__name__}")
-            else:
-                # Instantiate the class if not found in the container
-                return self._resolve(dep_type)
+        service = self._peekService(self._serviceKey(key))
+        if service is not None:
+            return service['type']
+        return None
 
-        raise OrionisContainerException(f"Cannot resolve dependency of type {dep_type}")
+    def _peekService(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the descriptor of a service in this container or its ancestors, without
+        loading deferred services.
+        """
+        container = self
+        while container is not None:
+            service = container._services.get(key)
+            if service is not None:
+                return service
+            container = container._parent
+        return None
@@ -0,0 +1,320 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from orionis.luminate.container.exception import OrionisContainerException
+
+# Lifetimes of graph nodes that are not registered services
+AUTOWIRED = 'autowired'
+DEFERRED = 'deferred'
+
+# Lifetimes whose instances are built on every resolution of their consumer
+_REBUILT = {'binding', 'transient', AUTOWIRED}
+
+@dataclass(frozen=True, slots=True)
+class DependencyEdge:
+    """
+    A constructor dependency between two nodes of the graph.
+
+    Attributes
+    ----------
+    source : str
+        The node receiving the dependency.
+    target : str
+        The node injected into `source`.
+    parameter : str
+        The constructor parameter of `source` receiving the dependency.
+    lazy : bool
+        Whether the dependency is injected through a proxy built on first use.
+    """
+
+    source: str
+    target: str
+    parameter: str
+    lazy: bool = False
+
+@dataclass(frozen=True, slots=True)
+class LifetimeMismatch:
+    """
+    A long-lived service capturing a dependency that should live less.
+
+    Attributes
+    ----------
+    consumer : str
+        The singleton service holding the dependency.
+    dependency : str
+        The scoped service captured by the consumer.
+    path : Tuple[str, ...]
+        The chain of nodes from the consumer to the dependency.
+    """
+
+    consumer: str
+    dependency: str
+    path: Tuple[str, ...]
+
+class DependencyGraph:
+    """
+    The constructor dependencies between the services of a container.
+
+    Nodes are service keys (or the qualified names of autowired classes) and edges
+    go from a consumer to each dependency injected in its constructor. Lazy edges
+    are kept for reporting, but they never take part in cycles or construction order
+    because the proxy only resolves its target after the consumer has been built.
+
+    Parameters
+    ----------
+    lifetimes : Dict[str, str]
+        The lifetime of every node.
+    edges : List[DependencyEdge]
+        The dependencies between nodes.
+    """
+
+    def __init__(self, lifetimes: Dict[str, str], edges: List[DependencyEdge]) -> None:
+        self._lifetimes = dict(lifetimes)
+        self._edges: Dict[str, List[DependencyEdge]] = {node: [] for node in self._lifetimes}
+        for edge in edges:
+            self._lifetimes.setdefault(edge.target, None)
+            self._edges.setdefault(edge.target, [])
+            self._edges.setdefault(edge.source, []).append(edge)
+        self._depths: Dict[str, int] = {}
+
+    def nodes(self) -> List[str]:
+        """
+        Retrieve every node of the graph, sorted by name.
+
+        Returns
+        -------
+        List[str]
+            The service keys and autowired classes of the graph.
+        """
+        return sorted(self._edges)
+
+    def lifetimeOf(self, node: str) -> Optional[str]:
+        """
+        Retrieve the lifetime of a node.
+
+        Parameters
+        ----------
+        node : str
+            The node to inspect.
+
+        Returns
+        -------
+        str, optional
+            The lifetime of the service, `autowired`, `deferred`, or None if unknown.
+        """
+        return self._lifetimes.get(node)
+
+    def dependenciesOf(self, node: str) -> List[DependencyEdge]:
+        """
+        Retrieve the direct dependencies of a node.
+
+        Parameters
+        ----------
+        node : str
+            The node to inspect.
+
+        Returns
+        -------
+        List[DependencyEdge]
+            The edges leaving the node, in constructor order.
+        """
+        return list(self._edges.get(node, []))
+
+    def fanOut(self, node: str) -> int:
+        """
+        Count the distinct services a node depends on directly.
+
+        Parameters
+        ----------
+        node : str
+            The node to inspect.
+
+        Returns
+        -------
+        int
+            The number of direct dependencies.
+        """
+        return len({edge.target for edge in self._edges.get(node, [])})
+
+    def fanIn(self, node: str) -> int:
+        """
+        Count the distinct services depending directly on a node.
+
+        Parameters
+        ----------
+        node : str
+            The node to inspect.
+
+        Returns
+        -------
+        int
+            The number of direct consumers.
+        """
+        return len({edge.source for edges in self._edges.values() for edge in edges if edge.target == node})
+
+    def depth(self, node: str) -> int:
+        """
+        Measure the longest chain of eager dependencies below a node.
+
+        Parameters
+        ----------
+        node : str
+            The node to inspect.
+
+        Returns
+        -------
+        int
+            0 for a node without eager dependencies, otherwise one more than the
+            deepest of its dependencies. Edges closing a cycle are not followed.
+        """
+        depth = self._depths.get(node)
+        if depth is None:
+            self._depths[node] = 0
+            depth = max((self.depth(edge.target) + 1 for edge in self._eagerEdges(node)), default=0)
+            self._depths[node] = depth
+        return depth
+
+    def findCycles(self) -> List[List[str]]:
+        """
+        Find the circular chains of eager dependencies.
+
+        Returns
+        -------
+        List[List[str]]
+            Each cycle as a path starting and ending with the same node, for example
+            `['A', 'B', 'A']`. Lazy edges break cycles and are ignored.
+        """
+        cycles: List[List[str]] = []
+        seen = set()
+        visited = set()
+
+        for root in self.nodes():
+            if root in visited:
+                continue
+
+            path = [root]
+            on_path = {root}
+            stack = [iter(self._eagerEdges(root))]
+            visited.add(root)
+
+            while stack:
+                edge = next(stack[-1], None)
+                if edge is None:
+                    stack.pop()
+                    on_path.discard(path.pop())
+                    continue
+
+                target = edge.target
+                if target in on_path:
+                    cycle = path[path.index(target):] + [target]
+                    signature = frozenset(cycle)
+                    if signature not in seen:
+                        seen.add(signature)
+                        cycles.append(cycle)
+                elif target not in visited:
+                    visited.add(target)
+                    path.append(target)
+                    on_path.add(target)
+                    stack.append(iter(self._eagerEdges(target)))
+
+        return cycles
+
+    def ensureAcyclic(self) -> None:
+        """
+        Ensure that no service depends on itself through its eager dependencies.
+
+        Raises
+        ------
+        OrionisContainerException
+            If a circular dependency is found, reporting the full path of every cycle.
+        """
+        cycles = self.findCycles()
+        if cycles:
+            paths = "; ".join(" -> ".join(cycle) for cycle in cycles)
+            raise OrionisContainerException(f"Circular dependency detected: {paths}")
+
+    def lifetimeMismatches(self) -> List[LifetimeMismatch]:
+        """
+        Find singletons capturing scoped services.
+
+        A singleton lives for the whole process, so a scoped service built for it (directly,
+        or through transient and autowired services it builds) outlives its scope.
+
+        Returns
+        -------
+        List[LifetimeMismatch]
+            Every captured scoped service, with the path leading to it.
+        """
+        mismatches: List[LifetimeMismatch] = []
+
+        for consumer in self.nodes():
+            if self._lifetimes.get(consumer) != 'singleton':
+                continue
+
+            pending = [(edge.target, (consumer, edge.target)) for edge in self._edges[consumer]]
+            reached = set()
+            while pending:
+                node, path = pending.pop(0)
+                if node in reached:
+                    continue
+                reached.add(node)
+
+                lifetime = self._lifetimes.get(node)
+                if lifetime == 'scoped':
+                    mismatches.append(LifetimeMismatch(consumer, node, path))
+                elif lifetime in _REBUILT:
+                    pending.extend((edge.target, path + (edge.target,)) for edge in self._edges[node])
+
+        return mismatches
+
+    def topologicalOrder(self) -> List[str]:
+        """
+        Sort the nodes so that every node comes after its eager dependencies.
+
+        Returns
+        -------
+        List[str]
+            The nodes in construction order, sorted by name within each layer.
+
+        Raises
+        ------
+        OrionisContainerException
+            If the graph contains a circular dependency.
+        """
+        return [node for layer in self.layers() for node in layer]
+
+    def layers(self) -> List[List[str]]:
+        """
+        Group the nodes in layers whose eager dependencies all belong to earlier layers.
+
+        Nodes of the same layer do not depend on each other, so they can be built
+        concurrently once the previous layers are ready.
+
+        Returns
+        -------
+        List[List[str]]
+            The layers in construction order, each sorted by name.
+
+        Raises
+        ------
+        OrionisContainerException
+            If the graph contains a circular dependency.
+        """
+        self.ensureAcyclic()
+
+        remaining = {node: {edge.target for edge in self._eagerEdges(node)} for node in self._edges}
+        layers: List[List[str]] = []
+        while remaining:
+            layer = sorted(node for node, dependencies in remaining.items() if not dependencies)
+            layers.append(layer)
+            for node in layer:
+                del remaining[node]
+            for dependencies in remaining.values():
+                dependencies.difference_update(layer)
+
+        return layers
+
+    def _eagerEdges(self, node: str) -> List[DependencyEdge]:
+        """
+        Retrieve the dependencies of a node that are built together with it.
+        """
+        return [edge for edge in self._edges.get(node, []) if not edge.lazy]
@@ -0,0 +1,59 @@
+from typing import Any, Callable, Dict, List, Tuple
+from orionis.luminate.container.exception import OrionisContainerException
+
+class FactoryCompiler:
+    """
+    Generates specialized factory functions for frozen containers.
+
+    Each generated factory instantiates a single concrete class or callable with its
+    dependencies pre-wired: default values are bound as constants and every other
+    dependency is obtained by calling the factory of that dependency, so no signature
+    inspection, plan lookup or registry access happens when the factory runs.
+    """
+
+    def compile(
+        self,
+        concrete: Callable[..., Any],
+        defaults: Dict[str, Any],
+        dependencies: List[Tuple[str, Callable[[], Any]]]
+    ) -> Callable[[], Any]:
+        """
+        Generate a factory function that builds a new instance of `concrete`.
+
+        Parameters
+        ----------
+        concrete : Callable[..., Any]
+            The class or callable to instantiate.
+        defaults : Dict[str, Any]
+            Keyword arguments with a value known at compile time.
+        dependencies : List[Tuple[str, Callable[[], Any]]]
+            Keyword arguments paired with the factory producing their value.
+
+        Returns
+        -------
+        Callable[[], Any]
+            A function without parameters returning a new instance.
+        """
+        namespace: Dict[str, Any] = {
+            '_concrete': concrete,
+            '_error': OrionisContainerException
+        }
+        lines = ["def factory():"]
+        arguments = []
+
+        for index, (name, factory) in enumerate(dependencies):
+            namespace[f"_factory{index}"] = factory
+            lines.append(f"    _value{index} = _factory{index}()")
+            arguments.append(f"{name}=_value{index}")
+
+        for index, (name, value) in enumerate(defaults.items()):
+            namespace[f"_default{index}"] = value
+            arguments.append(f"{name}=_default{index}")
+
+        lines.append("    try:")
+        lines.append(f"        return _concrete({', '.join(arguments)})")
+        lines.append("    except Exception as e:")
+        lines.append("        raise _error(f\"Failed to instantiate {_concrete}: {str(e)}\")")
+
+        exec("\n".join(lines), namespace)
+        return namespace['factory']
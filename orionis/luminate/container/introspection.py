@@ -0,0 +1,81 @@
+import sys
+import typing
+from typing import Any, Callable, Dict
+from weakref import WeakKeyDictionary
+
+class ServiceIntrospector:
+    """
+    Caches what the container needs to know about classes and callables.
+
+    For each class or callable, the interned service key and the evaluated type
+    hints of its constructor are computed once and kept in caches weakly keyed by
+    the object itself, so dynamically created classes can still be garbage collected.
+    Objects that cannot be weakly referenced are introspected on every call.
+    """
+
+    def __init__(self) -> None:
+        self._keys: WeakKeyDictionary = WeakKeyDictionary()
+        self._hints: WeakKeyDictionary = WeakKeyDictionary()
+
+    def key(self, concrete: Callable[..., Any]) -> str:
+        """
+        Retrieve the service key of a class or callable.
+
+        Parameters
+        ----------
+        concrete : Callable[..., Any]
+            The class or callable.
+
+        Returns
+        -------
+        str
+            The interned key, made of the module and the name of the object.
+        """
+        try:
+            return self._keys[concrete]
+        except KeyError:
+            pass
+        except TypeError:
+            return sys.intern(f"{concrete.__module__}.{concrete.__name__}")
+
+        key = sys.intern(f"{concrete.__module__}.{concrete.__name__}")
+        self._keys[concrete] = key
+        return key
+
+    def typeHints(self, concrete: Callable[..., Any]) -> Dict[str, Any]:
+        """
+        Retrieve the evaluated type hints of the parameters of a class or callable.
+
+        String annotations (including those of modules using `from __future__ import
+        annotations`) are evaluated in the namespace of the module defining the object,
+        and `Annotated` metadata is kept. When the hints cannot be evaluated, for example
+        because of a forward reference to a name that does not exist, the annotations
+        that can be read are returned unevaluated.
+
+        Parameters
+        ----------
+        concrete : Callable[..., Any]
+            The class (whose `__init__` is inspected) or callable.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A mapping of parameter names to their type hints.
+        """
+        try:
+            return self._hints[concrete]
+        except KeyError:
+            cacheable = True
+        except TypeError:
+            cacheable = False
+
+        target = concrete.__init__ if isinstance(concrete, type) else concrete
+        try:
+            hints = typing.get_type_hints(target, include_extras=True)
+        except Exception:
+            hints = dict(getattr(target, '__annotations__', None) or {})
+        hints.pop('return', None)
+
+        if cacheable:
+            self._hints[concrete] = hints
+        return hints
@@ -0,0 +1,106 @@
+from threading import Lock
+from typing import Annotated, Any, Callable
+
+class LazyMarker:
+    """
+    Metadata attached to `Annotated` types to request lazy injection.
+    """
+
+    def __repr__(self) -> str:
+        return "Lazy"
+
+# Marker shared by every `Lazy[...]` annotation
+LAZY = LazyMarker()
+
+class Lazy:
+    """
+    Annotation requesting that a dependency be injected as a `LazyProxy`.
+
+    `Lazy[Service]` is equivalent to `Annotated[Service, LAZY]`, so type checkers
+    keep seeing `Service` while the container defers its construction.
+
+    Examples
+    --------
+    >>> def __init__(self, console: Lazy[Console]):
+    ...     self.console = console
+    """
+
+    def __class_getitem__(cls, service: Any) -> Any:
+        return Annotated[service, LAZY]
+
+class LazyProxy:
+    """
+    Lightweight stand-in for a service that is built on first attribute access.
+
+    Attribute reads and writes, calls and truthiness are forwarded to the real
+    service, which is constructed once (in a thread-safe way) by the given factory.
+
+    Parameters
+    ----------
+    factory : Callable[[], Any]
+        A function without parameters returning the real service.
+    """
+
+    __slots__ = ('_lazy_factory', '_lazy_instance', '_lazy_lock')
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        object.__setattr__(self, '_lazy_factory', factory)
+        object.__setattr__(self, '_lazy_lock', Lock())
+
+    def _lazyResolve(self) -> Any:
+        """
+        Build the real service on first use and return it.
+
+        Returns
+        -------
+        Any
+            The real service.
+        """
+        try:
+            return object.__getattribute__(self, '_lazy_instance')
+        except AttributeError:
+            with object.__getattribute__(self, '_lazy_lock'):
+                try:
+                    return object.__getattribute__(self, '_lazy_instance')
+                except AttributeError:
+                    instance = object.__getattribute__(self, '_lazy_factory')()
+                    object.__setattr__(self, '_lazy_instance', instance)
+                    return instance
+
+    def isResolved(self) -> bool:
+        """
+        Check if the real service has already been built.
+
+        Returns
+        -------
+        bool
+            True if the service has been built, False otherwise.
+        """
+        try:
+            object.__getattribute__(self, '_lazy_instance')
+            return True
+        except AttributeError:
+            return False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._lazyResolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._lazyResolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._lazyResolve(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._lazyResolve()(*args, **kwargs)
+
+    def __bool__(self) -> bool:
+        return bool(self._lazyResolve())
+
+    def __str__(self) -> str:
+        return str(self._lazyResolve())
+
+    def __repr__(self) -> str:
+        if self.isResolved():
+            return repr(self._lazyResolve())
+        return f"<LazyProxy of {object.__getattribute__(self, '_lazy_factory')!r}>"
@@ -0,0 +1,175 @@
+import threading
+import time
+import warnings
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional
+from orionis.luminate.container.exception import OrionisContainerException
+
+class ObjectPool:
+    """
+    A bounded, thread-safe pool of reusable instances.
+
+    Instances are built on demand by the factory until `max_size` exist, and are
+    returned to the pool when released, so each one is used by a single borrower at
+    a time. When every instance is checked out, `acquire()` waits for a release
+    (optionally with a timeout) or fails immediately, depending on `block`.
+
+    Parameters
+    ----------
+    factory : Callable[[], Any]
+        A function without parameters building a new instance.
+    max_size : int
+        The maximum number of instances alive at the same time.
+    block : bool, optional
+        Whether to wait for a release when the pool is exhausted (default) or fail.
+    timeout : float, optional
+        The maximum number of seconds to wait when blocking, forever if None.
+    reset : Callable[[Any], None], optional
+        A hook called with each instance on release, to clear its state. Instances
+        whose reset raises are discarded instead of returned to the pool.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_size: int,
+        block: bool = True,
+        timeout: Optional[float] = None,
+        reset: Optional[Callable[[Any], None]] = None
+    ) -> None:
+        if not isinstance(max_size, int) or max_size < 1:
+            raise OrionisContainerException(f"The size of a pool must be a positive integer, got '{max_size}'.")
+        self._factory = factory
+        self._max_size = max_size
+        self._block = block
+        self._timeout = timeout
+        self._reset = reset
+        self._idle: List[Any] = []
+        self._created = 0
+        self._condition = threading.Condition(threading.Lock())
+
+    def acquire(self) -> Any:
+        """
+        Check out an instance, building it if the pool is not full yet.
+
+        Returns
+        -------
+        Any
+            An instance reserved for the caller until it is released.
+
+        Raises
+        ------
+        OrionisContainerException
+            If the pool is exhausted and does not block, or the timeout expires.
+        """
+        # Wake-ups for releases taken by other borrowers do not restart the timeout
+        deadline = None if self._timeout is None else time.monotonic() + self._timeout
+        with self._condition:
+            while not self._idle and self._created >= self._max_size:
+                if not self._block:
+                    raise OrionisContainerException(f"The pool is exhausted, all {self._max_size} instances are in use.")
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise OrionisContainerException(f"Timed out after {self._timeout}s waiting for an instance of the pool.")
+                self._condition.wait(remaining)
+
+            if self._idle:
+                return self._idle.pop()
+
+            # Reserve the slot before building, so the factory runs outside the lock
+            self._created += 1
+
+        try:
+            return self._factory()
+        except BaseException:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, instance: Any) -> None:
+        """
+        Return a checked out instance to the pool, resetting it first.
+
+        Parameters
+        ----------
+        instance : Any
+            The instance obtained from `acquire()`.
+        """
+        try:
+            if self._reset is not None:
+                self._reset(instance)
+        except Exception:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._idle.append(instance)
+            self._condition.notify()
+
+    @contextmanager
+    def borrow(self) -> Iterator[Any]:
+        """
+        Check out an instance for the duration of a `with` block.
+
+        Yields
+        ------
+        Any
+            The borrowed instance, released when the block exits.
+        """
+        instance = self.acquire()
+        try:
+            yield instance
+        except BaseException:
+            # A failing reset must not hide the exception raised by the block
+            try:
+                self.release(instance)
+            except Exception as e:
+                warnings.warn(f"Discarded a pooled instance whose reset failed: {e!r}", RuntimeWarning)
+            raise
+        self.release(instance)
+
+    def fill(self) -> None:
+        """
+        Build instances until the pool holds `max_size` of them.
+        """
+        while True:
+            with self._condition:
+                if self._created >= self._max_size:
+                    return
+                self._created += 1
+            try:
+                instance = self._factory()
+            except BaseException:
+                with self._condition:
+                    self._created -= 1
+                raise
+            with self._condition:
+                self._idle.append(instance)
+                self._condition.notify()
+
+    def size(self) -> int:
+        """
+        Count the instances alive, checked out or idle.
+
+        Returns
+        -------
+        int
+            The number of instances built by the pool and not discarded.
+        """
+        with self._condition:
+            return self._created
+
+    def available(self) -> int:
+        """
+        Count the idle instances ready to be borrowed.
+
+        Returns
+        -------
+        int
+            The number of instances waiting in the pool.
+        """
+        with self._condition:
+            return len(self._idle)
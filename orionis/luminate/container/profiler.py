@@ -0,0 +1,185 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict
+
+class ServiceStats:
+    """
+    Resolution measurements of a single service key.
+
+    Attributes
+    ----------
+    lifetime : str
+        The lifetime of the service when it was last resolved.
+    resolutions : int
+        How many times the service was resolved.
+    hits : int
+        How many resolutions were served from a cache (instance, singleton or scope).
+    total_time : float
+        The cumulative construction time, in seconds, of the resolutions that missed the cache.
+    max_depth : int
+        The deepest chain of container resolutions observed below the service.
+    samples : Deque[float]
+        The most recent construction times, in seconds, used for percentiles.
+    """
+
+    __slots__ = ('lifetime', 'resolutions', 'hits', 'total_time', 'max_depth', 'samples')
+
+    def __init__(self, lifetime: str, max_samples: int) -> None:
+        self.lifetime = lifetime
+        self.resolutions = 0
+        self.hits = 0
+        self.total_time = 0.0
+        self.max_depth = 0
+        self.samples: Deque[float] = deque(maxlen=max_samples)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Compute a percentile of the recorded construction times.
+
+        Parameters
+        ----------
+        percent : float
+            The percentile to compute, between 0 and 100.
+
+        Returns
+        -------
+        float
+            The construction time in seconds, or 0.0 without samples.
+        """
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def toDict(self) -> Dict[str, Any]:
+        """
+        Export the measurements as a dictionary.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The lifetime, counters and construction times (cumulative, p50 and p99) in seconds.
+        """
+        return {
+            'lifetime': self.lifetime,
+            'resolutions': self.resolutions,
+            'hits': self.hits,
+            'constructions': self.resolutions - self.hits,
+            'total_time': self.total_time,
+            'p50': self.percentile(50),
+            'p99': self.percentile(99),
+            'max_depth': self.max_depth
+        }
+
+class ContainerProfiler:
+    """
+    Records how each service is resolved by a container.
+
+    The profiler wraps the `make` method of a single container instance, so a
+    container without profiler runs its original code with no extra cost. Each
+    resolution is classified as a cache hit or a construction before it runs, and
+    constructions are timed including the resolution of their dependencies.
+
+    Parameters
+    ----------
+    max_samples : int, optional
+        The number of recent construction times kept per service for percentiles.
+    """
+
+    def __init__(self, max_samples: int = 10000) -> None:
+        self._max_samples = max_samples
+        self._stats: Dict[str, ServiceStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def wrap(self, make: Callable[[Any], Any], describe: Callable[[Any], tuple]) -> Callable[[Any], Any]:
+        """
+        Wrap a `make` function so that every call is recorded.
+
+        Parameters
+        ----------
+        make : Callable[[Any], Any]
+            The original `make` bound method.
+        describe : Callable[[Any], tuple]
+            A function returning the key, the lifetime and whether the requested
+            service is already cached, evaluated before each resolution.
+
+        Returns
+        -------
+        Callable[[Any], Any]
+            The instrumented `make`.
+        """
+        def profiled(abstract: Any) -> Any:
+            key, lifetime, cached = describe(abstract)
+
+            frames = getattr(self._local, 'frames', None)
+            if frames is None:
+                frames = self._local.frames = []
+
+            frames.append(0)
+            start = time.perf_counter()
+            try:
+                return make(abstract)
+            finally:
+                elapsed = time.perf_counter() - start
+                depth = frames.pop()
+                if frames:
+                    frames[-1] = max(frames[-1], depth + 1)
+                self._record(key, lifetime, cached, elapsed, depth)
+
+        return profiled
+
+    def _record(self, key: str, lifetime: str, cached: bool, elapsed: float, depth: int) -> None:
+        """
+        Store the measurements of a single resolution.
+        """
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = ServiceStats(lifetime, self._max_samples)
+            stats.lifetime = lifetime
+            stats.resolutions += 1
+            stats.max_depth = max(stats.max_depth, depth)
+            if cached:
+                stats.hits += 1
+            else:
+                stats.total_time += elapsed
+                stats.samples.append(elapsed)
+
+    def getStats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve the measurements of every resolved service.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            A mapping of service keys to their measurements, sorted by cumulative
+            construction time (slowest first).
+        """
+        with self._lock:
+            stats = {key: service.toDict() for key, service in self._stats.items()}
+        return dict(sorted(stats.items(), key=lambda item: item[1]['total_time'], reverse=True))
+
+    def getHitsByLifetime(self) -> Dict[str, int]:
+        """
+        Retrieve the number of cache hits of each lifetime.
+
+        Returns
+        -------
+        Dict[str, int]
+            A mapping of lifetimes to their cache hits.
+        """
+        hits: Dict[str, int] = {}
+        with self._lock:
+            for service in self._stats.values():
+                hits[service.lifetime] = hits.get(service.lifetime, 0) + service.hits
+        return hits
+
+    def reset(self) -> None:
+        """
+        Discard every measurement recorded so far.
+        """
+        with self._lock:
+            self._stats = {}
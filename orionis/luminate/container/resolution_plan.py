@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Strategies a planned parameter can use to obtain its value
+SERVICE = 'service'
+AUTOWIRE = 'autowire'
+UNRESOLVED = 'unresolved'
+
+@dataclass(frozen=True, slots=True)
+class PlannedParameter:
+    """
+    A constructor parameter whose value must be produced at resolution time.
+
+    Attributes
+    ----------
+    name : str
+        The name of the parameter in the constructor signature.
+    strategy : str
+        How the value is obtained (`service`, `autowire` or `unresolved`).
+    target : Any
+        The service key for `service`, the class for `autowire`, or the
+        parameter name for `unresolved`.
+    lifetime : str, optional
+        The lifetime of the registered dependency, when it is a service.
+    lazy : bool
+        Whether the dependency is injected as a proxy built on first use.
+    """
+
+    name: str
+    strategy: str
+    target: Any
+    lifetime: Optional[str] = None
+    lazy: bool = False
+
+@dataclass(frozen=True, slots=True)
+class ResolutionPlan:
+    """
+    A precomputed recipe for instantiating a concrete class or callable.
+
+    The plan is built once from the constructor signature and reused on every
+    resolution until the container bindings change.
+
+    Attributes
+    ----------
+    concrete : Callable[..., Any]
+        The class or callable the plan instantiates.
+    defaults : Dict[str, Any]
+        Keyword arguments known at compile time (default values and literal types).
+    dependencies : Tuple[PlannedParameter, ...]
+        Keyword arguments that must be resolved on each call.
+    """
+
+    concrete: Callable[..., Any]
+    defaults: Dict[str, Any]
+    dependencies: Tuple[PlannedParameter, ...]
+
+@dataclass(frozen=True, slots=True)
+class InvocationPlan:
+    """
+    A precomputed recipe for injecting the parameters of a function or method call.
+
+    Attributes
+    ----------
+    function : Callable[..., Any]
+        The function the plan belongs to (the underlying function of bound methods).
+    dependencies : Tuple[PlannedParameter, ...]
+        Parameters resolved from the container unless given explicitly. Parameters with
+        a default value or a primitive annotation are left to the caller.
+    positional : Tuple[Tuple[str, Any], ...]
+        The name and default value (`inspect.Parameter.empty` if none) of each
+        positional-only parameter, in order, which must be passed by position.
+    """
+
+    function: Callable[..., Any]
+    dependencies: Tuple[PlannedParameter, ...]
+    positional: Tuple[Tuple[str, Any], ...] = ()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Callable
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional
 
 class IContainer(ABC):
 
@@ -81,10 +81,25 @@ class IContainer(ABC):
         """
         Reset scoped instances at the beginning of a new request.
         """
-        self._scoped_instances = {}
+        pass
+
+    @abstractmethod
+    def scope(self) -> Iterator['IContainer']:
+        """
+        Open an isolated scope for scoped services.
+
+        Scoped services resolved inside the block are cached for the current thread or
+        asyncio task only, and the whole cache is dropped when the block exits.
+
+        Yields
+        ------
+        IContainer
+            The container itself.
+        """
+        pass
 
     @abstractmethod
-    def bind(self, concrete: Callable[..., Any]) -> str:
+    def bind(self, concrete: Callable[..., Any], lazy: bool = False) -> str:
         """
         Bind a callable to the container.
         This method ensures that the provided callable is not the main function,
@@ -93,25 +108,27 @@ class IContainer(ABC):
         the callable in the container's bindings.
         Args:
             concrete (Callable[..., Any]): The callable to be bound to the container.
+            lazy (bool): Whether dependents receive a proxy that builds the service on first use.
         Returns:
             str: The unique key generated for the callable.
         """
         pass
 
     @abstractmethod
-    def transient(self, concrete: Callable[..., Any]) -> str:
+    def transient(self, concrete: Callable[..., Any], lazy: bool = False) -> str:
         """
         Registers a transient service in the container.
         A transient service is created each time it is requested.
         Args:
             concrete (Callable[..., Any]): The callable that defines the service.
+            lazy (bool): Whether dependents receive a proxy that builds the service on first use.
         Returns:
             str: The unique key generated for the callable.
         """
         pass
 
     @abstractmethod
-    def singleton(self, concrete: Callable[..., Any]) -> str:
+    def singleton(self, concrete: Callable[..., Any], lazy: bool = False) -> str:
         """
         Registers a callable as a singleton in the container.
         This method ensures that the provided callable is not the main module,
@@ -119,13 +136,14 @@ class IContainer(ABC):
         the callable as a singleton, storing it in the container's singleton registry.
         Args:
             concrete (Callable[..., Any]): The callable to be registered as a singleton.
+            lazy (bool): Whether dependents receive a proxy that builds the service on first use.
         Returns:
             str: The key under which the singleton is registered in the container.
         """
         pass
 
     @abstractmethod
-    def scoped(self, concrete: Callable[..., Any]) -> str:
+    def scoped(self, concrete: Callable[..., Any], lazy: bool = False) -> str:
         """
         Registers a callable as a scoped service.
         This method ensures that the provided callable is not the main service,
@@ -133,11 +151,44 @@ class IContainer(ABC):
         scoped services dictionary with relevant metadata.
         Args:
             concrete (Callable[..., Any]): The callable to be registered as a scoped service.
+            lazy (bool): Whether dependents receive a proxy that builds the service on first use.
         Returns:
             str: The key under which the callable is registered in the scoped services dictionary.
         """
         pass
 
+    @abstractmethod
+    def pooled(
+        self,
+        concrete: Callable[..., Any],
+        max_size: int = 10,
+        block: bool = True,
+        timeout: Optional[float] = None,
+        reset: Optional[Callable[[Any], None]] = None
+    ) -> str:
+        """
+        Registers a callable as a pooled service, borrowed with `borrow()`.
+
+        Parameters
+        ----------
+        concrete : Callable[..., Any]
+            The callable that defines the service.
+        max_size : int, optional
+            The maximum number of instances alive at the same time.
+        block : bool, optional
+            Whether borrowing waits for a release when the pool is exhausted, or fails.
+        timeout : float, optional
+            The maximum number of seconds to wait when blocking.
+        reset : Callable[[Any], None], optional
+            A hook clearing the state of an instance when it is returned.
+
+        Returns
+        -------
+        str
+            The key under which the pooled service is registered.
+        """
+        pass
+
     @abstractmethod
     def instance(self, instance: Any) -> str:
         """
@@ -149,6 +200,44 @@ class IContainer(ABC):
         """
         pass
 
+    @abstractmethod
+    def defer(self, services: List[Any], loader: Callable[[], None]) -> None:
+        """
+        Register services whose registration is postponed until first requested.
+
+        The loader (typically registering and booting a deferred service provider)
+        runs once, the first time any of the given services is resolved.
+
+        Args:
+            services (List[Any]): The service classes or keys provided by the loader.
+            loader (Callable[[], None]): The callable registering those services.
+        Raises:
+            OrionisContainerValueError: If one of the services is already registered.
+        """
+        pass
+
+    @abstractmethod
+    def replace(self, concrete: Any) -> Optional[str]:
+        """
+        Swap the implementation of a registered service, keeping its lifetime.
+        Args:
+            concrete (Any): The new class, callable or instance of the service.
+        Returns:
+            Optional[str]: The key of the replaced service, or None if it is deferred and not loaded yet.
+        Raises:
+            OrionisContainerException: If the service is not registered or is pooled.
+        """
+        pass
+
+    @abstractmethod
+    def forget(self, abstract: Any) -> None:
+        """
+        Remove a service and the aliases pointing to it.
+        Args:
+            abstract (Any): The service class, instance, key or alias.
+        """
+        pass
+
     @abstractmethod
     def alias(self, alias: str, concrete: Any) -> None:
         """
@@ -195,6 +284,23 @@ class IContainer(ABC):
         """
         pass
 
+    @abstractmethod
+    def borrow(self, abstract: Any) -> ContextManager[Any]:
+        """
+        Check out an instance of a pooled service for the duration of a `with` block.
+
+        Parameters
+        ----------
+        abstract : Any
+            The pooled service class or alias.
+
+        Returns
+        -------
+        ContextManager[Any]
+            A context manager yielding the instance and returning it to the pool on exit.
+        """
+        pass
+
     @abstractmethod
     def make(self, abstract: Any) -> Any:
         """
@@ -218,22 +324,191 @@ class IContainer(ABC):
         pass
 
     @abstractmethod
-    def _resolve(self, concrete: Callable[..., Any]) -> Any:
+    def call(self, target: Callable[..., Any], overrides: Optional[Dict[str, Any]] = None) -> Any:
         """
-        Resolve and instantiate a given service class or function.
+        Call a function or bound method, injecting its dependencies from the container.
 
-        This method analyzes the constructor of the given class (or callable),
-        retrieves its dependencies, and resolves them recursively, while respecting
-        the service lifecycle.
+        Parameters
+        ----------
+        target : Callable[..., Any]
+            The function or bound method to call.
+        overrides : Dict[str, Any], optional
+            Values of parameters by name, taking precedence over injection.
+
+        Returns
+        -------
+        Any
+            The value returned by the call.
+        """
+        pass
+
+    @abstractmethod
+    async def makeAsync(self, abstract: Any) -> Any:
+        """
+        Asynchronously create and return an instance of a registered service.
+
+        Independent dependencies are built concurrently with `asyncio.gather`, and
+        awaitable results are awaited: `async def` factories, or classes implementing
+        `__await__` to finish their setup asynchronously. Concurrent awaits
+        of the same singleton (or scoped service within a scope) share a single
+        construction.
+
+        Parameters
+        ----------
+        abstract : Any
+            The service class or alias to instantiate.
+
+        Returns
+        -------
+        Any
+            An instance of the requested service.
+
+        Raises
+        ------
+        OrionisContainerException
+            If the service is not found in the container.
+        """
+        pass
+
+    @abstractmethod
+    def freeze(self) -> None:
+        """
+        Freeze the container once its bindings are final.
+
+        The service index and aliases become read-only, any further registration
+        fails fast, and a specialized factory with every dependency pre-wired is
+        generated for each service. Deferred services are loaded first. Calling it
+        again has no effect.
+        """
+        pass
+
+    @abstractmethod
+    def child(self):
+        """
+        Create a child container that resolves through this one.
+
+        Returns
+        -------
+        Container
+            The new child container, holding only its own overrides.
+        """
+        pass
+
+    @abstractmethod
+    def parent(self):
+        """
+        Retrieve the container a child resolves through.
+
+        Returns
+        -------
+        Container, optional
+            The parent container, or None for the root container.
+        """
+        pass
+
+    @abstractmethod
+    def graph(self):
+        """
+        Build the dependency graph of every registered service.
+
+        Returns
+        -------
+        DependencyGraph
+            The constructor dependencies between services and autowired classes.
         """
         pass
 
     @abstractmethod
-    def _resolve_dependency(self, dep_type: Any) -> Any:
+    def warmUp(self, max_workers: Optional[int] = None) -> Dict[str, float]:
         """
-        Resolves a dependency based on the provided type.
+        Build every registered singleton ahead of its first use.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The maximum number of threads used to build independent singletons.
 
-        This method looks for the type in the container and returns the instance,
-        respecting the lifecycle of the service (transient, singleton, etc.).
+        Returns
+        -------
+        Dict[str, float]
+            The construction time in seconds of each singleton built.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def getWarmupTimes(self) -> Dict[str, float]:
+        """
+        Retrieve the construction times of the last warm-up.
+
+        Returns
+        -------
+        Dict[str, float]
+            The construction time in seconds of each singleton built by `warmUp()`.
+        """
+        pass
+
+    @abstractmethod
+    def isFrozen(self) -> bool:
+        """
+        Check if the container has been frozen.
+
+        Returns
+        -------
+        bool
+            True if `freeze()` has been called, False otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def enableProfiling(self):
+        """
+        Start recording how each service is resolved.
+
+        Returns
+        -------
+        ContainerProfiler
+            The active profiler.
+        """
+        pass
+
+    @abstractmethod
+    def disableProfiling(self) -> None:
+        """
+        Stop recording resolutions and restore the original `make`.
+        """
+        pass
+
+    @abstractmethod
+    def getResolutionStats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve the resolution measurements of every service.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            A mapping of service keys to their measurements, slowest first.
+        """
+        pass
+
+    @abstractmethod
+    def getConstructionContentions(self) -> Dict[str, int]:
+        """
+        Retrieve how many times threads blocked waiting to construct each service.
+
+        Returns
+        -------
+        Dict[str, int]
+            A mapping of service keys to the number of contended lock acquisitions.
+        """
+        pass
+
+    @abstractmethod
+    def _resolve(self, concrete: Callable[..., Any]) -> Any:
+        """
+        Resolve and instantiate a given service class or function.
+
+        This method analyzes the constructor of the given class (or callable),
+        retrieves its dependencies, and resolves them recursively, while respecting
+        the service lifecycle.
+        """
+        pass
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any
-from orionis.luminate.services.commands.scheduler_service import ScheduleService
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from orionis.luminate.services.commands.scheduler_service import ScheduleService
 
 class ISchedule(ABC):
 
@@ -25,4 +27,12 @@ class ISchedule(ABC):
         Schedule
             Returns the Schedule instance itself, allowing method chaining.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def reschedule(define: Callable[[], Any]) -> None:
+        """
+        Replaces every scheduled job with those defined by a function, without
+        stopping the scheduler.
+        """
+        pass
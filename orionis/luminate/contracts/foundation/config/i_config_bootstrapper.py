@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 class IConfigBootstrapper(ABC):
     """
@@ -137,4 +137,39 @@ class IConfigBootstrapper(ABC):
         KeyError
             If the key is not found and no default value is provided.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def describe(self) -> Dict[str, Any]:
+        """
+        Describes the configuration modules for the boot manifest.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The 'entries' of the manifest section, one per module with its section and
+            module path, and the 'files' and 'directories' scanned to discover them.
+        """
+        pass
+
+    @abstractmethod
+    def reload(self, files: List[str]) -> List[str]:
+        """
+        Imports again the configuration modules whose files changed.
+
+        Parameters
+        ----------
+        files : List[str]
+            The paths of the changed files.
+
+        Returns
+        -------
+        List[str]
+            The sections reloaded or removed.
+
+        Raises
+        ------
+        BootstrapRuntimeError
+            If a changed module cannot be loaded.
+        """
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, List, Optional
 
 class ICommandsBootstrapper(ABC):
     """
@@ -36,7 +36,7 @@ class ICommandsBootstrapper(ABC):
         pass
 
     @abstractmethod
-    def _register(self, concrete: Callable[..., Any]) -> None:
+    def _register(self, concrete: Callable[..., Any], commands: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
         """
         Validates and registers a command class.
 
@@ -48,6 +48,8 @@ class ICommandsBootstrapper(ABC):
         ----------
         concrete : Callable[..., Any]
             The command class to register.
+        commands : Dict[str, Dict[str, Any]], optional
+            The registry the command is added to, the registered commands by default.
 
         Raises
         ------
@@ -78,4 +80,63 @@ class ICommandsBootstrapper(ABC):
         KeyError
             If the command signature is not found.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def load(self, signature: str) -> Dict[str, Any]:
+        """
+        Imports the class and collects the arguments of a command.
+
+        Parameters
+        ----------
+        signature : str
+            The command signature to load.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The command data, with its class and arguments.
+
+        Raises
+        ------
+        KeyError
+            If the command signature is not found.
+        """
+        pass
+
+    @abstractmethod
+    def describe(self) -> Dict[str, Any]:
+        """
+        Describes the registered commands for the boot manifest.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The 'entries' of the manifest section, one per command with its signature,
+            description, arguments, module and class name, and the 'files' and
+            'directories' scanned to discover them.
+        """
+        pass
+
+    @abstractmethod
+    def reload(self, files: List[str]) -> Dict[str, List[str]]:
+        """
+        Imports again the developer commands whose files changed.
+
+        Parameters
+        ----------
+        files : List[str]
+            The paths of the changed files.
+
+        Returns
+        -------
+        Dict[str, List[str]]
+            The signatures of the commands 'loaded' from the changed modules, and of
+            those 'removed' since they are no longer defined.
+
+        Raises
+        ------
+        BootstrapRuntimeError
+            If a changed module cannot be loaded.
+        """
+        pass
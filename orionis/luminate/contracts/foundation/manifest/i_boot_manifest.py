@@ -0,0 +1,96 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+class IBootManifest(ABC):
+    """
+    Contract for the persisted cache of what the bootstrappers discover at boot.
+    """
+
+    @abstractmethod
+    def path(self) -> str:
+        """
+        Retrieve the location of the manifest file.
+
+        Returns
+        -------
+        str
+            The absolute path of the manifest file.
+        """
+        pass
+
+    @abstractmethod
+    def cachePath(self, name: str) -> str:
+        """
+        Retrieve the location of another cache file stored next to the manifest.
+
+        Parameters
+        ----------
+        name : str
+            The name of the cache file.
+
+        Returns
+        -------
+        str
+            The absolute path of the cache file.
+        """
+        pass
+
+    @abstractmethod
+    def isValid(self) -> bool:
+        """
+        Check whether the manifest exists and matches the files it was generated from.
+
+        Returns
+        -------
+        bool
+            True if the manifest can be used instead of scanning the directories.
+        """
+        pass
+
+    @abstractmethod
+    def section(self, name: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Retrieve the entries of a section of the manifest.
+
+        Parameters
+        ----------
+        name : str
+            The name of the section, such as 'commands', 'providers' or 'config'.
+
+        Returns
+        -------
+        Optional[List[Dict[str, Any]]]
+            The entries of the section, or None if the manifest is missing, stale or
+            does not contain the section.
+        """
+        pass
+
+    @abstractmethod
+    def write(self, sections: Dict[str, Dict[str, Any]]) -> str:
+        """
+        Persist the manifest.
+
+        Parameters
+        ----------
+        sections : Dict[str, Dict[str, Any]]
+            The description of each section, as returned by the `describe()` method
+            of the bootstrappers.
+
+        Returns
+        -------
+        str
+            The path of the written manifest.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> bool:
+        """
+        Remove the manifest file.
+
+        Returns
+        -------
+        bool
+            True if a manifest was removed.
+        """
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any, Dict
 from orionis.luminate.providers.service_provider import ServiceProvider
 
 class IServiceProvidersBootstrapper(ABC):
@@ -56,4 +57,30 @@ class IServiceProvidersBootstrapper(ABC):
         list
             A list of registered service providers
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def getDeferredServiceProviders(self) -> list:
+        """
+        Retrieve the service providers loaded on first use of their services.
+
+        Returns
+        -------
+        list
+            A list of deferred service providers
+        """
+        pass
+
+    @abstractmethod
+    def describe(self) -> Dict[str, Any]:
+        """
+        Describe the registered service providers for the boot manifest.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The 'entries' of the manifest section, one per provider with its module and
+            class name in registration order, and the 'files' and 'directories' scanned
+            to discover them.
+        """
+        pass
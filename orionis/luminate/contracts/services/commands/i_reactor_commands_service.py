@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 class IReactorCommandsService(ABC):
     """
@@ -20,4 +20,22 @@ class IReactorCommandsService(ABC):
         Determines if the command originates from `sys.argv` or is explicitly called,
         then executes the appropriate command pipeline, handling success and errors.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def run(self, argv: List[str]) -> int:
+        """
+        Executes a command given on the command line and reports its exit status.
+
+        Parameters
+        ----------
+        argv : List[str]
+            The command line, the program name followed by the signature and the
+            arguments of the command.
+
+        Returns
+        -------
+        int
+            0 if the command succeeded, 1 if it failed.
+        """
+        pass
@@ -1,5 +1,5 @@
 
-from typing import Any
+from typing import Any, Callable
 from datetime import datetime
 from abc import ABC, abstractmethod
 
@@ -309,6 +309,13 @@ class IScheduleService(ABC):
         """
         pass
 
+    @abstractmethod
+    def reschedule(self, define: Callable[[], Any]) -> None:
+        """
+        Replaces every scheduled job with those defined by a function.
+        """
+        pass
+
     @abstractmethod
     def start(self):
         """
@@ -28,6 +28,13 @@ class ILogguerService(ABC):
         """
         pass
 
+    @abstractmethod
+    def reopen(self) -> None:
+        """
+        Reopens the log files of the root logger.
+        """
+        pass
+
     @abstractmethod
     def info(self, message: str) -> None:
         """
@@ -1,7 +1,9 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable
 from orionis.luminate.contracts.facades.commands.i_scheduler_facade import ISchedule
 from orionis.luminate.facades.app_facade import app
-from orionis.luminate.services.commands.scheduler_service import ScheduleService
+
+if TYPE_CHECKING:
+    from orionis.luminate.services.commands.scheduler_service import ScheduleService
 
 class Schedule(ISchedule):
 
@@ -26,13 +28,28 @@ class Schedule(ISchedule):
         Schedule
             Returns the Schedule instance itself, allowing method chaining.
         """
+        # Imported on first use, so importing the facade does not load APScheduler
+        from orionis.luminate.services.commands.scheduler_service import ScheduleService
         _scheduler_provider : ScheduleService = app(ScheduleService)
         return _scheduler_provider.command(signature, vars, *args, **kwargs)
 
+    @staticmethod
+    def reschedule(define: Callable[[], Any]) -> None:
+        """
+        Replaces every scheduled job with those defined by a function, without
+        stopping the scheduler.
+        """
+        # Imported on first use, so importing the facade does not load APScheduler
+        from orionis.luminate.services.commands.scheduler_service import ScheduleService
+        _scheduler_provider : ScheduleService = app(ScheduleService)
+        return _scheduler_provider.reschedule(define)
+
     @staticmethod
     def start():
         """
         Starts the scheduler and stops automatically when there are no more jobs.
         """
+        # Imported on first use, so importing the facade does not load APScheduler
+        from orionis.luminate.services.commands.scheduler_service import ScheduleService
         _scheduler_provider : ScheduleService = app(ScheduleService)
         return _scheduler_provider.start()
\ No newline at end of file
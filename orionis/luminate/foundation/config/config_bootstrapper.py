@@ -1,10 +1,13 @@
 import importlib
 import pathlib
 from dataclasses import asdict
-from typing import Any, Dict
+from typing import Any, Dict, List
 from orionis.luminate.contracts.foundation.config.i_config_bootstrapper import IConfigBootstrapper
 from orionis.luminate.contracts.config.i_config import IConfig
 from orionis.luminate.foundation.exceptions.exception_bootstrapper import BootstrapRuntimeError
+from orionis.luminate.foundation.manifest.boot_manifest import BootManifest
+from orionis.luminate.foundation.reload.module_reloader import ModuleReloader
+from orionis.luminate.foundation.tracing.boot_tracer import BootTracer
 
 class ConfigBootstrapper(IConfigBootstrapper):
     """
@@ -12,7 +15,8 @@ class ConfigBootstrapper(IConfigBootstrapper):
 
     This class scans a specified directory for Python files, imports them, and registers
     configuration classes that inherit from `IConfig`. It ensures that configurations
-    are loaded only once and provides methods to access and modify them.
+    are loaded only once and provides methods to access and modify them. When the boot
+    manifest is valid, only the configuration modules it lists are imported.
 
     Attributes
     ----------
@@ -21,10 +25,12 @@ class ConfigBootstrapper(IConfigBootstrapper):
 
     Methods
     -------
-    __init__()
+    __init__(manifest: BootManifest)
         Initializes the `ConfigBootstrapper` and triggers the autoload process.
     _autoload()
         Scans the configuration directory and loads configuration classes.
+    _loadManifest(entries: List[Dict[str, Any]])
+        Loads the configuration modules listed in the boot manifest.
     _set(concrete: Any, section: str)
         Validates and registers a configuration class.
     _parse(data: Any) -> Dict[str, Any]
@@ -35,17 +41,35 @@ class ConfigBootstrapper(IConfigBootstrapper):
         Dynamically sets a configuration value using dot notation.
     get(key: str, default: Optional[Any] = None) -> Any
         Retrieves a configuration value using dot notation.
+    describe() -> Dict[str, Any]
+        Describes the configuration modules for the boot manifest.
+    reload(files: List[str]) -> List[str]
+        Imports again the configuration modules whose files changed.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, manifest: BootManifest) -> None:
         """
         Initializes the `ConfigBootstrapper` and triggers the autoload process.
 
-        The `_config` dictionary is initialized to store configuration data, and the
-        `_autoload` method is called to load configurations from the default directory.
+        The `_config` dictionary is initialized to store configuration data, which is
+        loaded from the modules listed in the boot manifest when it is valid, or by the
+        `_autoload` method from the default directory otherwise.
+
+        Parameters
+        ----------
+        manifest : BootManifest
+            The cache of the configuration modules discovered by a previous scan.
         """
         self._config: Dict[str, Any] = {}
-        self._autoload()
+        self._modules: List[Dict[str, str]] = []
+        self._files: List[pathlib.Path] = []
+        self._directories: List[pathlib.Path] = []
+
+        entries = manifest.section('config')
+        if entries is None:
+            self._autoload()
+        else:
+            self._loadManifest(entries)
 
     def _autoload(self) -> None:
         """
@@ -67,22 +91,57 @@ class ConfigBootstrapper(IConfigBootstrapper):
         if not base_path.exists():
             raise FileNotFoundError(f"Directory {directory} does not exist.")
 
+        self._directories.append(base_path)
         for file_path in base_path.rglob("*.py"):
+            if file_path.parent not in self._directories:
+                self._directories.append(file_path.parent)
             if file_path.name == "__init__.py":
                 continue
 
+            self._files.append(file_path)
             module_path = ".".join(file_path.relative_to(base_path).with_suffix("").parts)
 
             try:
-                module = importlib.import_module(f"{directory}.{module_path}")
+                with BootTracer.active().span(f"{directory}.{module_path}", 'import'):
+                    module = importlib.import_module(f"{directory}.{module_path}")
                 if hasattr(module, "Config"):
                     self._set(
                         concrete=getattr(module, "Config"),
                         section=module_path
                     )
+                    self._modules.append({'section': module_path, 'module': f"{directory}.{module_path}"})
             except Exception as e:
                 raise BootstrapRuntimeError(f"Error loading module {module_path}") from e
 
+    def _loadManifest(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Loads the configuration modules listed in the boot manifest.
+
+        The modules are still imported, since the configuration values are read from
+        them, but the configuration directory is not scanned.
+
+        Parameters
+        ----------
+        entries : List[Dict[str, Any]]
+            The 'config' section of the boot manifest.
+
+        Raises
+        ------
+        BootstrapRuntimeError
+            If a listed module cannot be loaded.
+        """
+        for entry in entries:
+            try:
+                with BootTracer.active().span(entry['module'], 'import'):
+                    module = importlib.import_module(entry['module'])
+                self._set(
+                    concrete=getattr(module, "Config"),
+                    section=entry['section']
+                )
+            except Exception as e:
+                raise BootstrapRuntimeError(f"Error loading module {entry.get('section')} from the boot manifest") from e
+            self._modules.append(entry)
+
     def _set(self, concrete: Any, section: str) -> None:
         """
         Validates and registers a configuration class.
@@ -97,6 +156,32 @@ class ConfigBootstrapper(IConfigBootstrapper):
         section : str
             The section name under which the configuration will be registered.
 
+        Raises
+        ------
+        TypeError
+            If the input is not a class or does not inherit from `IConfig`.
+        ValueError
+            If the class does not have a `config` attribute.
+        """
+        self._register(
+            section=section,
+            data=self._validate(concrete)
+        )
+
+    def _validate(self, concrete: Any) -> Dict[str, Any]:
+        """
+        Validates a configuration class and converts its 'config' attribute into a dictionary.
+
+        Parameters
+        ----------
+        concrete : Any
+            The configuration class.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The configuration data.
+
         Raises
         ------
         TypeError
@@ -113,10 +198,7 @@ class ConfigBootstrapper(IConfigBootstrapper):
         if not issubclass(concrete, IConfig):
             raise TypeError(f"Class {concrete.__name__} must inherit from 'IConfig'.")
 
-        self._register(
-            section=section,
-            data=self._parse(concrete.config)
-        )
+        return self._parse(concrete.config)
 
     def _parse(self, data: Any) -> Dict[str, Any]:
         """
@@ -206,4 +288,82 @@ class ConfigBootstrapper(IConfigBootstrapper):
                 return default
             raise KeyError(f"Key '{key}' not found in configuration.")
 
-        return value
\ No newline at end of file
+        return value
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Describes the configuration modules for the boot manifest.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The 'entries' of the manifest section, one per module with its section and
+            module path, and the 'files' and 'directories' scanned to discover them.
+        """
+        return {
+            'entries': list(self._modules),
+            'files': [str(path) for path in self._files],
+            'directories': [str(path) for path in self._directories]
+        }
+
+    def reload(self, files: List[str]) -> List[str]:
+        """
+        Imports again the configuration modules whose files changed.
+
+        The files outside the configuration directory are ignored. The sections of
+        the changed modules are rebuilt in a copy of the configuration, which then
+        replaces it at once: readers see either the previous or the new sections,
+        and a module failing to load leaves the configuration unchanged. The section
+        of a removed file is dropped.
+
+        Parameters
+        ----------
+        files : List[str]
+            The paths of the changed files.
+
+        Returns
+        -------
+        List[str]
+            The sections reloaded or removed.
+
+        Raises
+        ------
+        BootstrapRuntimeError
+            If a changed module cannot be loaded.
+        """
+        directory = "config"
+        base_path = pathlib.Path(directory).resolve()
+        config = dict(self._config)
+        modules = list(self._modules)
+        sources = list(self._files)
+        sections: List[str] = []
+
+        for file in files:
+            file_path = pathlib.Path(file).resolve()
+            if file_path.suffix != ".py" or file_path.name == "__init__.py" or base_path not in file_path.parents:
+                continue
+
+            section = ".".join(file_path.relative_to(base_path).with_suffix("").parts)
+            module_path = f"{directory}.{section}"
+            config.pop(section, None)
+            modules = [entry for entry in modules if entry['section'] != section]
+            sources = [path for path in sources if path != file_path]
+            sections.append(section)
+
+            if not file_path.exists():
+                ModuleReloader.unload(module_path)
+                continue
+
+            sources.append(file_path)
+            try:
+                module = ModuleReloader.load(module_path)
+                if hasattr(module, "Config"):
+                    config[section] = self._validate(getattr(module, "Config"))
+                    modules.append({'section': section, 'module': module_path})
+            except Exception as e:
+                raise BootstrapRuntimeError(f"Error reloading module {section}") from e
+
+        self._config = config
+        self._modules = modules
+        self._files = sources
+        return sections
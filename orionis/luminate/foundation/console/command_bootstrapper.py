@@ -1,52 +1,85 @@
 import pathlib
 import importlib
 import inspect
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 from orionis.luminate.contracts.foundation.console.i_command_bootstrapper import ICommandsBootstrapper
+from orionis.luminate.foundation.discovery.static_discovery import StaticDiscovery
 from orionis.luminate.foundation.exceptions.exception_bootstrapper import BootstrapRuntimeError
+from orionis.luminate.foundation.manifest.boot_manifest import BootManifest
+from orionis.luminate.foundation.reload.module_reloader import ModuleReloader
+from orionis.luminate.foundation.tracing.boot_tracer import BootTracer
 from orionis.luminate.console.base.command import BaseCommand
 
 class CommandsBootstrapper(ICommandsBootstrapper):
     """
     A class responsible for loading and registering console commands dynamically.
 
-    This class scans specified directories for Python files, imports them, and registers
+    This class scans specified directories for Python files, parses them, and registers
     command classes that inherit from `BaseCommand`. It ensures that commands are loaded
-    only once and provides methods to access and manage them.
+    only once and provides methods to access and manage them. When the boot manifest is
+    valid, the commands are registered from it instead of scanning the directories. In
+    both cases, the module of each command is only imported when the command is loaded.
 
     Attributes
     ----------
     _commands : Dict[str, Dict[str, Any]]
         A dictionary to store registered commands, where the key is the command signature
         and the value is a dictionary containing the command class, arguments, description,
-        and signature.
+        signature, module and class name. The class and arguments are None until the
+        command is loaded.
 
     Methods
     -------
-    __init__()
+    __init__(manifest: BootManifest)
         Initializes the `CommandsBootstrapper` and triggers the autoload process.
     _autoload()
         Scans the command directories and loads command classes.
-    _register(concrete: Callable[..., Any])
+    _loadManifest(entries: List[Dict[str, Any]])
+        Registers the commands listed in the boot manifest without importing them.
+    _register(concrete: Callable[..., Any], commands: Optional[Dict[str, Dict[str, Any]]])
         Validates and registers a command class.
+    _registerEntry(signature: str, description: str, module: str, name: str, arguments: Any)
+        Registers a command without importing its module.
+    load(signature: str)
+        Imports the class and collects the arguments of a command.
+    describe()
+        Describes the registered commands for the boot manifest.
+    reload(files: List[str])
+        Imports again the developer commands whose files changed.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, manifest: BootManifest) -> None:
         """
         Initializes the `CommandsBootstrapper` and triggers the autoload process.
 
         The `_commands` dictionary is initialized to store command data, and the
-        `_autoload` method is called to load commands from the specified directories.
+        commands are loaded from the boot manifest when it is valid, or by the
+        `_autoload` method from the specified directories otherwise.
+
+        Parameters
+        ----------
+        manifest : BootManifest
+            The cache of the commands discovered by a previous scan.
         """
         self._commands: Dict[str, Dict[str, Any]] = {}
-        self._autoload()
+        self._files: List[pathlib.Path] = []
+        self._directories: List[pathlib.Path] = []
+        self._discovery = StaticDiscovery(manifest.cachePath(StaticDiscovery.CACHE_FILE))
+
+        entries = manifest.section('commands')
+        if entries is None:
+            self._autoload()
+        else:
+            self._loadManifest(entries)
 
     def _autoload(self) -> None:
         """
         Scans the command directories and loads command classes.
 
-        This method searches for Python files in the specified directories, imports them,
-        and registers any class that inherits from `BaseCommand`.
+        This method searches for Python files in the specified directories and parses
+        them, registering any class that inherits from `BaseCommand` and whose signature
+        and description are literals without importing its module. Only the modules of
+        the other commands are imported, to read their attributes.
 
         Raises
         ------
@@ -65,27 +98,137 @@ class CommandsBootstrapper(ICommandsBootstrapper):
             if not cmd_dir.is_dir():
                 continue
 
-            for file_path in cmd_dir.rglob("*.py"):
+            self._directories.append(cmd_dir)
+            files: List[pathlib.Path] = []
+            for file_path in sorted(cmd_dir.rglob("*.py")):
+                if file_path.parent not in self._directories:
+                    self._directories.append(file_path.parent)
                 if file_path.name == "__init__.py":
                     continue
-
-                module_path = ".".join(file_path.relative_to(base_path).with_suffix("").parts)
-
-                # Remove 'site-packages.' prefix if present
-                if 'site-packages.' in module_path:
-                    module_path = module_path.split('site-packages.')[1]
-
+                files.append(file_path)
+            self._files.extend(files)
+
+            # Commands whose attributes are not literals are read from their module
+            dynamic_modules: List[str] = []
+            for entry in self._discovery.discover(files, 'BaseCommand'):
+                module_path = self._modulePath(pathlib.Path(entry['file']), base_path)
+                signature = entry['attributes'].get('signature')
+                description = entry['attributes'].get('description')
+                if isinstance(signature, str) and isinstance(description, str):
+                    self._registerEntry(signature.strip(), description.strip(), module_path, entry['class'])
+                elif module_path not in dynamic_modules:
+                    dynamic_modules.append(module_path)
+
+            for module_path in dynamic_modules:
                 try:
-                    module = importlib.import_module(module_path.strip())
+                    with BootTracer.active().span(module_path, 'import'):
+                        module = importlib.import_module(module_path)
 
                     # Find and register command classes
                     for name, concrete in inspect.getmembers(module, inspect.isclass):
-                        if issubclass(concrete, BaseCommand) and concrete is not BaseCommand:
-                            self._register(concrete)
+                        if issubclass(concrete, BaseCommand) and concrete is not BaseCommand and concrete.__module__ == module.__name__:
+                            if not any(command['module'] == module_path and command['class'] == name for command in self._commands.values()):
+                                self._register(concrete)
                 except Exception as e:
                     raise BootstrapRuntimeError(f"Error loading {module_path}") from e
 
-    def _register(self, concrete: Callable[..., Any]) -> None:
+    def _modulePath(self, file_path: pathlib.Path, base_path: pathlib.Path) -> str:
+        """
+        Converts the path of a command file into the path of its module.
+
+        Parameters
+        ----------
+        file_path : pathlib.Path
+            The path of the command file.
+        base_path : pathlib.Path
+            The directory the modules are imported from.
+
+        Returns
+        -------
+        str
+            The dotted module path.
+        """
+        module_path = ".".join(file_path.relative_to(base_path).with_suffix("").parts)
+
+        # Remove 'site-packages.' prefix if present
+        if 'site-packages.' in module_path:
+            module_path = module_path.split('site-packages.')[1]
+
+        return module_path.strip()
+
+    def _loadManifest(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Registers the commands listed in the boot manifest without importing them.
+
+        The signature, description, module and class name of each command are taken
+        from the manifest, so neither the directories are scanned nor the command
+        modules imported until a command is loaded with `load()`.
+
+        Parameters
+        ----------
+        entries : List[Dict[str, Any]]
+            The 'commands' section of the boot manifest.
+        """
+        for entry in entries:
+            self._registerEntry(entry['signature'], entry['description'], entry['module'], entry['class'], entry['arguments'])
+
+    def _registerEntry(self, signature: str, description: str, module: str, name: str, arguments: Any = None) -> None:
+        """
+        Registers a command without importing its module.
+
+        Parameters
+        ----------
+        signature : str
+            The command signature.
+        description : str
+            The command description.
+        module : str
+            The path of the module defining the command.
+        name : str
+            The name of the command class.
+        arguments : Any, optional
+            The arguments of the command as stored in the boot manifest, collected
+            from the command when it is loaded if None.
+
+        Raises
+        ------
+        ValueError
+            If the signature is invalid or already registered.
+        """
+        self._validateSignature(signature)
+        self._commands[signature] = {
+            'concrete': None,
+            'arguments': None,
+            'encoded_arguments': arguments,
+            'description': description,
+            'signature': signature,
+            'module': module,
+            'class': name
+        }
+
+    def _validateSignature(self, signature: str, commands: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """
+        Validates the format and the uniqueness of a command signature.
+
+        Parameters
+        ----------
+        signature : str
+            The command signature.
+        commands : Dict[str, Dict[str, Any]], optional
+            The registry the signature must be unique in, the registered commands by default.
+
+        Raises
+        ------
+        ValueError
+            If the signature is invalid or already registered.
+        """
+        if not signature or ' ' in signature or not all(c.isalnum() or c == ":" for c in signature):
+            raise ValueError(f"Invalid signature format: '{signature}'. Only letters, numbers, and ':' are allowed, with no spaces.")
+
+        if signature in (self._commands if commands is None else commands):
+            raise ValueError(f"Command '{signature}' is already registered. Please ensure signatures are unique.")
+
+    def _register(self, concrete: Callable[..., Any], commands: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
         """
         Validates and registers a command class.
 
@@ -97,6 +240,8 @@ class CommandsBootstrapper(ICommandsBootstrapper):
         ----------
         concrete : Callable[..., Any]
             The command class to register.
+        commands : Dict[str, Dict[str, Any]], optional
+            The registry the command is added to, the registered commands by default.
 
         Raises
         ------
@@ -114,9 +259,8 @@ class CommandsBootstrapper(ICommandsBootstrapper):
 
         signature = concrete.signature.strip()
 
-        # Validate signature format
-        if not signature or ' ' in signature or not all(c.isalnum() or c == ":" for c in signature):
-            raise ValueError(f"Invalid signature format: '{signature}'. Only letters, numbers, and ':' are allowed, with no spaces.")
+        # Validate signature format and uniqueness
+        self._validateSignature(signature, commands)
 
         # Validate 'description' attribute
         if not hasattr(concrete, 'description') or not isinstance(concrete.description, str):
@@ -128,31 +272,81 @@ class CommandsBootstrapper(ICommandsBootstrapper):
         if not hasattr(concrete, 'handle') or not callable(getattr(concrete, 'handle')):
             raise ValueError(f"Class {concrete.__name__} must implement a 'handle' method.")
 
-        # Validate 'arguments' method (optional)
-        arguments: List[Any] = []
-        if hasattr(concrete, 'arguments') and callable(getattr(concrete, 'arguments')):
-            arguments = concrete().arguments()
-
         # Validate inheritance from 'BaseCommand'
         if not issubclass(concrete, BaseCommand):
             raise TypeError(f"Class {concrete.__name__} must inherit from 'BaseCommand'.")
 
-        # Ensure the command signature is unique
-        if signature in self._commands:
-            raise ValueError(f"Command '{signature}' is already registered. Please ensure signatures are unique.")
-
-        # Register the command
-        self._commands[signature] = {
+        # Register the command, its arguments are collected when it is loaded
+        (self._commands if commands is None else commands)[signature] = {
             'concrete': concrete,
-            'arguments': arguments,
+            'arguments': None,
+            'encoded_arguments': None,
             'description': description,
-            'signature': signature
+            'signature': signature,
+            'module': concrete.__module__,
+            'class': concrete.__name__
         }
 
+    def load(self, signature: str) -> Dict[str, Any]:
+        """
+        Imports the class and collects the arguments of a command.
+
+        Only the module of the requested command is imported. The arguments are
+        restored from the boot manifest when it stored them, and otherwise retrieved
+        by instantiating the command and calling its `arguments` method.
+
+        Parameters
+        ----------
+        signature : str
+            The command signature to load.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The command data, with its class and arguments.
+
+        Raises
+        ------
+        KeyError
+            If the command signature is not found.
+        BootstrapRuntimeError
+            If the command cannot be loaded.
+        """
+        if signature not in self._commands:
+            raise KeyError(f"Command '{signature}' not found.")
+
+        command = self._commands[signature]
+        if command['arguments'] is not None:
+            return command
+
+        try:
+            concrete = command['concrete']
+            if concrete is None:
+                with BootTracer.active().span(command['module'], 'import'):
+                    concrete = getattr(importlib.import_module(command['module']), command['class'])
+                if not isinstance(concrete, type) or not issubclass(concrete, BaseCommand):
+                    raise TypeError(f"Class {command['class']} must inherit from 'BaseCommand'.")
+
+            if command['encoded_arguments'] is not None:
+                arguments = BootManifest.decode(command['encoded_arguments'])
+            elif callable(getattr(concrete, 'arguments', None)):
+                arguments = concrete().arguments()
+            else:
+                arguments = []
+        except Exception as e:
+            raise BootstrapRuntimeError(f"Error loading command '{signature}' from {command['module']}") from e
+
+        command['concrete'] = concrete
+        command['arguments'] = arguments
+        return command
+
     def get(self, signature: str = None) -> Dict[str, Any]:
         """
         Retrieves a registered command by its signature.
 
+        A single command is loaded before being returned. Without a signature, every
+        registered command is returned as is, without importing any of them.
+
         Parameters
         ----------
         signature : str
@@ -170,6 +364,100 @@ class CommandsBootstrapper(ICommandsBootstrapper):
         """
         if signature is None:
             return self._commands
-        if signature not in self._commands:
-            raise KeyError(f"Command '{signature}' not found.")
-        return self._commands[signature]
\ No newline at end of file
+        return self.load(signature)
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Describes the registered commands for the boot manifest.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The 'entries' of the manifest section, one per command with its signature,
+            description, arguments, module and class name, and the 'files' and
+            'directories' scanned to discover them.
+        """
+        entries = []
+        for signature in self._commands:
+            command = self.load(signature)
+            try:
+                arguments = BootManifest.encode(command['arguments'])
+            except ValueError:
+                arguments = None
+            entries.append({
+                'signature': signature,
+                'description': command['description'],
+                'arguments': arguments,
+                'module': command['module'],
+                'class': command['class']
+            })
+        return {
+            'entries': entries,
+            'files': [str(path) for path in self._files],
+            'directories': [str(path) for path in self._directories]
+        }
+
+    def reload(self, files: List[str]) -> Dict[str, List[str]]:
+        """
+        Imports again the developer commands whose files changed.
+
+        Only the files of the developer command directory are considered. The
+        commands of each changed module are removed from a copy of the registry and
+        registered again from the reloaded module, then the copy replaces the
+        registry at once, so a module failing to load leaves every command unchanged.
+        The commands of a removed file are dropped.
+
+        Parameters
+        ----------
+        files : List[str]
+            The paths of the changed files.
+
+        Returns
+        -------
+        Dict[str, List[str]]
+            The signatures of the commands 'loaded' from the changed modules, and of
+            those 'removed' since they are no longer defined.
+
+        Raises
+        ------
+        BootstrapRuntimeError
+            If a changed module cannot be loaded.
+        """
+        base_path = pathlib.Path.cwd()
+        cmd_dir = base_path / "app" / "console" / "commands"
+        commands = dict(self._commands)
+        sources = list(self._files)
+        loaded: List[str] = []
+        removed: List[str] = []
+
+        for file in files:
+            file_path = pathlib.Path(file).resolve()
+            if file_path.suffix != ".py" or file_path.name == "__init__.py" or cmd_dir not in file_path.parents:
+                continue
+
+            module_path = self._modulePath(file_path, base_path)
+            for signature in [signature for signature, command in commands.items() if command['module'] == module_path]:
+                del commands[signature]
+                removed.append(signature)
+            sources = [path for path in sources if path != file_path]
+
+            if not file_path.exists():
+                ModuleReloader.unload(module_path)
+                continue
+
+            sources.append(file_path)
+            try:
+                module = ModuleReloader.load(module_path)
+                for name, concrete in inspect.getmembers(module, inspect.isclass):
+                    if issubclass(concrete, BaseCommand) and concrete is not BaseCommand and concrete.__module__ == module.__name__:
+                        self._register(concrete, commands)
+                        loaded.append(concrete.signature.strip())
+            except Exception as e:
+                raise BootstrapRuntimeError(f"Error reloading {module_path}") from e
+
+        self._commands = commands
+        self._files = sources
+        return {
+            'loaded': loaded,
+            'removed': [signature for signature in removed if signature not in loaded]
+        }
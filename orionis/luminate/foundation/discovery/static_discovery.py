@@ -0,0 +1,294 @@
+import ast
+import json
+import os
+import pathlib
+from typing import Any, Dict, List, Optional, Tuple
+
+class StaticDiscovery:
+    """
+    Finds subclasses of a base class by parsing source files, without importing them.
+
+    Each file is parsed with `ast`, and every top-level class is recorded with the
+    names of its bases and its class attributes whose value is a literal (strings,
+    numbers, booleans, and containers of them). Subclasses are then resolved by name
+    across all the scanned files, so indirect subclasses are found as well, and they
+    inherit the literal attributes of their scanned parents. No module code runs.
+
+    The result of parsing each file is kept in a JSON cache with its content hash. A
+    file whose modification time and size are unchanged is not read again, and a file
+    whose content hash is known, even under another path, is not parsed again. When
+    many files must be parsed, they are distributed across a process pool.
+
+    Parameters
+    ----------
+    cache_path : str, optional
+        The location of the cache file. Nothing is cached if None.
+    max_workers : int, optional
+        The maximum number of processes parsing files, one per CPU by default. With
+        a single worker, files are always parsed in the current process.
+    """
+
+    # Number of files to parse above which a process pool is used
+    PARALLEL_THRESHOLD = 64
+
+    # Format of the cache file, caches of other versions are ignored
+    VERSION = 1
+
+    # Name of the cache file, stored next to the boot manifest
+    CACHE_FILE = 'discovery.json'
+
+    def __init__(self, cache_path: Optional[str] = None, max_workers: Optional[int] = None) -> None:
+        self._cache_path = cache_path
+        self._max_workers = max_workers
+
+    def discover(self, files: List[str], base: str) -> List[Dict[str, Any]]:
+        """
+        Find the classes deriving from a base class in source files.
+
+        Parameters
+        ----------
+        files : List[str]
+            The paths of the files to scan.
+        base : str
+            The name of the base class, as written in the source files.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            One entry per subclass, in file and definition order, with the 'file' it is
+            defined in, its 'class' name, its literal 'attributes' (including those
+            inherited from scanned parents), and the names of the attributes whose
+            value is not a literal in 'dynamic'.
+        """
+        files = [str(path) for path in files]
+        parsed = self._parseAll(files)
+
+        # Index every class found, then resolve which of them derive from the base
+        classes: Dict[str, Dict[str, Any]] = {}
+        for path in files:
+            for definition in parsed[path]:
+                classes.setdefault(definition['class'], definition)
+
+        entries = []
+        for path in files:
+            for definition in parsed[path]:
+                chain = self._ancestors(definition, classes, base)
+                if chain is None:
+                    continue
+                attributes: Dict[str, Any] = {}
+                dynamic: List[str] = []
+                for ancestor in reversed(chain):
+                    for name in ancestor['dynamic']:
+                        attributes.pop(name, None)
+                        dynamic.append(name)
+                    for name, value in ancestor['attributes'].items():
+                        attributes[name] = value
+                        if name in dynamic:
+                            dynamic.remove(name)
+                entries.append({
+                    'file': path,
+                    'class': definition['class'],
+                    'attributes': attributes,
+                    'dynamic': dynamic
+                })
+        return entries
+
+    def _ancestors(self, definition: Dict[str, Any], classes: Dict[str, Dict[str, Any]], base: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Retrieve the chain of scanned classes from a class up to the base class.
+
+        Parameters
+        ----------
+        definition : Dict[str, Any]
+            The parsed class.
+        classes : Dict[str, Dict[str, Any]]
+            Every parsed class, by name.
+        base : str
+            The name of the base class.
+
+        Returns
+        -------
+        Optional[List[Dict[str, Any]]]
+            The class followed by its scanned ancestors, or None if it does not derive
+            from the base class (the base class itself included).
+        """
+        chain = [definition]
+        seen = {definition['class']}
+        current = definition
+        while True:
+            if base in current['bases']:
+                # The base class itself may be defined in the scanned files
+                if base in classes and base not in seen:
+                    chain.append(classes[base])
+                return chain
+            parent = next((name for name in current['bases'] if name in classes and name not in seen), None)
+            if parent is None:
+                return None
+            seen.add(parent)
+            current = classes[parent]
+            chain.append(current)
+
+    def _parseAll(self, files: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Parse files, reusing the cached result of the unchanged ones.
+
+        Parameters
+        ----------
+        files : List[str]
+            The paths of the files to parse.
+
+        Returns
+        -------
+        Dict[str, List[Dict[str, Any]]]
+            The classes defined in each file.
+        """
+        cache = self._readCache()
+        changed = False
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        pending: List[Tuple[str, str, List[int]]] = []
+        hashes = {entry['hash']: entry['classes'] for entry in cache.values()}
+
+        for path in files:
+            stat = os.stat(path)
+            signature = [stat.st_mtime_ns, stat.st_size]
+            cached = cache.get(path)
+            if cached is not None and cached['stat'] == signature:
+                results[path] = cached['classes']
+                continue
+
+            # Imported on first use, nothing is hashed while the cache is up to date
+            import hashlib
+            with open(path, 'rb') as file:
+                digest = hashlib.sha1(file.read()).hexdigest()
+            if digest in hashes:
+                cache[path] = {'hash': digest, 'stat': signature, 'classes': hashes[digest]}
+                results[path] = hashes[digest]
+                changed = True
+                continue
+
+            pending.append((path, digest, signature))
+
+        if pending:
+            paths = [path for path, _, _ in pending]
+            if len(paths) >= self.PARALLEL_THRESHOLD and self._max_workers != 1:
+                # Imported on first use, multiprocessing is only needed by large trees
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+                    parsed = list(executor.map(StaticDiscovery.parse, paths, chunksize=16))
+            else:
+                parsed = [StaticDiscovery.parse(path) for path in paths]
+
+            for (path, digest, signature), classes in zip(pending, parsed):
+                cache[path] = {'hash': digest, 'stat': signature, 'classes': classes}
+                results[path] = classes
+            changed = True
+
+        if changed:
+            self._writeCache(cache)
+        return results
+
+    @staticmethod
+    def parse(path: str) -> List[Dict[str, Any]]:
+        """
+        Parse the top-level classes of a source file.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            One entry per class with its 'class' name, the original names of its
+            'bases' (resolving aliased imports), its literal 'attributes' and the names
+            of its 'dynamic' attributes, whose value cannot be known without running
+            the module. A file with a syntax error defines no class.
+        """
+        with open(path, 'rb') as file:
+            source = file.read()
+        try:
+            tree = ast.parse(source, filename=path)
+        except (SyntaxError, ValueError):
+            return []
+
+        # Names imported under an alias, such as 'from x import BaseCommand as Command'
+        aliases: Dict[str, str] = {}
+        for node in tree.body:
+            if isinstance(node, ast.ImportFrom):
+                for alias in node.names:
+                    if alias.asname:
+                        aliases[alias.asname] = alias.name
+
+        classes = []
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+
+            bases = []
+            for expression in node.bases:
+                if isinstance(expression, ast.Name):
+                    bases.append(aliases.get(expression.id, expression.id))
+                elif isinstance(expression, ast.Attribute):
+                    bases.append(expression.attr)
+
+            attributes: Dict[str, Any] = {}
+            dynamic: List[str] = []
+            for statement in node.body:
+                if isinstance(statement, ast.Assign):
+                    targets = [target.id for target in statement.targets if isinstance(target, ast.Name)]
+                    value = statement.value
+                elif isinstance(statement, ast.AnnAssign) and isinstance(statement.target, ast.Name) and statement.value is not None:
+                    targets = [statement.target.id]
+                    value = statement.value
+                else:
+                    continue
+                try:
+                    literal = ast.literal_eval(value)
+                    json.dumps(literal)
+                except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                    for name in targets:
+                        attributes.pop(name, None)
+                        if name not in dynamic:
+                            dynamic.append(name)
+                    continue
+                for name in targets:
+                    attributes[name] = literal
+                    if name in dynamic:
+                        dynamic.remove(name)
+
+            classes.append({'class': node.name, 'bases': bases, 'attributes': attributes, 'dynamic': dynamic})
+        return classes
+
+    def _readCache(self) -> Dict[str, Any]:
+        """
+        Read the cached results of previous parses.
+        """
+        if self._cache_path is None:
+            return {}
+        try:
+            with open(self._cache_path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != self.VERSION:
+            return {}
+        return data.get('files', {})
+
+    def _writeCache(self, cache: Dict[str, Any]) -> None:
+        """
+        Persist the parse results, forgetting the files that no longer exist.
+
+        The cache is only an optimization, so failing to write it is ignored.
+        """
+        if self._cache_path is None:
+            return
+        files = {path: entry for path, entry in cache.items() if os.path.exists(path)}
+        try:
+            pathlib.Path(self._cache_path).parent.mkdir(parents=True, exist_ok=True)
+            temporary = f"{self._cache_path}.{os.getpid()}.tmp"
+            with open(temporary, 'w', encoding='utf-8') as file:
+                json.dump({'version': self.VERSION, 'files': files}, file)
+            os.replace(temporary, self._cache_path)
+        except OSError:
+            pass
@@ -8,7 +8,7 @@ class EnvironmentBootstrapper(IEnvironmentBootstrapper):
 
     This class implements the `IEnvironment` interface and provides functionality to
     automatically load environment variables from a `.env` file located in the current
-    working directory. If the file does not exist, it creates it.
+    working directory. A missing file defines no variable.
 
     Attributes
     ----------
@@ -22,7 +22,7 @@ class EnvironmentBootstrapper(IEnvironmentBootstrapper):
     __init__()
         Initializes the `EnvironmentBootstrapper` and triggers the autoload process.
     _autoload()
-        Loads environment variables from the `.env` file or creates the file if it does not exist.
+        Loads environment variables from the `.env` file, if it exists.
     """
 
     def __init__(self) -> None:
@@ -37,11 +37,11 @@ class EnvironmentBootstrapper(IEnvironmentBootstrapper):
 
     def _autoload(self) -> None:
         """
-        Loads environment variables from the `.env` file or creates the file if it does not exist.
+        Loads environment variables from the `.env` file, if it exists.
 
         This method checks if the `.env` file exists in the current working directory.
-        If the file does not exist, it creates an empty `.env` file. If the file exists,
-        it loads the environment variables into the `_environment_vars` dictionary.
+        If the file exists, it loads the environment variables into the
+        `_environment_vars` dictionary, without creating it otherwise.
         """
         environment_service = EnvironmentService()
         self._environment_vars = environment_service.all()
@@ -0,0 +1,275 @@
+import importlib
+import json
+import os
+import pathlib
+from typing import Any, Dict, List, Optional
+from orionis.luminate.contracts.foundation.manifest.i_boot_manifest import IBootManifest
+
+class BootManifest(IBootManifest):
+    """
+    A persisted cache of the commands, providers and configuration modules found at boot.
+
+    Discovering them requires walking several directories, importing every module and
+    inspecting its members. The `optimize` command stores the result of that discovery
+    in `bootstrap/cache/manifest.json`, together with the modification time and size of
+    every scanned file and the modification time of every scanned directory, so the
+    bootstrappers can load each entry directly while none of them has changed. Any
+    difference, such as an edited, added or removed file, makes the whole manifest
+    stale, and the bootstrappers scan the directories again.
+
+    Parameters
+    ----------
+    path : str, optional
+        The location of the manifest file, `bootstrap/cache/manifest.json` under the
+        current working directory by default.
+    """
+
+    # Format of the manifest file, manifests of other versions are ignored
+    VERSION = 1
+
+    # Marker of the values stored as a reference to an importable class or function
+    _REFERENCE = '__ref__'
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self._path = os.path.abspath(path or os.path.join('bootstrap', 'cache', 'manifest.json'))
+        self._data: Optional[Dict[str, Any]] = None
+        self._loaded = False
+
+    def path(self) -> str:
+        """
+        Retrieve the location of the manifest file.
+
+        Returns
+        -------
+        str
+            The absolute path of the manifest file.
+        """
+        return self._path
+
+    def cachePath(self, name: str) -> str:
+        """
+        Retrieve the location of another cache file stored next to the manifest.
+
+        Parameters
+        ----------
+        name : str
+            The name of the cache file.
+
+        Returns
+        -------
+        str
+            The absolute path of the cache file.
+        """
+        return os.path.join(os.path.dirname(self._path), name)
+
+    def _load(self) -> Optional[Dict[str, Any]]:
+        """
+        Read and validate the manifest file once.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            The content of the manifest, or None if it is missing, unreadable or stale.
+        """
+        if self._loaded:
+            return self._data
+
+        self._loaded = True
+        self._data = None
+
+        try:
+            with open(self._path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get('version') != self.VERSION:
+            return None
+
+        # Only stat calls are needed to tell whether the sources have changed
+        try:
+            for path, (mtime, size) in data['files'].items():
+                stat = os.stat(path)
+                if stat.st_mtime_ns != mtime or stat.st_size != size:
+                    return None
+            for path, mtime in data['directories'].items():
+                if os.stat(path).st_mtime_ns != mtime:
+                    return None
+        except (OSError, KeyError, TypeError, ValueError):
+            return None
+
+        self._data = data
+        return data
+
+    def isValid(self) -> bool:
+        """
+        Check whether the manifest exists and matches the files it was generated from.
+
+        Returns
+        -------
+        bool
+            True if the manifest can be used instead of scanning the directories.
+        """
+        return self._load() is not None
+
+    def section(self, name: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Retrieve the entries of a section of the manifest.
+
+        Parameters
+        ----------
+        name : str
+            The name of the section, such as 'commands', 'providers' or 'config'.
+
+        Returns
+        -------
+        Optional[List[Dict[str, Any]]]
+            The entries of the section, or None if the manifest is missing, stale or
+            does not contain the section.
+        """
+        data = self._load()
+        if data is None:
+            return None
+        return data.get('sections', {}).get(name)
+
+    def write(self, sections: Dict[str, Dict[str, Any]]) -> str:
+        """
+        Persist the manifest.
+
+        The file is written next to its final location and moved into place, so a
+        concurrent boot never reads a partially written manifest.
+
+        Parameters
+        ----------
+        sections : Dict[str, Dict[str, Any]]
+            The description of each section, as returned by the `describe()` method
+            of the bootstrappers: its 'entries', and the 'files' and 'directories'
+            they were discovered from.
+
+        Returns
+        -------
+        str
+            The path of the written manifest.
+        """
+        # Create the cache directory first, it may be inside a scanned directory
+        pathlib.Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+
+        files: Dict[str, List[int]] = {}
+        directories: Dict[str, int] = {}
+        for description in sections.values():
+            for path in description['files']:
+                stat = os.stat(path)
+                files[str(path)] = [stat.st_mtime_ns, stat.st_size]
+            for path in description['directories']:
+                directories[str(path)] = os.stat(path).st_mtime_ns
+
+        data = {
+            'version': self.VERSION,
+            'files': files,
+            'directories': directories,
+            'sections': {name: description['entries'] for name, description in sections.items()}
+        }
+
+        temporary = f"{self._path}.{os.getpid()}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=4)
+        os.replace(temporary, self._path)
+
+        self._loaded = False
+        return self._path
+
+    def clear(self) -> bool:
+        """
+        Remove the manifest file.
+
+        Returns
+        -------
+        bool
+            True if a manifest was removed.
+        """
+        self._loaded = False
+        self._data = None
+        try:
+            os.remove(self._path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    @classmethod
+    def encode(cls, value: Any) -> Any:
+        """
+        Convert a value into its JSON representation.
+
+        Besides the JSON types, tuples are stored as lists, and classes and functions
+        (such as the `type` option of a command argument) as a reference to the module
+        attribute they can be imported from.
+
+        Parameters
+        ----------
+        value : Any
+            The value to convert.
+
+        Returns
+        -------
+        Any
+            A value that can be serialized as JSON.
+
+        Raises
+        ------
+        ValueError
+            If the value, or any value it contains, cannot be represented.
+        """
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, (list, tuple)):
+            return [cls.encode(item) for item in value]
+        if isinstance(value, dict):
+            if not all(isinstance(key, str) for key in value):
+                raise ValueError(f"Only dictionaries with string keys can be stored, got {value!r}.")
+            return {key: cls.encode(item) for key, item in value.items()}
+
+        module = getattr(value, '__module__', None)
+        qualname = getattr(value, '__qualname__', None)
+        if module and qualname:
+            reference = f"{module}:{qualname}"
+            try:
+                if cls._resolve(reference) is value:
+                    return {cls._REFERENCE: reference}
+            except (ImportError, AttributeError):
+                pass
+
+        raise ValueError(f"The value {value!r} cannot be stored in the boot manifest.")
+
+    @classmethod
+    def decode(cls, value: Any) -> Any:
+        """
+        Rebuild a value converted by `encode()`.
+
+        Parameters
+        ----------
+        value : Any
+            The JSON representation of the value.
+
+        Returns
+        -------
+        Any
+            The original value, with tuples restored as lists.
+        """
+        if isinstance(value, list):
+            return [cls.decode(item) for item in value]
+        if isinstance(value, dict):
+            if len(value) == 1 and cls._REFERENCE in value:
+                return cls._resolve(value[cls._REFERENCE])
+            return {key: cls.decode(item) for key, item in value.items()}
+        return value
+
+    @staticmethod
+    def _resolve(reference: str) -> Any:
+        """
+        Import the object designated by a 'module:qualified.name' reference.
+        """
+        module_name, qualname = reference.split(':', 1)
+        target = importlib.import_module(module_name)
+        for attribute in qualname.split('.'):
+            target = getattr(target, attribute)
+        return target
@@ -0,0 +1,352 @@
+import gc
+import os
+import signal
+import sys
+import time
+import traceback
+import weakref
+from typing import Any, Callable, Dict, List, Optional
+
+class PreforkWorker:
+    """
+    The state of a worker process forked by a `PreforkSupervisor`.
+
+    The target of the supervisor receives its worker, counts each job it completes
+    with `jobDone()` and returns once `shouldStop()` is true, so the supervisor can
+    replace it with a fresh copy of the booted application.
+
+    Parameters
+    ----------
+    index : int
+        The slot of the worker, from 0 to the number of workers minus one.
+    max_jobs : int, optional
+        The number of jobs after which the worker is replaced.
+    max_memory : int, optional
+        The resident memory, in bytes, above which the worker is replaced.
+    """
+
+    def __init__(self, index: int, max_jobs: Optional[int] = None, max_memory: Optional[int] = None) -> None:
+        self.index = index
+        self.max_jobs = max_jobs
+        self.max_memory = max_memory
+        self.jobs = 0
+        self._parent = os.getppid()
+        self._stopping = False
+
+    def jobDone(self) -> None:
+        """
+        Count a completed job.
+        """
+        self.jobs += 1
+
+    def stop(self) -> None:
+        """
+        Ask the worker to return once its current job is completed.
+        """
+        self._stopping = True
+
+    def shouldStop(self) -> bool:
+        """
+        Check whether the worker must return.
+
+        Returns
+        -------
+        bool
+            True once the worker has been asked to stop, its supervisor is gone, or
+            it reached its job or memory limit.
+        """
+        if self._stopping or os.getppid() != self._parent:
+            return True
+        if self.max_jobs is not None and self.jobs >= self.max_jobs:
+            return True
+        return self.max_memory is not None and self.memory() > self.max_memory
+
+    @staticmethod
+    def memory() -> int:
+        """
+        Retrieve the resident memory of the current process.
+
+        Returns
+        -------
+        int
+            The resident set size in bytes, or the peak resident size where
+            `/proc` is not available.
+        """
+        try:
+            with open('/proc/self/statm', 'rb') as file:
+                return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError, IndexError):
+            import resource
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return peak if sys.platform == 'darwin' else peak * 1024
+
+class PreforkSupervisor:
+    """
+    Forks worker processes sharing the memory of a booted application.
+
+    The application is booted once in the supervisor, then every worker is forked
+    from it and starts with the container, the loaded modules and the compiled
+    resolution plans already in place, sharing their memory pages with the
+    supervisor until they are written to. Before forking, the objects alive are
+    moved to the permanent generation with `gc.freeze()`, so the garbage collector
+    of the workers never walks them and their pages stay shared.
+
+    Workers are forked again when they exit, immediately when they return after
+    reaching their job or memory limit, after an increasing delay when they crash.
+    Threads do not survive a fork, so the services owning threads or handles that
+    must be reopened register a hook with `afterFork()`, run in every new worker.
+
+    Parameters
+    ----------
+    target : Callable[[PreforkWorker], Any]
+        The function run by each worker. The worker exits with status 0 when it
+        returns and 1 when it raises.
+    workers : int
+        The number of worker processes.
+    max_jobs : int, optional
+        The number of jobs after which a worker is replaced.
+    max_memory : int, optional
+        The resident memory, in bytes, above which a worker is replaced.
+    freeze : bool, optional
+        Whether to freeze the objects of the supervisor before forking.
+    """
+
+    # Longest delay, in seconds, before forking again a worker that keeps crashing
+    MAX_RESTART_DELAY = 5.0
+
+    # Hooks run in every worker after the fork
+    _hooks: List[Callable[[], Optional[Callable[..., Any]]]] = []
+
+    def __init__(
+        self,
+        target: Callable[[PreforkWorker], Any],
+        workers: int,
+        max_jobs: Optional[int] = None,
+        max_memory: Optional[int] = None,
+        freeze: bool = True
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"At least one worker is required, got {workers}.")
+        self._target = target
+        self._workers = workers
+        self._max_jobs = max_jobs
+        self._max_memory = max_memory
+        self._freeze = freeze
+        self._pids: Dict[int, int] = {}
+        self._crashes: Dict[int, int] = {}
+        self._pending: Dict[int, float] = {}
+        self._restarts = {'recycled': 0, 'crashed': 0}
+        self._stopping = False
+
+    @classmethod
+    def afterFork(cls, hook: Callable[[], Any]) -> None:
+        """
+        Register a function to run in every worker right after it is forked.
+
+        Bound methods are held weakly, so registering the method of a service does
+        not keep it alive, and the hook is dropped once the service is collected.
+        A hook already registered is not added again.
+
+        Parameters
+        ----------
+        hook : Callable[[], Any]
+            The function to run.
+        """
+        cls._hooks[:] = [reference for reference in cls._hooks if reference() is not None]
+        if any(reference() == hook for reference in cls._hooks):
+            return
+
+        if hasattr(hook, '__self__') and hasattr(hook, '__func__'):
+            cls._hooks.append(weakref.WeakMethod(hook))
+        else:
+            cls._hooks.append(lambda: hook)
+
+    @classmethod
+    def runForkHooks(cls) -> None:
+        """
+        Run the hooks registered with `afterFork()`, forgetting the collected ones.
+        """
+        alive = []
+        for reference in cls._hooks:
+            hook = reference()
+            if hook is None:
+                continue
+            alive.append(reference)
+            hook()
+        cls._hooks[:] = alive
+
+    def pids(self) -> List[int]:
+        """
+        Retrieve the process ids of the running workers.
+
+        Returns
+        -------
+        List[int]
+            The process ids, by worker slot.
+        """
+        return [self._pids[index] for index in sorted(self._pids)]
+
+    def getRestarts(self) -> Dict[str, int]:
+        """
+        Retrieve how many workers have been forked again.
+
+        Returns
+        -------
+        Dict[str, int]
+            The number of workers replaced after reaching a limit ('recycled') and
+            after crashing ('crashed').
+        """
+        return dict(self._restarts)
+
+    def start(self) -> None:
+        """
+        Freeze the objects of the supervisor and fork every worker.
+        """
+        if self._freeze:
+            gc.collect()
+            gc.freeze()
+        for index in range(self._workers):
+            self._fork(index)
+
+    def supervise(self, timeout: float = 0.5) -> None:
+        """
+        Reap the workers that exited and fork their replacements.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The number of seconds to wait for a worker to exit.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            self._reap()
+            now = time.monotonic()
+            for index, due in list(self._pending.items()):
+                if due <= now and not self._stopping:
+                    del self._pending[index]
+                    self._fork(index)
+            if now >= deadline or self._stopping:
+                return
+            time.sleep(min(0.05, deadline - now))
+
+    def run(self) -> None:
+        """
+        Fork the workers and keep them running until SIGTERM or SIGINT is received.
+        """
+        previous = {
+            number: signal.signal(number, lambda *_: setattr(self, '_stopping', True))
+            for number in (signal.SIGTERM, signal.SIGINT)
+        }
+        try:
+            self.start()
+            while not self._stopping:
+                self.supervise()
+        finally:
+            self.stop()
+            for number, handler in previous.items():
+                signal.signal(number, handler)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Ask every worker to stop and wait for them to exit.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The number of seconds to wait before killing the remaining workers.
+        """
+        self._stopping = True
+        self._pending.clear()
+        for pid in self._pids.values():
+            self._signal(pid, signal.SIGTERM)
+
+        deadline = time.monotonic() + timeout
+        while self._pids and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.01)
+        for pid in self._pids.values():
+            self._signal(pid, signal.SIGKILL)
+        self._reap(block=True)
+
+        if self._freeze:
+            gc.unfreeze()
+
+    def _fork(self, index: int) -> None:
+        """
+        Fork the worker of a slot.
+
+        Parameters
+        ----------
+        index : int
+            The slot of the worker.
+        """
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        # SIGTERM is blocked until the worker has installed its handler, so a worker
+        # stopped right after the fork still stops gracefully
+        signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGTERM})
+        pid = os.fork()
+        if pid:
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGTERM})
+            self._pids[index] = pid
+            return
+
+        # In the worker, only the target runs and the process never returns to the caller
+        status = 1
+        try:
+            worker = PreforkWorker(index, self._max_jobs, self._max_memory)
+            signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGTERM})
+            self.runForkHooks()
+            self._target(worker)
+            status = 0
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(status)
+
+    def _reap(self, block: bool = False) -> None:
+        """
+        Collect the exit status of the workers that exited and schedule their replacement.
+
+        Only the worker processes are waited for, other children of the supervisor
+        are left to their owner.
+
+        Parameters
+        ----------
+        block : bool, optional
+            Whether to wait until every worker exits.
+        """
+        for index, pid in list(self._pids.items()):
+            try:
+                waited, status = os.waitpid(pid, 0 if block else os.WNOHANG)
+            except ChildProcessError:
+                waited, status = pid, 0
+            if waited == 0:
+                continue
+            del self._pids[index]
+
+            if os.waitstatus_to_exitcode(status) == 0:
+                self._restarts['recycled'] += 1
+                self._crashes[index] = 0
+                delay = 0.0
+            else:
+                self._restarts['crashed'] += 1
+                self._crashes[index] = self._crashes.get(index, 0) + 1
+                delay = min(0.1 * 2 ** (self._crashes[index] - 1), self.MAX_RESTART_DELAY)
+            if not self._stopping:
+                self._pending[index] = time.monotonic() + delay
+
+    @staticmethod
+    def _signal(pid: int, number: int) -> None:
+        """
+        Send a signal to a worker that may already have exited.
+        """
+        try:
+            os.kill(pid, number)
+        except ProcessLookupError:
+            pass
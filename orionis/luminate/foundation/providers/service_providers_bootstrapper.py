@@ -1,25 +1,39 @@
 import importlib
-import inspect
 import pathlib
+from typing import Any, Dict, List
 from orionis.luminate.contracts.foundation.providers.i_service_providers_bootstrapper import IServiceProvidersBootstrapper
 from orionis.luminate.container.container import Container
+from orionis.luminate.foundation.discovery.static_discovery import StaticDiscovery
 from orionis.luminate.foundation.exceptions.exception_bootstrapper import BootstrapRuntimeError
+from orionis.luminate.foundation.manifest.boot_manifest import BootManifest
+from orionis.luminate.foundation.tracing.boot_tracer import BootTracer
 from orionis.luminate.providers.service_provider import ServiceProvider
 
 class ServiceProvidersBootstrapper(IServiceProvidersBootstrapper):
 
-    def __init__(self, container : Container) -> None:
+    def __init__(self, container : Container, manifest : BootManifest) -> None:
         self._container = container
         self._before_providers = []
         self._after_providers = []
-        self._autoload()
+        self._deferred_providers = []
+        self._providers: List[type] = []
+        self._files: List[pathlib.Path] = []
+        self._directories: List[pathlib.Path] = []
+        self._discovery = StaticDiscovery(manifest.cachePath(StaticDiscovery.CACHE_FILE))
+
+        entries = manifest.section('providers')
+        if entries is None:
+            self._autoload()
+        else:
+            self._loadManifest(entries)
 
     def _autoload(self) -> None:
         """
         Scans the provider directories and loads provider classes.
 
-        This method searches for Python files in the specified directories, imports them,
-        and registers any class that inherits from `ServiceProvider`.
+        This method searches for Python files in the specified directories and parses
+        them to find the classes that inherit from `ServiceProvider`. Only the modules
+        defining a provider are imported, to register it.
 
         Raises
         ------
@@ -37,40 +51,72 @@ class ServiceProvidersBootstrapper(IServiceProvidersBootstrapper):
             if not cmd_dir.is_dir():
                 continue
 
-            for file_path in cmd_dir.rglob("*.py"):
+            self._directories.append(cmd_dir)
+            files: List[pathlib.Path] = []
+            for file_path in sorted(cmd_dir.rglob("*.py")):
+                if file_path.parent not in self._directories:
+                    self._directories.append(file_path.parent)
                 if file_path.name == "__init__.py":
                     continue
+                files.append(file_path)
+            self._files.extend(files)
 
-                module_path = ".".join(file_path.relative_to(base_path).with_suffix("").parts)
+            for entry in self._discovery.discover(files, 'ServiceProvider'):
+                module_path = ".".join(pathlib.Path(entry['file']).relative_to(base_path).with_suffix("").parts)
 
                 # Remove 'site-packages.' prefix if present
                 if 'site-packages.' in module_path:
                     module_path = module_path.split('site-packages.')[1]
 
                 try:
-                    module = importlib.import_module(module_path.strip())
-
-                    # Find and register command classes
-                    for name, concrete in inspect.getmembers(module, inspect.isclass):
-                        if issubclass(concrete, ServiceProvider) and concrete is not ServiceProvider:
-                            self._register(concrete)
+                    with BootTracer.active().span(module_path.strip(), 'import'):
+                        concrete = getattr(importlib.import_module(module_path.strip()), entry['class'])
                 except Exception as e:
                     raise BootstrapRuntimeError(f"Error loading {module_path}") from e
 
+                if isinstance(concrete, type) and issubclass(concrete, ServiceProvider):
+                    self._register(concrete)
+
+    def _loadManifest(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Loads the provider classes listed in the boot manifest, in the same order.
+
+        Parameters
+        ----------
+        entries : List[Dict[str, Any]]
+            The 'providers' section of the boot manifest.
+
+        Raises
+        ------
+        BootstrapRuntimeError
+            If a listed class cannot be loaded.
+        """
+        for entry in entries:
+            try:
+                with BootTracer.active().span(entry['module'], 'import'):
+                    concrete = getattr(importlib.import_module(entry['module']), entry['class'])
+            except Exception as e:
+                raise BootstrapRuntimeError(f"Error loading {entry.get('module')} from the boot manifest") from e
+            self._register(concrete)
+
     def _register(self, concrete: ServiceProvider) -> None:
         """
         Validates and registers a service provider class.
 
         This method ensures that the provided class is valid (inherits from `ServiceProvider`,
         has a `register` and `boot` method) and registers it in the
-        `_service_providers` dictionary.
+        `_service_providers` dictionary. Deferred providers are kept apart, since
+        they are only loaded when one of their services is requested.
 
         Parameters
         ----------
         concrete : ServiceProvider
             The service provider class to register
         """
-        if concrete.beferoBootstrapping:
+        self._providers.append(concrete)
+        if concrete.deferred:
+            self._deferred_providers.append(concrete)
+        elif concrete.beferoBootstrapping:
             self._before_providers.append(concrete)
         else:
             self._after_providers.append(concrete)
@@ -95,4 +141,32 @@ class ServiceProvidersBootstrapper(IServiceProvidersBootstrapper):
         list
             A list of registered service providers
         """
-        return self._after_providers
\ No newline at end of file
+        return self._after_providers
+
+    def getDeferredServiceProviders(self) -> list:
+        """
+        Retrieve the service providers loaded on first use of their services.
+
+        Returns
+        -------
+        list
+            A list of deferred service providers
+        """
+        return self._deferred_providers
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Describe the registered service providers for the boot manifest.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The 'entries' of the manifest section, one per provider with its module and
+            class name in registration order, and the 'files' and 'directories' scanned
+            to discover them.
+        """
+        return {
+            'entries': [{'module': concrete.__module__, 'class': concrete.__name__} for concrete in self._providers],
+            'files': [str(path) for path in self._files],
+            'directories': [str(path) for path in self._directories]
+        }
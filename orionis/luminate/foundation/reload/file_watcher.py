@@ -0,0 +1,282 @@
+import os
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+class FileWatcher:
+    """
+    Watches source files and reports those added, modified or removed.
+
+    The watcher keeps a compact index of the watched files, mapping each path to
+    its modification time in nanoseconds and its size, and compares it with a new
+    scan to find the changed files. On Linux, the kernel notifies the watcher
+    through inotify, so it only scans when something changed; elsewhere, or when
+    inotify cannot be used, it scans every `interval` seconds.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        The files and directories to watch, directories being watched recursively.
+        Paths that do not exist yet are watched once created.
+    interval : float, optional
+        The number of seconds between two scans when polling.
+    suffixes : Tuple[str, ...], optional
+        The file extensions watched in directories.
+    backend : str, optional
+        'inotify', 'poll' or 'auto' to use inotify when available.
+    """
+
+    # Directories never watched
+    IGNORED_DIRECTORIES = {'__pycache__', 'node_modules', 'venv'}
+
+    # Events reported by inotify: modify, attrib, close_write, moved_from, moved_to,
+    # create, delete, delete_self and move_self
+    INOTIFY_MASK = 0x02 | 0x04 | 0x08 | 0x40 | 0x80 | 0x100 | 0x200 | 0x400 | 0x800
+
+    # Seconds during which the events following a first one are coalesced
+    DEBOUNCE = 0.05
+
+    def __init__(
+        self,
+        paths: Iterable[str],
+        interval: float = 1.0,
+        suffixes: Tuple[str, ...] = ('.py',),
+        backend: str = 'auto'
+    ) -> None:
+        if backend not in ('auto', 'inotify', 'poll'):
+            raise ValueError(f"Unknown file watcher backend '{backend}'.")
+        self._paths = [os.path.abspath(path) for path in paths]
+        self._interval = interval
+        self._suffixes = tuple(suffixes)
+        self._inotify = None
+        self._watches: Dict[str, int] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+        if backend != 'poll':
+            self._inotify = self._openInotify()
+            if self._inotify is None and backend == 'inotify':
+                raise OSError("inotify is not available on this platform.")
+
+        self._index = self.scan()
+
+    def backend(self) -> str:
+        """
+        Retrieve the mechanism detecting the changes.
+
+        Returns
+        -------
+        str
+            'inotify' or 'poll'.
+        """
+        return 'poll' if self._inotify is None else 'inotify'
+
+    def scan(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Index the watched files.
+
+        Returns
+        -------
+        Dict[str, Tuple[int, int]]
+            The modification time in nanoseconds and the size of each file, by path.
+        """
+        index: Dict[str, Tuple[int, int]] = {}
+
+        # The kernel drops the watch of a removed directory, so it is added again once recreated
+        for directory in [directory for directory in self._watches if not os.path.isdir(directory)]:
+            del self._watches[directory]
+
+        for path in self._paths:
+            if os.path.isfile(path):
+                self._indexFile(index, path)
+                self._watch(os.path.dirname(path))
+                continue
+
+            # The nearest existing parent is watched, to notice the path being created
+            if not os.path.isdir(path):
+                self._watch(self._existingParent(path))
+                continue
+
+            for directory, subdirectories, files in os.walk(path):
+                subdirectories[:] = [
+                    name for name in subdirectories
+                    if name not in self.IGNORED_DIRECTORIES and not name.startswith('.')
+                ]
+                self._watch(directory)
+                for name in files:
+                    if name.endswith(self._suffixes):
+                        self._indexFile(index, os.path.join(directory, name))
+        return index
+
+    def poll(self) -> List[str]:
+        """
+        Scan the watched files and retrieve those changed since the previous scan.
+
+        Returns
+        -------
+        List[str]
+            The paths added, modified or removed, sorted.
+        """
+        index = self.scan()
+        previous, self._index = self._index, index
+        return sorted(
+            path for path in previous.keys() | index.keys()
+            if previous.get(path) != index.get(path)
+        )
+
+    def wait(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Wait for watched files to change.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum number of seconds to wait, forever if None.
+
+        Returns
+        -------
+        List[str]
+            The changed paths, empty if none changed in time or the watcher was stopped.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._stopping.is_set():
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            step = self._interval if remaining is None else min(self._interval, remaining)
+
+            if self._inotify is None:
+                self._stopping.wait(step)
+            elif self._readEvents(step):
+                # Editors write a file in several steps, which are reported together
+                self._stopping.wait(self.DEBOUNCE)
+                self._readEvents(0)
+            elif deadline is None or time.monotonic() < deadline:
+                continue
+
+            changes = self.poll()
+            if changes or (deadline is not None and time.monotonic() >= deadline):
+                return changes
+        return []
+
+    def start(self, callback: Callable[[List[str]], None]) -> None:
+        """
+        Watch the files on a background thread, calling a function on every change.
+
+        An exception raised by the function is printed, and watching goes on.
+
+        Parameters
+        ----------
+        callback : Callable[[List[str]], None]
+            The function receiving the changed paths.
+        """
+        if self._thread is not None:
+            return
+
+        def run():
+            while not self._stopping.is_set():
+                changes = self.wait()
+                if not changes:
+                    continue
+                try:
+                    callback(changes)
+                except Exception:
+                    import traceback
+                    traceback.print_exc()
+
+        self._stopping.clear()
+        self._thread = threading.Thread(target=run, name='orionis-file-watcher', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop watching and release the inotify descriptor.
+        """
+        self._stopping.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        if self._inotify is not None:
+            os.close(self._inotify[0])
+            self._inotify = None
+            self._watches.clear()
+
+    def _indexFile(self, index: Dict[str, Tuple[int, int]], path: str) -> None:
+        """
+        Add a file to an index, unless it disappeared meanwhile.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        index[path] = (stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _existingParent(path: str) -> str:
+        """
+        Retrieve the nearest existing directory containing a path.
+        """
+        parent = os.path.dirname(path)
+        while parent and not os.path.isdir(parent) and parent != os.path.dirname(parent):
+            parent = os.path.dirname(parent)
+        return parent
+
+    def _openInotify(self) -> Optional[Tuple[int, object]]:
+        """
+        Open an inotify descriptor through the C library.
+
+        Returns
+        -------
+        Optional[Tuple[int, object]]
+            The descriptor and the library, or None if inotify is not available.
+        """
+        if not sys.platform.startswith('linux'):
+            return None
+        try:
+            import ctypes
+            import ctypes.util
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            descriptor = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if descriptor < 0:
+            return None
+        return descriptor, libc
+
+    def _watch(self, directory: str) -> None:
+        """
+        Ask inotify to report the events of a directory, once.
+        """
+        if self._inotify is None or not directory or directory in self._watches:
+            return
+        descriptor, libc = self._inotify
+        watch = libc.inotify_add_watch(descriptor, os.fsencode(directory), self.INOTIFY_MASK)
+        if watch >= 0:
+            self._watches[directory] = watch
+
+    def _readEvents(self, timeout: float) -> bool:
+        """
+        Wait for inotify events and discard them, the index telling what changed.
+
+        Parameters
+        ----------
+        timeout : float
+            The maximum number of seconds to wait.
+
+        Returns
+        -------
+        bool
+            True if any event was received.
+        """
+        import select
+        descriptor = self._inotify[0]
+        received = False
+        while select.select([descriptor], [], [], timeout)[0]:
+            try:
+                if not os.read(descriptor, 65536):
+                    break
+            except BlockingIOError:
+                break
+            received = True
+            timeout = 0
+        return received
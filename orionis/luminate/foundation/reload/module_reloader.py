@@ -0,0 +1,69 @@
+import importlib
+import importlib.util
+import os
+import sys
+from types import ModuleType
+
+class ModuleReloader:
+    """
+    Imports the current version of application modules whose source changed.
+    """
+
+    @staticmethod
+    def load(name: str) -> ModuleType:
+        """
+        Import a module, or execute its source again if it is already imported.
+
+        The module object is reused by `importlib.reload()`, so the modules holding a
+        reference to it see the new definitions. `importlib.reload()` executes the new
+        source over the previous namespace, so the names the module defined are cleared
+        first, and a class renamed or removed from the source is no longer found in it;
+        the previous namespace is restored if the new source fails to execute. Its
+        cached bytecode is also removed: the cache is validated with the modification
+        time in whole seconds and the size of the source, which may not change when a
+        file is edited twice within the same second.
+
+        Parameters
+        ----------
+        name : str
+            The dotted path of the module.
+
+        Returns
+        -------
+        ModuleType
+            The imported module.
+        """
+        importlib.invalidate_caches()
+        module = sys.modules.get(name)
+        if module is None:
+            return importlib.import_module(name)
+
+        source = getattr(module, '__file__', None)
+        if source and source.endswith('.py'):
+            try:
+                os.unlink(importlib.util.cache_from_source(source))
+            except (OSError, NotImplementedError):
+                pass
+
+        namespace = dict(module.__dict__)
+        for key in [key for key in namespace if not (key.startswith('__') and key.endswith('__'))]:
+            del module.__dict__[key]
+        try:
+            return importlib.reload(module)
+        except BaseException:
+            module.__dict__.clear()
+            module.__dict__.update(namespace)
+            raise
+
+    @staticmethod
+    def unload(name: str) -> None:
+        """
+        Forget a module whose source was removed, so it is no longer importable.
+
+        Parameters
+        ----------
+        name : str
+            The dotted path of the module.
+        """
+        sys.modules.pop(name, None)
+        importlib.invalidate_caches()
@@ -0,0 +1,224 @@
+import json
+import os
+import pathlib
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+class BootTracer:
+    """
+    Records how long each phase of the application boot takes.
+
+    Every phase runs inside a span, and nested spans (a provider booting inside the
+    providers phase, a module imported by a bootstrapper) are kept with their parent,
+    so each span reports both its total time and its self time, the part not spent
+    in nested spans. The spans can be exported in the Chrome trace event format, to
+    be opened in `chrome://tracing` or Perfetto.
+
+    Instrumented code reaches the tracer through `BootTracer.active()`, which returns
+    a tracer that records nothing unless one has been activated, so tracing costs a
+    single attribute lookup when it is disabled.
+    """
+
+    # Tracer receiving the spans of the current boot, if any
+    _active: Optional['BootTracer'] = None
+
+    def __init__(self) -> None:
+        self._spans: List[Dict[str, Any]] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._stacks = threading.local()
+
+    @classmethod
+    def active(cls) -> 'BootTracer':
+        """
+        Retrieve the tracer of the current boot.
+
+        Returns
+        -------
+        BootTracer
+            The activated tracer, or a tracer recording nothing.
+        """
+        return cls._active or _DISABLED
+
+    @classmethod
+    def activate(cls, tracer: 'BootTracer') -> 'BootTracer':
+        """
+        Make a tracer receive the spans of the instrumented code.
+
+        Parameters
+        ----------
+        tracer : BootTracer
+            The tracer to activate.
+
+        Returns
+        -------
+        BootTracer
+            The activated tracer.
+        """
+        cls._active = tracer
+        return tracer
+
+    @classmethod
+    def deactivate(cls) -> None:
+        """
+        Stop recording spans.
+        """
+        cls._active = None
+
+    def enabled(self) -> bool:
+        """
+        Check whether the tracer records spans.
+
+        Returns
+        -------
+        bool
+            True for tracers created by the application, False for the disabled one.
+        """
+        return True
+
+    @contextmanager
+    def span(self, name: str, category: str = 'boot', **args: Any) -> Iterator[None]:
+        """
+        Measure the code run inside a `with` block.
+
+        Parameters
+        ----------
+        name : str
+            The name of the span, such as a provider or a module.
+        category : str, optional
+            The kind of span, such as 'provider', 'bootstrapper' or 'import'.
+        **args : Any
+            Details attached to the span in the exported trace.
+        """
+        stack = getattr(self._stacks, 'spans', None)
+        if stack is None:
+            stack = self._stacks.spans = []
+
+        record = {
+            'name': name,
+            'category': category,
+            'args': args,
+            'start': time.perf_counter() - self._origin,
+            'duration': 0.0,
+            'children': 0.0,
+            'thread': threading.get_ident(),
+            'depth': len(stack)
+        }
+        stack.append(record)
+        try:
+            yield
+        finally:
+            stack.pop()
+            record['duration'] = time.perf_counter() - self._origin - record['start']
+            if stack:
+                stack[-1]['children'] += record['duration']
+            with self._lock:
+                self._spans.append(record)
+
+    def getSpans(self) -> List[Dict[str, Any]]:
+        """
+        Retrieve the recorded spans, in the order they started.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            One entry per span with its 'name', 'category', 'args', 'start' (seconds
+            since the tracer was created), 'duration' and 'self' time in seconds, and
+            its nesting 'depth'.
+        """
+        with self._lock:
+            spans = sorted(self._spans, key=lambda record: record['start'])
+        return [
+            {
+                'name': record['name'],
+                'category': record['category'],
+                'args': dict(record['args']),
+                'start': record['start'],
+                'duration': record['duration'],
+                'self': max(record['duration'] - record['children'], 0.0),
+                'depth': record['depth']
+            }
+            for record in spans
+        ]
+
+    def summary(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Retrieve the spans sorted from the slowest to the fastest.
+
+        Parameters
+        ----------
+        limit : int, optional
+            The maximum number of spans to return.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The spans, as returned by `getSpans()`, by decreasing self time.
+        """
+        spans = sorted(self.getSpans(), key=lambda span: (span['self'], span['duration']), reverse=True)
+        return spans if limit is None else spans[:limit]
+
+    def toChromeTrace(self) -> Dict[str, Any]:
+        """
+        Convert the spans into the Chrome trace event format.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A JSON serializable trace made of complete ('X') events, in microseconds.
+        """
+        with self._lock:
+            spans = list(self._spans)
+        pid = os.getpid()
+        return {
+            'traceEvents': [
+                {
+                    'name': record['name'],
+                    'cat': record['category'],
+                    'ph': 'X',
+                    'ts': round(record['start'] * 1e6, 3),
+                    'dur': round(record['duration'] * 1e6, 3),
+                    'pid': pid,
+                    'tid': record['thread'],
+                    'args': {key: str(value) for key, value in record['args'].items()}
+                }
+                for record in sorted(spans, key=lambda record: record['start'])
+            ],
+            'displayTimeUnit': 'ms'
+        }
+
+    def export(self, path: str) -> str:
+        """
+        Write the spans to a Chrome trace file.
+
+        Parameters
+        ----------
+        path : str
+            The location of the trace file, whose directories are created if needed.
+
+        Returns
+        -------
+        str
+            The absolute path of the trace file.
+        """
+        path = os.path.abspath(path)
+        pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.toChromeTrace(), file)
+        return path
+
+class _DisabledBootTracer(BootTracer):
+    """
+    A tracer discarding every span, used while no boot is being traced.
+    """
+
+    def enabled(self) -> bool:
+        return False
+
+    def span(self, name: str, category: str = 'boot', **args: Any) -> ContextManager[None]:
+        return _NO_SPAN
+
+_NO_SPAN = nullcontext()
+_DISABLED = _DisabledBootTracer()
@@ -1,8 +1,12 @@
+from orionis.luminate.providers.log.log_service_provider import LogServiceProvider
 from orionis.luminate.providers.service_provider import ServiceProvider
 from orionis.luminate.services.commands.reactor_commands_service import ReactorCommandsService
 
 class ReactorCommandsServiceProvider(ServiceProvider):
 
+    # The reactor logs every command it runs
+    dependencies = [LogServiceProvider]
+
     def register(self) -> None:
         """
         Registers services or bindings into the given container.
@@ -1,13 +1,26 @@
 from orionis.luminate.providers.service_provider import ServiceProvider
-from orionis.luminate.services.commands.scheduler_service import ScheduleService
 
 class ScheduleServiceProvider(ServiceProvider):
 
+    deferred = True
+
+    # The services are given by key, so the scheduler (and APScheduler) is only
+    # imported when the provider is loaded.
+    provides = ['orionis.luminate.services.commands.scheduler_service.ScheduleService']
+
     def register(self) -> None:
         """
         Registers services or bindings into the given container.
         """
-        self._container_id = self.app.scoped(ScheduleService)
+        from orionis.luminate.foundation.prefork.prefork_supervisor import PreforkSupervisor
+        from orionis.luminate.services.commands.scheduler_service import ScheduleService
+
+        # A singleton, since every instance starts a scheduler thread that a scope
+        # would never shut down
+        self._container_id = self.app.singleton(ScheduleService)
+
+        # A single hook restarts every schedule, whatever the number of containers
+        PreforkSupervisor.afterFork(ScheduleService.restartAfterFork)
 
     def boot(self,) -> None:
         """
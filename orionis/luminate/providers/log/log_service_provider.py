@@ -1,8 +1,12 @@
+from orionis.luminate.providers.config.config_service_provider import ConfigServiceProvider
 from orionis.luminate.providers.service_provider import ServiceProvider
 from orionis.luminate.services.log.log_service import LogguerService
 
 class LogServiceProvider(ServiceProvider):
 
+    # The logger reads its channels from the configuration
+    dependencies = [ConfigServiceProvider]
+
     def register(self) -> None:
         """
         Registers services or bindings into the given container.
@@ -14,6 +14,18 @@ class ServiceProvider(IServiceProvider):
     # Indicates whether the service provider is a bootstrapper.
     beferoBootstrapping = False
 
+    # Indicates whether the service provider is registered and booted only when
+    # one of the services it provides is first requested from the container.
+    deferred = False
+
+    # The service classes registered by a deferred service provider.
+    provides = []
+
+    # The service providers (classes, or their qualified or class names) that must
+    # be registered and booted before this one is registered. Providers that do not
+    # depend on each other are registered in turn, then booted concurrently.
+    dependencies = []
+
 
     def __init__(self, app : Container) -> None:
         """
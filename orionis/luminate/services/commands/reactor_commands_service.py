@@ -1,13 +1,15 @@
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from orionis.luminate.contracts.services.commands.i_reactor_commands_service import IReactorCommandsService
 from orionis.luminate.foundation.console.command_bootstrapper import CommandsBootstrapper
 from orionis.luminate.console.base.command import BaseCommand
 from orionis.luminate.console.command_filter import CommandFilter
+from orionis.luminate.console.daemon.reactor_client import ReactorClient
 from orionis.luminate.console.exceptions.cli_exception import CLIOrionisException
 from orionis.luminate.console.output.console import Console
 from orionis.luminate.console.output.executor import Executor
 from orionis.luminate.console.parser import Parser
+from orionis.luminate.container.lazy import Lazy
 from orionis.luminate.facades.app_facade import app
 from orionis.luminate.facades.log.log_facade import Log
 
@@ -26,14 +28,15 @@ class ReactorCommandsService(IReactorCommandsService):
         commands_bootstrapper: CommandsBootstrapper,
         command_filter: CommandFilter,
         log: Log,
-        executor: Executor,
-        console: Console,
+        executor: Lazy[Executor],
+        console: Lazy[Console],
     ):
         """
         Initializes the ReactorCommandsService instance.
 
         Assigns provided services to internal attributes for later use in command
-        execution, filtering, and logging.
+        execution, filtering, and logging. The executor and console are injected
+        lazily, since most runs only need them to report failures or progress.
         """
         self.commands_bootstrapper = commands_bootstrapper
         self.command_filter = command_filter
@@ -76,6 +79,11 @@ class ReactorCommandsService(IReactorCommandsService):
         """
         Executes the specified command with the provided arguments.
 
+        The command runs inside its own container scope, so scoped services are
+        isolated from other commands and scheduled jobs running concurrently. The
+        `handle` method is called through the container, so besides the parsed
+        arguments it can receive any service in its signature.
+
         Parameters
         ----------
         signature : str
@@ -84,9 +92,10 @@ class ReactorCommandsService(IReactorCommandsService):
             A dictionary containing named arguments for the command.
         """
 
-        command_instance: BaseCommand = app(signature)
-        command_instance.setArgs(args_dict)
-        return command_instance.handle(**self._extract_arguments(args_dict))
+        with app().scope() as container:
+            command_instance: BaseCommand = container.make(signature)
+            command_instance.setArgs(args_dict)
+            return container.call(command_instance.handle, self._extract_arguments(args_dict))
 
     def execute(self, signature: Optional[str] = None, vars: dict = {}, *args, **kwargs):
         """
@@ -95,6 +104,35 @@ class ReactorCommandsService(IReactorCommandsService):
         Determines if the command originates from `sys.argv` or is explicitly called,
         then executes the appropriate command pipeline, handling success and errors.
         """
+        return self._execute(signature, vars, *args, **kwargs)[1]
+
+    def run(self, argv: List[str]) -> int:
+        """
+        Executes a command given on the command line and reports its exit status.
+
+        Parameters
+        ----------
+        argv : List[str]
+            The command line, the program name followed by the signature and the
+            arguments of the command.
+
+        Returns
+        -------
+        int
+            0 if the command succeeded, 1 if it failed.
+        """
+        failed, _ = self._execute(None, {}, argv)
+        return 1 if failed else 0
+
+    def _execute(self, signature: Optional[str], vars: dict, *args, **kwargs) -> Tuple[bool, Any]:
+        """
+        Runs the command pipeline of `execute()`.
+
+        Returns
+        -------
+        Tuple[bool, Any]
+            Whether the command failed, and the output of the command.
+        """
         try:
 
             # Determine if command is excluded from running
@@ -106,9 +144,10 @@ class ReactorCommandsService(IReactorCommandsService):
 
             # Extract signature and arguments from command-line input
             if sys_argv:
-                if not args or len(args[0]) <= 1:
+                # The boot profiling flag was already handled by the reactor client
+                args_list = [arg for arg in args[0] if arg != ReactorClient.PROFILE_BOOT_FLAG] if args else []
+                if len(args_list) <= 1:
                     raise CLIOrionisException("No command signature specified. Please provide a valid command to execute.")
-                args_list = args[0]
                 signature, *args = args_list[1:]
 
             # Log command execution
@@ -136,7 +175,7 @@ class ReactorCommandsService(IReactorCommandsService):
                 self.console_executor.done(program=signature, time=f"{elapsed_time}s")
 
             # Return command output
-            return output
+            return False, output
 
         except ValueError as e:
             # Handle parsing errors
@@ -146,6 +185,7 @@ class ReactorCommandsService(IReactorCommandsService):
                 elapsed_time = round(time.perf_counter() - start_time, 2)
                 self.console_executor.fail(program=signature or "Unknown", time=f"{elapsed_time}s")
             self.console_output.exception(e)
+            return True, None
 
         except Exception as e:
             # Handle unexpected execution errors
@@ -155,4 +195,5 @@ class ReactorCommandsService(IReactorCommandsService):
                 elapsed_time = round(time.perf_counter() - start_time, 2)
                 self.console_executor.fail(program=signature or "Unknown", time=f"{elapsed_time}s")
             self.console_output.exception(e)
+            return True, None
 
@@ -2,8 +2,9 @@ import logging
 import re
 import sys
 import time
+import weakref
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
@@ -28,6 +29,9 @@ class ScheduleService(IScheduleService):
         Defines a command to execute.
     """
 
+    # The running schedules, restarted together in a forked worker
+    _instances: 'weakref.WeakSet[ScheduleService]' = weakref.WeakSet()
+
     def __init__(self, apscheduler_background : BackgroundScheduler, logger_level=logging.CRITICAL):
         """
         Initializes the Schedule object.
@@ -44,6 +48,42 @@ class ScheduleService(IScheduleService):
         self.scheduler.start()
         self.callback = None
         self.wait = True
+        self._rescheduling = False
+        ScheduleService._instances.add(self)
+
+    @classmethod
+    def restartAfterFork(cls) -> None:
+        """
+        Restarts the scheduler of every schedule still alive in a forked worker.
+
+        The provider registers this method once as a hook of the prefork supervisor,
+        rather than each instance registering its own.
+        """
+        for schedule in list(cls._instances):
+            schedule._restartAfterFork()
+
+    def _restartAfterFork(self):
+        """
+        Restarts the scheduler in a forked worker.
+
+        The thread of the scheduler does not survive the fork, so a new scheduler is
+        started in the worker with the jobs scheduled so far.
+        """
+        if not self.scheduler.running:
+            return
+        jobs = self.scheduler.get_jobs()
+        self.scheduler = type(self.scheduler)()
+        for job in jobs:
+            self.scheduler.add_job(
+                job.func,
+                trigger=job.trigger,
+                args=job.args,
+                kwargs=job.kwargs,
+                id=job.id,
+                name=job.name,
+                next_run_time=job.next_run_time
+            )
+        self.scheduler.start()
 
     def command(self, signature: str, vars: dict[str, Any] = {}, *args: Any, **kwargs: Any) -> 'ScheduleService':
         """
@@ -69,7 +109,7 @@ class ScheduleService(IScheduleService):
             try:
                 Command.call(signature, vars, *args, **kwargs)
             finally:
-                if not self.scheduler.get_jobs():
+                if not self.scheduler.get_jobs() and not self._rescheduling:
                     self.wait = False
 
         self.callback = func
@@ -599,6 +639,29 @@ class ScheduleService(IScheduleService):
 
         self._resetCallback()
 
+    def reschedule(self, define: Callable[[], Any]) -> None:
+        """
+        Replaces every scheduled job with those defined by a function.
+
+        The scheduler keeps running, so the jobs being executed complete normally and
+        the worker does not stop while the jobs are replaced.
+
+        Parameters
+        ----------
+        define : Callable[[], Any]
+            The function scheduling the new jobs, such as the `schedule` method of
+            the task manager.
+        """
+        self._rescheduling = True
+        try:
+            self.scheduler.remove_all_jobs()
+            self._resetCallback()
+            define()
+        finally:
+            self._rescheduling = False
+        if self.scheduler.get_jobs():
+            self.wait = True
+
     def start(self):
         """
         Starts the scheduler and stops automatically when there are no more jobs.
@@ -1,12 +1,16 @@
 import ast
 import os
+import re
 from pathlib import Path
 from typing import Any
-from dotenv import set_key, unset_key, dotenv_values
 from orionis.luminate.contracts.services.environment.i_environment_service import IEnvironmentService
 
 class EnvironmentService(IEnvironmentService):
 
+    # A line python-dotenv reads literally: an unquoted value, or a quoted one
+    # without escapes, interpolation or comment
+    SIMPLE_LINE = re.compile(r"""(?:export\s+)?([A-Za-z_][A-Za-z0-9_.]*)\s*=\s*(?:([^\s'"#$\\](?:[^'"#$\\]*[^\s'"#$\\])?)?|'([^'\\]*)'|"([^"$\\]*)")""")
+
     def __init__(self, path: str = None):
 
         """
@@ -29,13 +33,9 @@ class EnvironmentService(IEnvironmentService):
         path : str, optional
             Path to the .env file. Defaults to None.
         """
-        # Set the path to the .env file
+        # Set the path to the .env file, which is only created when a variable is set
         self.path = Path(path) if path else Path(os.getcwd()) / ".env"
 
-        # Create the .env file if it does not exist
-        if not self.path.exists():
-            self.path.touch()
-
     def get(self, key: str, default=None) -> str:
         """
         Retrieves the value of an environment variable from the .env file
@@ -55,7 +55,7 @@ class EnvironmentService(IEnvironmentService):
         """
 
         # Get the value from the .env file
-        value = dotenv_values(self.path).get(key)
+        value = self._values().get(key)
 
         # Get the value from the system environment variables if not found
         if value is None:
@@ -75,6 +75,13 @@ class EnvironmentService(IEnvironmentService):
         value : str
             The value to set.
         """
+        # Imported on first use, python-dotenv is not needed to read an empty .env file
+        from dotenv import set_key
+
+        # Create the .env file if it does not exist
+        if not self.path.exists():
+            self.path.touch()
+
         # Set the value in the .env file
         set_key(str(self.path), key, value)
 
@@ -87,6 +94,8 @@ class EnvironmentService(IEnvironmentService):
         key : str
             The key of the environment variable to remove.
         """
+        from dotenv import unset_key
+
         # Remove the key from the .env file
         unset_key(str(self.path), key)
 
@@ -103,7 +112,7 @@ class EnvironmentService(IEnvironmentService):
         env_vars = {}
 
         # Get all environment variables from the .env file
-        data =  dotenv_values(self.path)
+        data =  self._values()
         for key, value in data.items():
             # Parse the value and add it to the dictionary
             env_vars[key] = self._parse_value(value)
@@ -111,6 +120,38 @@ class EnvironmentService(IEnvironmentService):
         # Get all environment variables from the system environment variables
         return env_vars
 
+    def _values(self) -> dict:
+        """
+        Reads the variables of the .env file.
+
+        Files made of comments and `KEY=VALUE` lines whose value needs no escape,
+        interpolation or comment handling are read directly, so python-dotenv is not
+        imported at boot. Any other file is read by python-dotenv.
+
+        Returns
+        -------
+        dict
+            The raw values of the variables defined in the .env file.
+        """
+        try:
+            content = self.path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return {}
+
+        values = {}
+        for line in content.splitlines():
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            match = self.SIMPLE_LINE.fullmatch(line)
+            if match is None:
+                # Imported on first use, python-dotenv is only needed by elaborate files
+                from dotenv import dotenv_values
+                return dotenv_values(self.path)
+            key, unquoted, single, double = match.groups()
+            values[key] = next((value for value in (unquoted, single, double) if value is not None), '')
+        return values
+
     def _parse_value(self, value : Any):
 
         # Strip leading and trailing whitespace from the value
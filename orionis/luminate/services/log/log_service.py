@@ -5,6 +5,7 @@ import re
 from datetime import datetime
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 from orionis.luminate.contracts.services.log.i_log_service import ILogguerService
+from orionis.luminate.foundation.prefork.prefork_supervisor import PreforkSupervisor
 from orionis.luminate.services.config.config_service import ConfigService
 
 class LogguerService(ILogguerService):
@@ -48,6 +49,7 @@ class LogguerService(ILogguerService):
         """
         self.config_service = config_service
         self._initialize_logger()
+        PreforkSupervisor.afterFork(self.reopen)
 
     def _initialize_logger(self):
         """
@@ -189,6 +191,21 @@ class LogguerService(ILogguerService):
         except Exception as e:
             raise RuntimeError(f"Failed to initialize logger: {e}")
 
+    def reopen(self) -> None:
+        """
+        Reopens the log files of the root logger.
+
+        Called in every forked worker, so each one writes through its own file
+        descriptor instead of the one inherited from the parent. The handlers are
+        closed and open their file again on the next record. Workers still share
+        the same path, so a rotating handler in one worker renames the file under
+        the others, which keep writing to the rotated file until they rotate too.
+        """
+        for handler in logging.getLogger().handlers:
+            if isinstance(handler, logging.FileHandler):
+                handler.close()
+                handler.stream = None
+
     def info(self, message: str) -> None:
         """
         Logs an informational message.
@@ -0,0 +1,177 @@
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from orionis.luminate.console.daemon.reactor_client import ReactorClient
+from orionis.luminate.console.daemon.reactor_daemon import ReactorDaemon
+from orionis.luminate.container.container import Container
+from orionis.luminate.providers.commands.scheduler_provider import ScheduleServiceProvider
+
+class EchoReactor:
+    """Reactor stand-in printing the context it runs in."""
+
+    def run(self, argv):
+        print(f"argv={argv[1:]} env={os.environ.get('REACTOR_TEST')} cwd={os.getcwd()}")
+        print("warning", file=sys.stderr)
+        if argv[1] == 'exit':
+            raise SystemExit(3)
+        if argv[1] == 'schedule':
+            Container().make('orionis.luminate.services.commands.scheduler_service.ScheduleService')
+        return 1 if argv[1] == 'fail' else 0
+
+class TestReactorDaemon(unittest.TestCase):
+
+    def setUp(self):
+        """Start a daemon serving from a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.directory.name, 'app')
+        os.makedirs(self.root)
+        self.source = os.path.join(self.root, 'command.py')
+        with open(self.source, 'w') as file:
+            file.write("signature = 'echo'\n")
+
+        self.path = os.path.join(self.directory.name, 'reactor.sock')
+        self.daemon = ReactorDaemon(EchoReactor(), path=self.path, root=self.root, reload_interval=0.05)
+        self.reload = None
+        self.thread = threading.Thread(target=self._serve)
+        self.thread.start()
+        while not self.daemon.isRunning():
+            self.assertTrue(self.thread.is_alive())
+
+    def tearDown(self):
+        """Stop the daemon and remove the temporary directory."""
+        self.daemon.stop()
+        self.thread.join(5)
+        self.directory.cleanup()
+
+    def _serve(self):
+        """Run the daemon, recording whether it asked to be reloaded."""
+        self.reload = self.daemon.serve()
+
+    def _send(self, *argv, env=None):
+        """Forward a command to the daemon and return its exit status and output."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        request = {'argv': ['reactor', *argv], 'env': env or {}, 'cwd': self.directory.name}
+        code = ReactorClient(self.path).send(request, stdout=stdout, stderr=stderr)
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_runs_commands_in_client_context(self):
+        """Test that commands see the client environment and stream their output back."""
+        cwd, environ = os.getcwd(), dict(os.environ)
+
+        code, stdout, stderr = self._send('echo', '--flag', env={'REACTOR_TEST': 'client'})
+
+        self.assertEqual(code, 0)
+        self.assertEqual(stdout, f"argv=['echo', '--flag'] env=client cwd={self.directory.name}\n")
+        self.assertEqual(stderr, "warning\n")
+        self.assertEqual(os.getcwd(), cwd)
+        self.assertEqual(dict(os.environ), environ)
+
+    def test_reports_exit_status(self):
+        """Test that failures and explicit exits are reported to the client."""
+        self.assertEqual(self._send('fail')[0], 1)
+        self.assertEqual(self._send('exit')[0], 3)
+        self.assertEqual(self._send('echo')[0], 0)
+
+    def test_stop_request(self):
+        """Test that a stop request shuts the daemon down and removes its socket."""
+        self.assertEqual(ReactorClient(self.path).send({'control': 'stop'}), 0)
+        self.thread.join(5)
+
+        self.assertFalse(self.reload)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertIsNone(self._send('echo')[0])
+
+    def test_changed_sources_stop_for_reload(self):
+        """Test that the daemon stops to be reloaded once a source changes."""
+        with open(self.source, 'a') as file:
+            file.write("description = 'changed'\n")
+        self.thread.join(5)
+
+        self.assertTrue(self.reload)
+        self.assertIsNone(self._send('echo')[0])
+
+    def test_commands_do_not_leak_scheduler_threads(self):
+        """Test that commands resolving the schedule in their own scope share a single scheduler."""
+        Container.reset()
+        ScheduleServiceProvider(app=Container()).register()
+        running = set(threading.enumerate())
+        try:
+            for _ in range(5):
+                self.assertEqual(self._send('schedule')[0], 0)
+
+            started = [thread for thread in threading.enumerate() if thread not in running and thread.name == 'APScheduler']
+            self.assertEqual(len(started), 1)
+        finally:
+            Container().make('orionis.luminate.services.commands.scheduler_service.ScheduleService').scheduler.shutdown(wait=False)
+            Container.reset()
+
+    def test_control_commands_are_not_forwarded(self):
+        """Test that the commands managing the daemon always run in the calling process."""
+        self.assertIsNone(ReactorClient.forward(['reactor', 'daemon:stop']))
+        self.assertTrue(self.daemon.isRunning())
+
+    def test_boot_profiling_runs_in_calling_process(self):
+        """Test that a command profiling the boot is not forwarded and requests the boot trace."""
+        argv = ['reactor', 'echo', '--profile-boot']
+        with mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop('ORIONIS_PROFILE_BOOT', None)
+            self.assertIsNone(ReactorClient.forward(argv))
+            self.assertEqual(os.environ['ORIONIS_PROFILE_BOOT'], '1')
+        self.assertEqual(argv, ['reactor', 'echo', '--profile-boot'])
+
+class SlowReactor:
+    """Reactor stand-in printing the process running each command."""
+
+    def run(self, argv):
+        time.sleep(0.3)
+        print(os.getpid())
+        return 0
+
+@unittest.skipUnless(hasattr(os, 'fork'), "Forking is not supported on this platform.")
+class TestPreforkReactorDaemon(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a daemon forking its workers from the test process."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'reactor.sock')
+        self.daemon = ReactorDaemon(SlowReactor(), path=self.path, root=self.directory.name, reload_interval=0.05)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def _send(self):
+        """Forward a command to the daemon and return the process that ran it."""
+        stdout = io.StringIO()
+        code = ReactorClient(self.path).send({'argv': ['reactor', 'slow'], 'env': {}, 'cwd': self.directory.name}, stdout=stdout)
+        return code, stdout.getvalue().strip()
+
+    def test_workers_run_commands_concurrently(self):
+        """Test that forked workers run commands side by side until a stop request."""
+        results = []
+
+        def clients():
+            while not self.daemon.isRunning():
+                time.sleep(0.01)
+            threads = [threading.Thread(target=lambda: results.append(self._send())) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            ReactorClient(self.path).send({'control': 'stop'})
+
+        thread = threading.Thread(target=clients)
+        thread.start()
+        reload = self.daemon.serve(workers=2, max_jobs=10)
+        thread.join(5)
+
+        self.assertFalse(reload)
+        self.assertEqual([code for code, _ in results], [0, 0])
+        self.assertEqual(len({pid for _, pid in results}), 2)
+        self.assertNotIn(str(os.getpid()), {pid for _, pid in results})
+        self.assertFalse(os.path.exists(self.path))
@@ -0,0 +1,81 @@
+import threading
+import unittest
+from apscheduler.schedulers.background import BackgroundScheduler
+from orionis.luminate.container.container import Container
+from orionis.luminate.foundation.prefork.prefork_supervisor import PreforkSupervisor
+from orionis.luminate.providers.commands.scheduler_provider import ScheduleServiceProvider
+from orionis.luminate.services.commands.scheduler_service import ScheduleService
+
+class TestScheduleService(unittest.TestCase):
+
+    def setUp(self):
+        """Start a scheduler without jobs."""
+        self.schedule = ScheduleService(BackgroundScheduler())
+
+    def tearDown(self):
+        """Stop the scheduler."""
+        self.schedule.scheduler.shutdown(wait=False)
+
+    def test_reschedule_replaces_jobs(self):
+        """Test that rescheduling replaces every job while the scheduler keeps running."""
+        self.schedule.command('version').everyMinute()
+        self.schedule.command('help').everyFiveMinutes()
+
+        self.schedule.reschedule(lambda: self.schedule.command('version').hourly())
+
+        jobs = self.schedule.scheduler.get_jobs()
+        self.assertEqual(len(jobs), 1)
+        self.assertIn('1:00:00', str(jobs[0].trigger))
+        self.assertTrue(self.schedule.scheduler.running)
+        self.assertTrue(self.schedule.wait)
+
+    def test_failed_reschedule_keeps_waiting(self):
+        """Test that a failing definition does not stop the worker."""
+        def define():
+            raise RuntimeError("Broken task manager")
+
+        with self.assertRaises(RuntimeError):
+            self.schedule.reschedule(define)
+
+        self.assertFalse(self.schedule._rescheduling)
+        self.assertTrue(self.schedule.wait)
+
+    def test_schedules_do_not_register_fork_hooks(self):
+        """Test that creating schedules leaves the fork hooks unchanged."""
+        hooks = list(PreforkSupervisor._hooks)
+        schedules = [ScheduleService(BackgroundScheduler()) for _ in range(3)]
+        for schedule in schedules:
+            schedule.scheduler.shutdown(wait=False)
+
+        self.assertEqual(PreforkSupervisor._hooks, hooks)
+
+    def test_restart_after_fork_restarts_every_schedule(self):
+        """Test that the single fork hook gives every running schedule a new scheduler with its jobs."""
+        self.schedule.command('version').everyMinute()
+        previous = self.schedule.scheduler
+
+        ScheduleService.restartAfterFork()
+        previous.shutdown(wait=False)
+
+        self.assertIsNot(self.schedule.scheduler, previous)
+        self.assertTrue(self.schedule.scheduler.running)
+        self.assertEqual(len(self.schedule.scheduler.get_jobs()), 1)
+
+    def test_scopes_share_a_single_scheduler(self):
+        """Test that resolving the schedule in many scopes starts a single scheduler thread."""
+        Container.reset()
+        container = Container()
+        try:
+            ScheduleServiceProvider(app=container).register()
+            running = set(threading.enumerate())
+            schedules = []
+            for _ in range(5):
+                with container.scope():
+                    schedules.append(container.make(ScheduleService))
+
+            started = [thread for thread in threading.enumerate() if thread not in running and thread.name == 'APScheduler']
+            self.assertEqual(len({id(schedule) for schedule in schedules}), 1)
+            self.assertEqual(len(started), 1)
+            schedules[0].scheduler.shutdown(wait=False)
+        finally:
+            Container.reset()
@@ -0,0 +1,23 @@
+from __future__ import annotations
+from typing import Optional, Union
+from tests.container.services_example import ClockExample, ConfigExample, RepositoryExample
+
+class RegistryMeta(type):
+    """
+    A metaclass, so that the class of its classes is not `type`.
+    """
+
+class RegisteredExample(metaclass=RegistryMeta):
+    """
+    A service whose class is created by a custom metaclass.
+    """
+
+class PostponedServiceExample:
+    """
+    A service whose annotations are strings, evaluated from this module.
+    """
+
+    def __init__(self, config: ConfigExample, clock: Optional[ClockExample], source: Union[RepositoryExample, ConfigExample]):
+        self.config = config
+        self.clock = clock
+        self.source = source
@@ -0,0 +1,267 @@
+import asyncio
+from orionis.luminate.container.lazy import Lazy
+
+class ConfigExample:
+    """
+    A dependency-free service used as a leaf of the dependency graph.
+    """
+
+    def __init__(self):
+        self.values = {"name": "orionis"}
+
+class RepositoryExample:
+    """
+    A service that depends on the configuration service.
+    """
+
+    def __init__(self, config: ConfigExample):
+        self.config = config
+
+class ClockExample:
+    """
+    A second dependency-free service.
+    """
+
+    def __init__(self, timezone: str = "UTC"):
+        self.timezone = timezone
+
+class ServiceExample:
+    """
+    A service with several registered and autowired dependencies.
+    """
+
+    def __init__(self, repository: RepositoryExample, clock: ClockExample, retries: int = 3):
+        self.repository = repository
+        self.clock = clock
+        self.retries = retries
+
+class UnresolvableExample:
+    """
+    A service with a parameter that the container cannot resolve.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+class SlowSingletonExample:
+    """
+    A service with a slow, side-effecting constructor that counts its instances.
+    """
+
+    constructions = 0
+
+    def __init__(self):
+        import time
+        time.sleep(0.05)
+        SlowSingletonExample.constructions += 1
+
+class PoolExample:
+    """
+    A service whose setup requires awaiting, built by an async factory.
+    """
+
+    constructions = 0
+
+    def __init__(self, name: str):
+        self.name = name
+        PoolExample.constructions += 1
+
+async def make_pool_example(config: ConfigExample) -> PoolExample:
+    """
+    Asynchronous factory simulating the opening of a connection pool.
+    """
+    await asyncio.sleep(0.05)
+    return PoolExample(config.values["name"])
+
+class AsyncResourceExample:
+    """
+    A service whose constructor needs to await, using the awaitable-instance idiom.
+    """
+
+    def __init__(self):
+        self.ready = False
+
+    async def _open(self):
+        await asyncio.sleep(0.05)
+        self.ready = True
+        return self
+
+    def __await__(self):
+        return self._open().__await__()
+
+class DatabasePoolExample(AsyncResourceExample):
+    """
+    An I/O-bound resource simulating a database pool.
+    """
+
+class CacheClientExample(AsyncResourceExample):
+    """
+    An I/O-bound resource simulating a cache client.
+    """
+
+class QueueClientExample(AsyncResourceExample):
+    """
+    An I/O-bound resource simulating a queue connection.
+    """
+
+class SlowResourceExample:
+    """
+    A resource taking long to open, recording whether its opening was cancelled.
+    """
+
+    cancelled = False
+
+    async def _open(self):
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            SlowResourceExample.cancelled = True
+            raise
+        return self
+
+    def __await__(self):
+        return self._open().__await__()
+
+class FailingResourceExample:
+    """
+    A resource failing to open.
+    """
+
+    async def _open(self):
+        await asyncio.sleep(0.01)
+        raise ConnectionError("Connection refused")
+
+    def __await__(self):
+        return self._open().__await__()
+
+class FragileServiceExample:
+    """
+    A service whose dependencies are opened concurrently, one of them failing.
+    """
+
+    def __init__(self, slow: SlowResourceExample, failing: FailingResourceExample):
+        self.slow = slow
+        self.failing = failing
+
+class AsyncServiceExample:
+    """
+    A service with three independent I/O-bound dependencies.
+    """
+
+    def __init__(self, database: DatabasePoolExample, cache: CacheClientExample, queue: QueueClientExample):
+        self.database = database
+        self.cache = cache
+        self.queue = queue
+
+class ExpensiveExample:
+    """
+    A service that is costly to build and counts its instances.
+    """
+
+    constructions = 0
+
+    def __init__(self):
+        ExpensiveExample.constructions += 1
+        self.name = "expensive"
+
+    def ping(self) -> str:
+        return "pong"
+
+class LazyConsumerExample:
+    """
+    A service receiving an expensive dependency lazily through its annotation.
+    """
+
+    def __init__(self, expensive: Lazy[ExpensiveExample], config: ConfigExample):
+        self.expensive = expensive
+        self.config = config
+
+class CycleAExample:
+    """
+    A service depending on a service that depends back on it.
+    """
+
+    def __init__(self, b: 'CycleBExample'):
+        self.b = b
+
+class CycleBExample:
+    """
+    The other end of the circular dependency.
+    """
+
+    def __init__(self, a: CycleAExample):
+        self.a = a
+
+class ScopedRequestExample:
+    """
+    A service living for a single unit of work.
+    """
+
+class CapturingSingletonExample:
+    """
+    A singleton keeping a reference to a scoped service.
+    """
+
+    def __init__(self, request: ScopedRequestExample):
+        self.request = request
+
+class HandlerExample:
+    """
+    A command-like object whose method receives services and plain arguments.
+    """
+
+    def handle(self, config: ConfigExample, clock: ClockExample, name: str = "world"):
+        return config, clock, name
+
+    @classmethod
+    def build(cls, config: ConfigExample):
+        return cls, config
+
+class ParserExample:
+    """
+    A stateful, costly to build service that must not be shared between threads.
+    """
+
+    def __init__(self, config: ConfigExample):
+        self.config = config
+        self.table = {index: str(index) for index in range(5000)}
+        self.buffer = []
+
+    def parse(self, text: str) -> int:
+        self.buffer.append(text)
+        return len(self.buffer)
+
+def reset_parser_example(parser: ParserExample) -> None:
+    parser.buffer.clear()
+
+class BlockingResourceExample:
+    """
+    A resource whose constructor blocks on I/O, such as opening files or sockets.
+    """
+
+    def __init__(self):
+        import time
+        time.sleep(0.05)
+
+class LogHandlerExample(BlockingResourceExample):
+    """
+    A blocking resource simulating a log handler.
+    """
+
+class MailerExample(BlockingResourceExample):
+    """
+    A blocking resource simulating a mail transport.
+    """
+
+class StorageExample(BlockingResourceExample):
+    """
+    A blocking resource simulating a storage client.
+    """
+
+class BrokenExample:
+    """
+    A service whose constructor always fails.
+    """
+
+    def __init__(self, config: ConfigExample):
+        raise RuntimeError("cannot connect")
@@ -0,0 +1,571 @@
+import asyncio
+import threading
+import time
+import unittest
+from orionis.luminate.container.container import Container
+from orionis.luminate.container.exception import OrionisContainerException
+from orionis.luminate.container.lazy import LazyProxy
+from orionis.luminate.container.object_pool import ObjectPool
+from tests.container.annotations_example import PostponedServiceExample, RegisteredExample
+from tests.container.services_example import (
+    AsyncServiceExample, BrokenExample, CapturingSingletonExample, ClockExample, CycleAExample, CycleBExample, HandlerExample, ParserExample, ScopedRequestExample, ConfigExample, ExpensiveExample, FragileServiceExample, LazyConsumerExample, PoolExample, RepositoryExample, ServiceExample, SlowResourceExample,
+    SlowSingletonExample, UnresolvableExample, make_pool_example, reset_parser_example
+)
+
+class TestContainer(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a fresh container for each test."""
+        Container.reset()
+        self.container = Container()
+
+    def tearDown(self):
+        """Discard the container used by the test."""
+        Container.reset()
+
+    def test_resolves_dependencies(self):
+        """Test that registered and autowired dependencies are injected."""
+        self.container.singleton(ConfigExample)
+        self.container.transient(RepositoryExample)
+        self.container.transient(ServiceExample)
+
+        service = self.container.make(ServiceExample)
+
+        self.assertIsInstance(service.repository, RepositoryExample)
+        self.assertIsInstance(service.clock, ClockExample)
+        self.assertEqual(service.retries, 3)
+        self.assertIs(service.repository.config, self.container.make(ConfigExample))
+
+    def test_resolution_plan_is_cached(self):
+        """Test that the resolution plan is compiled once and reused."""
+        self.container.transient(ConfigExample)
+        self.container.transient(RepositoryExample)
+
+        self.container.make(RepositoryExample)
+        plan = self.container._resolution_plans[RepositoryExample]
+        self.container.make(RepositoryExample)
+
+        self.assertIs(self.container._resolution_plans[RepositoryExample], plan)
+        self.assertEqual(plan.dependencies[0].name, "config")
+        self.assertEqual(plan.dependencies[0].lifetime, "transient")
+
+    def test_resolution_plans_invalidated_on_binding(self):
+        """Test that registering a service discards the compiled plans."""
+        self.container.transient(RepositoryExample)
+        first = self.container.make(RepositoryExample)
+
+        self.container.singleton(ConfigExample)
+        second = self.container.make(RepositoryExample)
+        third = self.container.make(RepositoryExample)
+
+        self.assertIsNot(first.config, second.config)
+        self.assertIs(second.config, third.config)
+
+    def test_unresolvable_dependency(self):
+        """Test that a parameter without annotation nor default raises an error."""
+        self.container.transient(UnresolvableExample)
+        with self.assertRaises(OrionisContainerException):
+            self.container.make(UnresolvableExample)
+
+    def test_single_service_index(self):
+        """Test that every lifetime is stored in the same index with its type."""
+        self.container.bind(ConfigExample)
+        self.container.singleton(RepositoryExample)
+        self.container.instance(ClockExample())
+
+        self.assertEqual(self.container._lifetimeOf("tests.container.services_example.ConfigExample"), "binding")
+        self.assertEqual(self.container._lifetimeOf("tests.container.services_example.RepositoryExample"), "singleton")
+        self.assertEqual(self.container._lifetimeOf("tests.container.services_example.ClockExample"), "instance")
+        self.assertTrue(self.container.has(ClockExample))
+        self.assertIs(self.container.make(RepositoryExample), self.container.make(RepositoryExample))
+
+    def test_singleton_is_constructed_once_across_threads(self):
+        """Test that concurrent threads share a single singleton construction."""
+        SlowSingletonExample.constructions = 0
+        self.container.singleton(SlowSingletonExample)
+        results = []
+
+        threads = [threading.Thread(target=lambda: results.append(self.container.make(SlowSingletonExample))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(SlowSingletonExample.constructions, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        contentions = self.container.getConstructionContentions()
+        self.assertGreater(contentions["tests.container.services_example.SlowSingletonExample"], 0)
+
+    def test_scopes_isolate_scoped_instances(self):
+        """Test that each scope gets its own scoped instances, dropped on exit."""
+        self.container.scoped(ConfigExample)
+        outside = self.container.make(ConfigExample)
+
+        with self.container.scope():
+            first = self.container.make(ConfigExample)
+            self.assertIs(first, self.container.make(ConfigExample))
+            with self.container.scope():
+                self.assertIsNot(first, self.container.make(ConfigExample))
+            self.assertIs(first, self.container.make(ConfigExample))
+
+        self.assertIsNot(first, outside)
+        self.assertIs(outside, self.container.make(ConfigExample))
+
+    def test_scopes_isolate_concurrent_tasks(self):
+        """Test that concurrent asyncio tasks running their own scope do not share instances."""
+        self.container.scoped(ConfigExample)
+
+        async def unit_of_work():
+            with self.container.scope():
+                first = self.container.make(ConfigExample)
+                await asyncio.sleep(0)
+                self.assertIs(first, self.container.make(ConfigExample))
+                return first
+
+        async def main():
+            return await asyncio.gather(*(unit_of_work() for _ in range(4)))
+
+        results = asyncio.run(main())
+        self.assertEqual(len({id(result) for result in results}), 4)
+
+    def test_make_async_builds_dependencies_concurrently(self):
+        """Test that independent awaitable dependencies are built concurrently."""
+        self.container.transient(AsyncServiceExample)
+
+        start = time.perf_counter()
+        service = asyncio.run(self.container.makeAsync(AsyncServiceExample))
+        elapsed = time.perf_counter() - start
+
+        self.assertTrue(service.database.ready and service.cache.ready and service.queue.ready)
+        self.assertLess(elapsed, 0.14)
+
+    def test_make_async_singleton_is_constructed_once(self):
+        """Test that concurrent awaits of a singleton async factory share one construction."""
+        PoolExample.constructions = 0
+        self.container.singleton(ConfigExample)
+        self.container.singleton(make_pool_example)
+
+        async def main():
+            return await asyncio.gather(*(self.container.makeAsync(make_pool_example) for _ in range(5)))
+
+        results = asyncio.run(main())
+        self.assertEqual(PoolExample.constructions, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(results[0].name, "orionis")
+        self.assertIs(self.container.make(make_pool_example), results[0])
+
+    def test_make_async_cancelled_construction_is_retried_by_a_waiter(self):
+        """Test that cancelling the task building a singleton lets a waiting task build it."""
+        PoolExample.constructions = 0
+        self.container.singleton(ConfigExample)
+        self.container.singleton(make_pool_example)
+
+        async def main():
+            first = asyncio.ensure_future(self.container.makeAsync(make_pool_example))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(self.container.makeAsync(make_pool_example))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await asyncio.gather(first, second, return_exceptions=True)
+
+        first, second = asyncio.run(main())
+        self.assertIsInstance(first, asyncio.CancelledError)
+        self.assertIsInstance(second, PoolExample)
+        self.assertEqual(PoolExample.constructions, 1)
+        self.assertIs(self.container.make(make_pool_example), second)
+
+    def test_make_async_cancels_dependencies_when_one_fails(self):
+        """Test that a failing dependency cancels the dependencies still being built."""
+        SlowResourceExample.cancelled = False
+        self.container.transient(FragileServiceExample)
+
+        async def main():
+            with self.assertRaises(OrionisContainerException):
+                await self.container.makeAsync(FragileServiceExample)
+            # Checked before asyncio.run() cancels the tasks left running
+            return SlowResourceExample.cancelled
+
+        self.assertTrue(asyncio.run(main()))
+
+    def test_frozen_container_resolves_with_factories(self):
+        """Test that a frozen container keeps every lifetime semantic."""
+        self.container.singleton(ConfigExample)
+        self.container.transient(RepositoryExample)
+        self.container.scoped(ClockExample)
+        self.container.transient(ServiceExample)
+        self.container.alias("service", ServiceExample)
+        self.container.freeze()
+
+        first = self.container.make(ServiceExample)
+        second = self.container.make("service")
+
+        self.assertTrue(self.container.isFrozen())
+        self.assertIsNot(first, second)
+        self.assertIs(first.repository.config, second.repository.config)
+        self.assertIs(first.clock, second.clock)
+        self.assertEqual(first.retries, 3)
+        with self.container.scope():
+            self.assertIsNot(self.container.make(ServiceExample).clock, first.clock)
+
+    def test_frozen_container_rejects_registrations(self):
+        """Test that registering a service after freezing fails fast."""
+        self.container.freeze()
+        with self.assertRaises(OrionisContainerException):
+            self.container.bind(ConfigExample)
+        with self.assertRaises(TypeError):
+            self.container._services["key"] = {}
+
+    def test_lazy_annotation_defers_construction(self):
+        """Test that a Lazy[...] dependency is built on first attribute access only."""
+        ExpensiveExample.constructions = 0
+        self.container.singleton(ExpensiveExample)
+        self.container.transient(LazyConsumerExample)
+
+        consumer = self.container.make(LazyConsumerExample)
+
+        self.assertIsInstance(consumer.expensive, LazyProxy)
+        self.assertEqual(ExpensiveExample.constructions, 0)
+        self.assertEqual(consumer.expensive.ping(), "pong")
+        self.assertEqual(consumer.expensive.name, "expensive")
+        self.assertEqual(ExpensiveExample.constructions, 1)
+        self.assertIs(consumer.expensive._lazyResolve(), self.container.make(ExpensiveExample))
+
+    def test_lazy_binding_defers_construction(self):
+        """Test that dependents of a service registered as lazy receive a proxy."""
+        ExpensiveExample.constructions = 0
+        self.container.transient(ConfigExample, lazy=True)
+        self.container.transient(RepositoryExample)
+
+        repository = self.container.make(RepositoryExample)
+
+        self.assertIsInstance(repository.config, LazyProxy)
+        self.assertFalse(repository.config.isResolved())
+        self.assertEqual(repository.config.values["name"], "orionis")
+        self.assertIsInstance(self.container.make(ConfigExample), ConfigExample)
+
+    def test_deferred_services_load_on_first_request(self):
+        """Test that a deferred loader runs once, on the first request of one of its services."""
+        loads = []
+
+        def loader():
+            loads.append(True)
+            self.container.singleton(ConfigExample)
+            self.container.transient(RepositoryExample)
+
+        self.container.defer([ConfigExample, RepositoryExample], loader)
+        self.container.transient(ServiceExample)
+
+        self.assertTrue(self.container.has(ConfigExample))
+        self.assertEqual(loads, [])
+        service = self.container.make(ServiceExample)
+        self.container.make(ConfigExample)
+
+        self.assertEqual(len(loads), 1)
+        self.assertIs(service.repository.config, self.container.make(ConfigExample))
+
+    def test_frozen_container_loads_deferred_services_on_first_request(self):
+        """Test that freezing leaves deferred services unloaded until one of them is requested."""
+        loads = []
+
+        def loader():
+            loads.append(True)
+            self.container.singleton(ConfigExample)
+            self.container.transient(RepositoryExample)
+
+        self.container.defer([ConfigExample, RepositoryExample], loader)
+        self.container.transient(ServiceExample)
+        self.container.alias("config", ConfigExample)
+        self.container.freeze()
+
+        self.assertEqual(loads, [])
+        service = self.container.make(ServiceExample)
+
+        self.assertEqual(len(loads), 1)
+        self.assertIs(service.repository.config, self.container.make("config"))
+        self.assertIs(self.container.make(ConfigExample), self.container.make("config"))
+        self.assertIsInstance(self.container.make(RepositoryExample), RepositoryExample)
+        self.assertEqual(len(loads), 1)
+        with self.assertRaises(OrionisContainerException):
+            self.container.bind(ClockExample)
+
+    def test_graph_reports_cycles_with_their_path(self):
+        """Test that a circular dependency is reported with its full path."""
+        self.container.transient(CycleAExample)
+        self.container.transient(CycleBExample)
+
+        graph = self.container.graph()
+
+        self.assertEqual(len(graph.findCycles()), 1)
+        with self.assertRaises(OrionisContainerException) as context:
+            graph.ensureAcyclic()
+        self.assertIn("CycleAExample -> tests.container.services_example.CycleBExample -> tests.container.services_example.CycleAExample", str(context.exception))
+
+    def test_graph_depth_order_and_mismatches(self):
+        """Test the depth, fan-out, construction order and lifetime mismatches of the graph."""
+        self.container.singleton(ConfigExample)
+        self.container.transient(RepositoryExample)
+        self.container.transient(ServiceExample)
+        self.container.scoped(ScopedRequestExample)
+        self.container.singleton(CapturingSingletonExample)
+
+        graph = self.container.graph()
+        service = "tests.container.services_example.ServiceExample"
+        order = graph.topologicalOrder()
+
+        self.assertEqual(graph.findCycles(), [])
+        self.assertEqual(graph.depth(service), 2)
+        self.assertEqual(graph.fanOut(service), 2)
+        self.assertEqual(graph.lifetimeOf("tests.container.services_example.ClockExample"), "autowired")
+        self.assertLess(order.index("tests.container.services_example.ConfigExample"), order.index(service))
+        self.assertEqual(
+            [(m.consumer, m.dependency) for m in graph.lifetimeMismatches()],
+            [("tests.container.services_example.CapturingSingletonExample", "tests.container.services_example.ScopedRequestExample")]
+        )
+
+    def test_profiler_records_resolutions(self):
+        """Test that the profiler records counts, cache hits and depth, and can be disabled."""
+        self.container.singleton(ConfigExample)
+        self.container.transient(RepositoryExample)
+        self.container.transient(ServiceExample)
+        self.assertEqual(self.container.getResolutionStats(), {})
+
+        profiler = self.container.enableProfiling()
+        self.container.make(ServiceExample)
+        self.container.make(ServiceExample)
+        stats = self.container.getResolutionStats()
+
+        config = stats["tests.container.services_example.ConfigExample"]
+        service = stats["tests.container.services_example.ServiceExample"]
+        self.assertEqual((config['resolutions'], config['hits']), (2, 1))
+        self.assertEqual((service['resolutions'], service['hits'], service['max_depth']), (2, 0, 2))
+        self.assertGreater(service['p99'], 0)
+        self.assertEqual(profiler.getHitsByLifetime()['singleton'], 1)
+
+        self.container.disableProfiling()
+        self.assertNotIn('make', vars(self.container))
+        self.assertEqual(self.container.getResolutionStats(), {})
+
+    def test_disabled_profiler_leaves_make_unwrapped(self):
+        """Test that without profiling, make is the plain method of the container and records nothing."""
+        self.container.singleton(ConfigExample)
+        self.assertNotIn('make', vars(self.container))
+        self.assertIs(self.container.make.__func__, Container.make)
+
+        self.container.enableProfiling()
+        self.assertIn('make', vars(self.container))
+        self.assertIsNot(getattr(self.container.make, '__func__', None), Container.make)
+
+        self.container.disableProfiling()
+        self.assertNotIn('make', vars(self.container))
+        self.assertIs(self.container.make.__func__, Container.make)
+        self.container.make(ConfigExample)
+        self.assertEqual(self.container.getResolutionStats(), {})
+
+    def test_resolves_postponed_and_optional_annotations(self):
+        """Test that string annotations are evaluated and unions resolve their registered member."""
+        self.container.singleton(ConfigExample)
+        self.container.transient(PostponedServiceExample)
+
+        service = self.container.make(PostponedServiceExample)
+
+        self.assertIs(service.config, self.container.make(ConfigExample))
+        self.assertIsInstance(service.clock, ClockExample)
+        self.assertIs(service.source, service.config)
+
+    def test_keys_classes_with_custom_metaclass(self):
+        """Test that a class created by a custom metaclass is keyed by itself, not by its metaclass."""
+        key = self.container.singleton(RegisteredExample)
+
+        self.assertEqual(key, "tests.container.annotations_example.RegisteredExample")
+        self.assertTrue(self.container.has(RegisteredExample))
+        self.assertIsInstance(self.container.make(RegisteredExample), RegisteredExample)
+        self.assertIs(self.container._introspector.key(RegisteredExample), key)
+
+    def test_call_injects_method_dependencies(self):
+        """Test that call() injects services into bound methods and honors overrides and defaults."""
+        self.container.singleton(ConfigExample)
+        handler = HandlerExample()
+        other = ClockExample()
+
+        config, clock, name = self.container.call(handler.handle)
+        _, overridden, renamed = self.container.call(handler.handle, {'clock': other, 'name': "orionis"})
+
+        self.assertIs(config, self.container.make(ConfigExample))
+        self.assertIsInstance(clock, ClockExample)
+        self.assertEqual(name, "world")
+        self.assertIs(overridden, other)
+        self.assertEqual(renamed, "orionis")
+        self.assertEqual(self.container.call(HandlerExample.build), (HandlerExample, config))
+        self.assertIn(HandlerExample.handle, self.container._invocation_plans)
+
+    def test_call_passes_positional_only_parameters_by_position(self):
+        """Test that call() passes positional-only parameters in order and accepts any override name."""
+        self.container.singleton(ConfigExample)
+
+        def handle(config: ConfigExample, retries: int = 3, /, target: str = "all"):
+            return config, retries, target
+
+        config, retries, target = self.container.call(handle, {'target': "one"})
+        _, overridden, _ = self.container.call(handle, {'retries': 5})
+
+        self.assertIs(config, self.container.make(ConfigExample))
+        self.assertEqual((retries, target, overridden), (3, "one", 5))
+
+    def test_pooled_services_are_borrowed_and_reset(self):
+        """Test that pooled instances are reused, reset on return and never resolved with make()."""
+        self.container.pooled(ParserExample, max_size=2, reset=reset_parser_example)
+
+        with self.container.borrow(ParserExample) as first:
+            self.assertEqual(first.parse("a"), 1)
+            with self.container.borrow(ParserExample) as second:
+                self.assertIsNot(first, second)
+        with self.container.borrow(ParserExample) as again:
+            self.assertIn(again, (first, second))
+            self.assertEqual(again.buffer, [])
+
+        with self.assertRaises(OrionisContainerException):
+            self.container.make(ParserExample)
+
+    def test_exhausted_pool_fails_or_times_out(self):
+        """Test the failing and blocking policies of an exhausted pool."""
+        self.container.singleton(ConfigExample)
+        self.container.pooled(ParserExample, max_size=1, block=False)
+        self.container.pooled(ClockExample, max_size=1, timeout=0.05)
+
+        with self.container.borrow(ParserExample):
+            with self.assertRaises(OrionisContainerException):
+                with self.container.borrow(ParserExample):
+                    pass
+
+        with self.container.borrow(ClockExample):
+            start = time.perf_counter()
+            with self.assertRaises(OrionisContainerException):
+                with self.container.borrow(ClockExample):
+                    pass
+            self.assertGreaterEqual(time.perf_counter() - start, 0.04)
+
+        # A blocked borrower receives the instance as soon as it is returned
+        borrowed = []
+        with self.container.borrow(ClockExample) as clock:
+            waiter = threading.Thread(target=lambda: borrowed.append(self.container.borrow(ClockExample).__enter__()))
+            waiter.start()
+            time.sleep(0.01)
+        waiter.join()
+        self.assertEqual(borrowed, [clock])
+
+    def test_pool_timeout_is_not_restarted_by_wakeups(self):
+        """Test that a borrower woken up without an instance to take still times out on time."""
+        pool = ObjectPool(ClockExample, max_size=1, timeout=0.1)
+        pool.acquire()
+        stop = threading.Event()
+
+        def wake():
+            while not stop.is_set():
+                with pool._condition:
+                    pool._condition.notify_all()
+                time.sleep(0.02)
+
+        waker = threading.Thread(target=wake)
+        waker.start()
+        try:
+            start = time.perf_counter()
+            with self.assertRaises(OrionisContainerException):
+                pool.acquire()
+            self.assertLess(time.perf_counter() - start, 0.5)
+        finally:
+            stop.set()
+            waker.join()
+
+    def test_failing_reset_does_not_hide_the_borrower_exception(self):
+        """Test that the exception of a borrower propagates when resetting its instance fails too."""
+        def reset(instance):
+            raise RuntimeError("Reset failure")
+
+        pool = ObjectPool(ClockExample, max_size=1, reset=reset)
+        with self.assertWarnsRegex(RuntimeWarning, "Reset failure"):
+            with self.assertRaises(ValueError):
+                with pool.borrow():
+                    raise ValueError("Borrower failure")
+
+        self.assertEqual(pool.size(), 0)
+
+    def test_child_container_overrides_without_affecting_parent(self):
+        """Test that a child overrides services for itself only and shares the parent singletons."""
+        self.container.singleton(ClockExample)
+        self.container.singleton(ConfigExample)
+        self.container.transient(RepositoryExample)
+        self.container.scoped(ScopedRequestExample)
+        parent_config = self.container.make(ConfigExample)
+
+        child = self.container.child()
+        tenant_config = ConfigExample()
+        child.instance(tenant_config)
+
+        self.assertIs(child.parent(), self.container)
+        self.assertIs(child.make(RepositoryExample).config, tenant_config)
+        self.assertIs(self.container.make(RepositoryExample).config, parent_config)
+        self.assertIs(child.make(ClockExample), self.container.make(ClockExample))
+        with self.container.scope():
+            self.assertIsNot(child.make(ScopedRequestExample), self.container.make(ScopedRequestExample))
+
+        # Registrations in the parent are visible to existing children
+        self.container.transient(ServiceExample)
+        self.assertIs(child.make(ServiceExample).repository.config, tenant_config)
+        with self.assertRaises(OrionisContainerException):
+            child.freeze()
+
+    def test_warm_up_builds_singletons_and_reports_failures(self):
+        """Test that warm-up builds eager singletons only and aggregates construction errors."""
+        self.container.singleton(ConfigExample)
+        self.container.singleton(RepositoryExample)
+        self.container.singleton(ExpensiveExample, lazy=True)
+        self.container.transient(ClockExample)
+
+        times = self.container.warmUp()
+
+        self.assertEqual(list(times), ["tests.container.services_example.ConfigExample", "tests.container.services_example.RepositoryExample"])
+        self.assertEqual(self.container.getWarmupTimes(), times)
+        self.assertIn('instance', self.container._services["tests.container.services_example.RepositoryExample"])
+        self.assertNotIn('instance', self.container._services["tests.container.services_example.ExpensiveExample"])
+
+        self.container.singleton(BrokenExample)
+        with self.assertRaises(OrionisContainerException) as context:
+            self.container.warmUp()
+        self.assertIn("BrokenExample: ", str(context.exception))
+
+    def test_replace_swaps_implementation_and_keeps_lifetime(self):
+        """Test that a reloaded class replaces the registered one and its built instance."""
+        self.container.singleton(ConfigExample)
+        self.container.transient(RepositoryExample)
+        self.container.alias('config', ConfigExample)
+        before = self.container.make(RepositoryExample).config
+
+        # A class defined again by a reloaded module has the same key
+        reloaded = type('ConfigExample', (ConfigExample,), {'__module__': ConfigExample.__module__})
+        key = self.container.replace(reloaded)
+
+        self.assertEqual(key, "tests.container.services_example.ConfigExample")
+        config = self.container.make('config')
+        self.assertIsInstance(config, reloaded)
+        self.assertIsNot(config, before)
+        self.assertIs(self.container.make(RepositoryExample).config, config)
+        self.assertIs(self.container.make(ConfigExample), config)
+
+        self.container.defer([ClockExample], lambda: self.container.transient(ClockExample))
+        self.assertIsNone(self.container.replace(ClockExample))
+        with self.assertRaises(OrionisContainerException):
+            self.container.replace(ServiceExample)
+
+    def test_forget_removes_services_and_aliases(self):
+        """Test that forgetting an alias keeps the service, and forgetting a service drops its aliases."""
+        self.container.singleton(ConfigExample)
+        self.container.alias('config', ConfigExample)
+        self.container.alias('settings', ConfigExample)
+
+        self.container.forget('config')
+        self.assertFalse(self.container.has('config'))
+        self.assertTrue(self.container.has('settings'))
+
+        self.container.forget(ConfigExample)
+        self.assertFalse(self.container.has(ConfigExample))
+        self.assertFalse(self.container.has('settings'))
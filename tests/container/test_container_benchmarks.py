@@ -0,0 +1,183 @@
+import os
+import time
+import timeit
+import unittest
+from orionis.luminate.container.container import Container
+from orionis.luminate.providers.commands.scheduler_provider import ScheduleServiceProvider
+from orionis.luminate.services.commands.scheduler_service import ScheduleService
+from tests.container.services_example import (
+    ClockExample, ConfigExample, HandlerExample, LogHandlerExample, MailerExample, ParserExample, RepositoryExample, ServiceExample,
+    StorageExample
+)
+
+# Wall-clock comparisons depend on the machine, so they only run when requested
+BENCHMARKS = os.getenv('ORIONIS_BENCHMARKS', '').lower() in ('1', 'true', 'yes')
+
+@unittest.skipUnless(BENCHMARKS, "Benchmarks only run with ORIONIS_BENCHMARKS=1.")
+class TestContainerBenchmarks(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a fresh container for each benchmark."""
+        Container.reset()
+        self.container = Container()
+
+    def tearDown(self):
+        """Discard the container used by the benchmark."""
+        Container.reset()
+
+    def _best(self, statement, number: int = 2000) -> float:
+        """Return the best per-call time, in seconds, of several runs."""
+        return min(timeit.repeat(statement, number=number, repeat=5)) / number
+
+    def test_cached_plan_make_is_faster(self):
+        """Benchmark transient resolution with cached plans against inspecting every class on each call."""
+        self.container.transient(ConfigExample)
+        self.container.transient(RepositoryExample)
+        self.container.transient(ServiceExample)
+
+        def uncached():
+            # Without any cache, as before plans: keys, signatures and type hints are computed again
+            self.container._forgetResolutionPlans()
+            self.container._introspector._keys.clear()
+            self.container._introspector._hints.clear()
+            self.container.make(ServiceExample)
+
+        def cached():
+            self.container.make(ServiceExample)
+
+        cached()
+        uncached_time = self._best(uncached)
+        cached_time = self._best(cached)
+
+        self.assertGreaterEqual(
+            uncached_time / cached_time, 5,
+            f"make() uncached: {uncached_time * 1e6:.2f}us, cached plan: {cached_time * 1e6:.2f}us"
+        )
+
+    def test_has_does_not_scale_with_binding_count(self):
+        """Benchmark has() and make() lookups with an increasing number of bindings."""
+        timings = {}
+        for count in (10, 1000):
+            Container.reset()
+            container = Container()
+            for index in range(count):
+                container.transient(type(f"Service{index}", (), {"__module__": __name__}))
+            container.singleton(ConfigExample)
+            container.make(ConfigExample)
+            key = "tests.container.services_example.ConfigExample"
+            timings[count] = (
+                self._best(lambda: container.has(key), number=20000),
+                self._best(lambda: container.make(key), number=20000)
+            )
+
+        report = ", ".join(f"{count} bindings: has() {has_time * 1e9:.0f}ns, make() {make_time * 1e9:.0f}ns" for count, (has_time, make_time) in timings.items())
+        self.assertLess(timings[1000][0], timings[10][0] * 3, report)
+        self.assertLess(timings[1000][1], timings[10][1] * 3, report)
+
+    def test_frozen_make_is_faster(self):
+        """Benchmark make() on a frozen container against an unfrozen one."""
+        self.container.singleton(ConfigExample)
+        self.container.transient(RepositoryExample)
+        self.container.transient(ServiceExample)
+        self.container.make(ServiceExample)
+
+        unfrozen_time = self._best(lambda: self.container.make(ServiceExample), number=20000)
+        self.container.freeze()
+        frozen_time = self._best(lambda: self.container.make(ServiceExample), number=20000)
+        constructor_time = self._best(lambda: ServiceExample(RepositoryExample(ConfigExample()), ClockExample()), number=20000)
+
+        self.assertGreaterEqual(
+            unfrozen_time / frozen_time, 2,
+            f"make() unfrozen: {unfrozen_time * 1e6:.2f}us, frozen: {frozen_time * 1e6:.2f}us, plain constructors: {constructor_time * 1e6:.2f}us"
+        )
+
+    def test_deferred_provider_boot_is_faster(self):
+        """Benchmark booting the schedule provider eagerly against deferring it."""
+        start = time.perf_counter()
+        provider = ScheduleServiceProvider(app=self.container)
+        provider.register()
+        provider.boot()
+        eager_time = time.perf_counter() - start
+        self.container.make(ScheduleService).scheduler.shutdown(wait=False)
+
+        Container.reset()
+        container = Container()
+        loaded = []
+
+        def loader():
+            loaded.append(True)
+            provider = ScheduleServiceProvider(app=container)
+            provider.register()
+            provider.boot()
+
+        start = time.perf_counter()
+        container.defer(ScheduleServiceProvider.provides, loader)
+        deferred_time = time.perf_counter() - start
+
+        self.assertEqual(loaded, [])
+        self.assertLess(deferred_time, eager_time, f"schedule provider boot eager: {eager_time * 1e3:.3f}ms, deferred: {deferred_time * 1e3:.3f}ms")
+        container.make(ScheduleService).scheduler.shutdown(wait=False)
+        self.assertEqual(loaded, [True])
+
+    def test_call_overhead_against_direct_call(self):
+        """Benchmark method injection through call() against calling the method with the same arguments."""
+        self.container.instance(ConfigExample())
+        self.container.instance(ClockExample())
+        handler = HandlerExample()
+        config = self.container.make(ConfigExample)
+        clock = self.container.make(ClockExample)
+
+        direct_time = self._best(lambda: handler.handle(config=config, clock=clock, name="orionis"))
+        call_time = self._best(lambda: self.container.call(handler.handle, {'name': "orionis"}))
+        overhead = call_time - direct_time
+
+        self.assertLess(overhead, 5e-6, f"direct call: {direct_time * 1e6:.2f}us, call(): {call_time * 1e6:.2f}us")
+
+    def test_pooled_borrow_is_faster_than_transient(self):
+        """Benchmark borrowing a pooled instance against building a transient on every use."""
+        self.container.singleton(ConfigExample)
+        self.container.transient(ParserExample)
+        transient_time = self._best(lambda: self.container.make(ParserExample).parse("x"), number=200)
+
+        Container.reset()
+        self.container = Container()
+        self.container.singleton(ConfigExample)
+        self.container.pooled(ParserExample, max_size=4)
+
+        def borrow():
+            with self.container.borrow(ParserExample) as parser:
+                parser.parse("x")
+
+        pooled_time = self._best(borrow, number=200)
+
+        self.assertGreaterEqual(
+            transient_time / pooled_time, 5,
+            f"transient parser: {transient_time * 1e6:.2f}us, pooled parser: {pooled_time * 1e6:.2f}us"
+        )
+
+    def test_child_creation_does_not_scale_with_parent_size(self):
+        """Benchmark creating a child container with an increasing number of parent services."""
+        timings = {}
+        for count in (10, 1000):
+            Container.reset()
+            container = Container()
+            for index in range(count):
+                container.transient(type(f"Service{index}", (), {"__module__": __name__}))
+            timings[count] = self._best(container.child, number=5000)
+
+        report = ", ".join(f"child() with {count} parent services: {child_time * 1e6:.2f}us" for count, child_time in timings.items())
+        self.assertLess(timings[1000], timings[10] * 3, report)
+
+    def test_parallel_warm_up_is_faster_than_sequential(self):
+        """Benchmark warming up independent blocking singletons on one thread against a pool."""
+        timings = {}
+        for workers in (1, 4):
+            Container.reset()
+            container = Container()
+            for concrete in (LogHandlerExample, MailerExample, StorageExample):
+                container.singleton(concrete)
+            start = time.perf_counter()
+            container.warmUp(max_workers=workers)
+            timings[workers] = time.perf_counter() - start
+
+        self.assertLess(timings[4], timings[1] / 2, f"warm-up sequential: {timings[1] * 1e3:.1f}ms, parallel: {timings[4] * 1e3:.1f}ms")
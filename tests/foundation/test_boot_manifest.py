@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+from orionis.luminate.console.commands.version import VersionCommand
+from orionis.luminate.foundation.console.command_bootstrapper import CommandsBootstrapper
+from orionis.luminate.foundation.manifest.boot_manifest import BootManifest
+
+class TestBootManifest(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a temporary directory holding the manifest and a scanned file."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'bootstrap', 'cache', 'manifest.json')
+        self.source = os.path.join(self.directory.name, 'command.py')
+        with open(self.source, 'w') as file:
+            file.write("signature = 'example'\n")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def _write(self) -> BootManifest:
+        """Write a manifest with a single entry discovered from the scanned file."""
+        manifest = BootManifest(self.path)
+        manifest.write({
+            'commands': {
+                'entries': [{'signature': 'example'}],
+                'files': [self.source],
+                'directories': [self.directory.name]
+            }
+        })
+        return manifest
+
+    def test_missing_manifest_is_invalid(self):
+        """Test that no section is available without a manifest."""
+        manifest = BootManifest(self.path)
+
+        self.assertFalse(manifest.isValid())
+        self.assertIsNone(manifest.section('commands'))
+        self.assertFalse(manifest.clear())
+
+    def test_written_manifest_is_valid(self):
+        """Test that a written manifest is valid until it is cleared."""
+        self._write()
+        manifest = BootManifest(self.path)
+
+        self.assertTrue(manifest.isValid())
+        self.assertEqual(manifest.section('commands'), [{'signature': 'example'}])
+        self.assertIsNone(manifest.section('providers'))
+        self.assertTrue(manifest.clear())
+        self.assertFalse(os.path.exists(self.path))
+        self.assertFalse(manifest.isValid())
+
+    def test_changed_file_invalidates_manifest(self):
+        """Test that a scanned file whose size changes makes the manifest stale."""
+        self._write()
+        with open(self.source, 'a') as file:
+            file.write("description = 'changed'\n")
+
+        self.assertFalse(BootManifest(self.path).isValid())
+
+    def test_added_file_invalidates_manifest(self):
+        """Test that a file added to a scanned directory makes the manifest stale."""
+        self._write()
+        stat = os.stat(self.directory.name)
+        with open(os.path.join(self.directory.name, 'other.py'), 'w') as file:
+            file.write("")
+        # Ensure the directory time differs even on file systems with a coarse resolution
+        os.utime(self.directory.name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertFalse(BootManifest(self.path).isValid())
+
+    def test_encodes_argument_specifications(self):
+        """Test that command arguments, including their types, survive the manifest."""
+        arguments = [('--count', {'type': int, 'default': 1, 'choices': (1, 2)}), ('--path', {'type': os.path.join})]
+
+        encoded = BootManifest.encode(arguments)
+
+        self.assertEqual(encoded[0][1]['type'], {'__ref__': 'builtins:int'})
+        self.assertEqual(BootManifest.decode(encoded), [['--count', {'type': int, 'default': 1, 'choices': [1, 2]}], ['--path', {'type': os.path.join}]])
+        with self.assertRaises(ValueError):
+            BootManifest.encode([('--value', {'type': lambda value: value})])
+
+    def test_commands_are_loaded_from_manifest(self):
+        """Test that the commands bootstrapper uses a valid manifest instead of scanning."""
+        scanned = CommandsBootstrapper(BootManifest(self.path))
+        manifest = BootManifest(self.path)
+        manifest.write({'commands': scanned.describe()})
+
+        cached = CommandsBootstrapper(BootManifest(self.path))
+
+        self.assertEqual(cached.describe()['files'], [])
+        self.assertEqual(cached.get().keys(), scanned.get().keys())
+        self.assertIs(cached.get('version')['concrete'], VersionCommand)
+        self.assertEqual(cached.get('version')['description'], scanned.get('version')['description'])
+
+    def test_commands_from_manifest_are_imported_on_load(self):
+        """Test that a command registered from the manifest is only loaded when requested."""
+        manifest = BootManifest(self.path)
+        manifest.write({'commands': CommandsBootstrapper(BootManifest(self.path)).describe()})
+
+        cached = CommandsBootstrapper(BootManifest(self.path))
+        commands = cached.get()
+
+        self.assertIsNone(commands['version']['concrete'])
+        self.assertEqual(commands['version']['module'], VersionCommand.__module__)
+        self.assertIs(cached.load('version')['concrete'], VersionCommand)
+        self.assertEqual(cached.get('version')['arguments'], [])
+        self.assertIsNone(commands['help']['concrete'])
+        with self.assertRaises(KeyError):
+            cached.load('missing')
+
+    def test_scanned_commands_are_registered_from_source(self):
+        """Test that scanning registers commands with literal attributes without loading them."""
+        scanned = CommandsBootstrapper(BootManifest(self.path))
+
+        self.assertIsNone(scanned.get()['version']['concrete'])
+        self.assertTrue(os.path.exists(BootManifest(self.path).cachePath('discovery.json')))
+        self.assertIs(scanned.get('version')['concrete'], VersionCommand)
@@ -0,0 +1,51 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from orionis.luminate.foundation.tracing.boot_tracer import BootTracer
+
+class TestBootTracer(unittest.TestCase):
+
+    def tearDown(self):
+        """Deactivate any tracer activated by the test."""
+        BootTracer.deactivate()
+
+    def test_disabled_tracer_records_nothing(self):
+        """Test that spans are discarded while no tracer is activated."""
+        tracer = BootTracer.active()
+        with tracer.span('boot'):
+            pass
+
+        self.assertFalse(tracer.enabled())
+        self.assertEqual(tracer.getSpans(), [])
+
+    def test_nested_spans_report_self_time(self):
+        """Test that the time of nested spans is excluded from the self time of their parent."""
+        tracer = BootTracer.activate(BootTracer())
+        with BootTracer.active().span('boot', 'application'):
+            with BootTracer.active().span('config.app', 'import', file='config/app.py'):
+                time.sleep(0.02)
+
+        boot, module = tracer.getSpans()
+        self.assertEqual((boot['name'], boot['depth']), ('boot', 0))
+        self.assertEqual((module['name'], module['depth'], module['args']), ('config.app', 1, {'file': 'config/app.py'}))
+        self.assertGreaterEqual(boot['duration'], module['duration'])
+        self.assertLess(boot['self'], module['duration'])
+        self.assertEqual(tracer.summary(limit=1)[0]['name'], 'config.app')
+
+    def test_exports_chrome_trace(self):
+        """Test that the spans are written as complete Chrome trace events."""
+        tracer = BootTracer()
+        with tracer.span('LogServiceProvider.boot', 'provider'):
+            pass
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = tracer.export(os.path.join(directory, 'logs', 'boot_trace.json'))
+            with open(path) as file:
+                trace = json.load(file)
+
+        event, = trace['traceEvents']
+        self.assertEqual((event['name'], event['cat'], event['ph']), ('LogServiceProvider.boot', 'provider', 'X'))
+        self.assertIn('ts', event)
+        self.assertIn('dur', event)
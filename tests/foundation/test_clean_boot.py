@@ -0,0 +1,69 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+APP_CONFIG = '''
+from orionis.luminate.contracts.config.i_config import IConfig
+
+class Config(IConfig):
+    config = {"name": "clean", "timezone": "UTC"}
+'''
+
+LOGGING_CONFIG = '''
+from orionis.luminate.contracts.config.i_config import IConfig
+
+class Config(IConfig):
+    config = {"default": "stack", "channels": {"stack": {"path": "storage/logs/orionis.log", "level": "info"}}}
+'''
+
+class TestCleanBoot(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a temporary application without environment file."""
+        self.directory = tempfile.TemporaryDirectory()
+
+        # The framework is discovered relative to the application, as in an installed project
+        shutil.copytree(
+            os.path.join(REPOSITORY, 'orionis'), os.path.join(self.directory.name, 'orionis'),
+            ignore=shutil.ignore_patterns('__pycache__')
+        )
+        files = {
+            os.path.join('config', '__init__.py'): '',
+            os.path.join('config', 'app.py'): APP_CONFIG,
+            os.path.join('config', 'logging.py'): LOGGING_CONFIG
+        }
+        for name, content in files.items():
+            path = os.path.join(self.directory.name, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as file:
+                file.write(content)
+
+    def tearDown(self):
+        """Remove the temporary application."""
+        self.directory.cleanup()
+
+    def _files(self) -> set:
+        """List the files of the application, except bytecode, logs and caches."""
+        files = set()
+        for directory, subdirectories, names in os.walk(self.directory.name):
+            subdirectories[:] = [name for name in subdirectories if name not in ('__pycache__', 'storage', 'bootstrap')]
+            files.update(os.path.relpath(os.path.join(directory, name), self.directory.name) for name in names)
+        return files
+
+    def test_boot_creates_no_files(self):
+        """Test that booting does not create the .env file."""
+        before = self._files()
+
+        environment = dict(os.environ, PYTHONPATH=self.directory.name)
+        result = subprocess.run(
+            [sys.executable, '-c', 'from orionis.luminate.application import orionis; orionis().boot()'],
+            cwd=self.directory.name, env=environment, capture_output=True, text=True, timeout=120
+        )
+
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        self.assertEqual(self._files() - before, set())
@@ -0,0 +1,83 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from orionis.luminate.foundation.reload.file_watcher import FileWatcher
+
+class TestFileWatcher(unittest.TestCase):
+
+    backend = 'poll'
+
+    def setUp(self):
+        """Set up a directory of watched sources."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        self.source = self._write('commands/greet.py', "signature = 'greet'\n")
+        self._write('commands/notes.txt', "ignored\n")
+        self.watcher = FileWatcher(
+            [os.path.join(self.root, 'commands'), os.path.join(self.root, 'tasks_manager.py')],
+            interval=0.05,
+            backend=self.backend
+        )
+
+    def tearDown(self):
+        """Stop the watcher and remove the directory."""
+        self.watcher.stop()
+        self.directory.cleanup()
+
+    def _write(self, name: str, content: str) -> str:
+        """Write a file under the watched directory and return its path."""
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as file:
+            file.write(content)
+        return path
+
+    def test_indexes_watched_sources(self):
+        """Test that only the sources with a watched suffix are indexed."""
+        self.assertEqual(self.watcher.backend(), self.backend)
+        self.assertEqual(list(self.watcher.scan()), [self.source])
+        self.assertEqual(self.watcher.poll(), [])
+
+    def test_reports_added_modified_and_removed_files(self):
+        """Test that the files changed since the previous scan are reported once."""
+        added = self._write('commands/nested/report.py', "signature = 'report'\n")
+        tasks = self._write('tasks_manager.py', "class TaskManager: pass\n")
+        with open(self.source, 'a') as file:
+            file.write("description = 'changed'\n")
+
+        self.assertEqual(self.watcher.wait(5), sorted([added, tasks, self.source]))
+        self.assertEqual(self.watcher.poll(), [])
+
+        os.remove(added)
+        self.assertEqual(self.watcher.wait(5), [added])
+
+    def test_wait_times_out_without_changes(self):
+        """Test that waiting returns nothing once the timeout expires."""
+        started = time.monotonic()
+
+        self.assertEqual(self.watcher.wait(0.2), [])
+        self.assertGreaterEqual(time.monotonic() - started, 0.15)
+
+    def test_calls_back_from_background_thread(self):
+        """Test that a started watcher calls its callback with the changed files."""
+        received = []
+        changed = threading.Event()
+        self.watcher.start(lambda changes: (received.append(changes), changed.set()))
+
+        self._write('commands/greet.py', "signature = 'hello'\n")
+
+        self.assertTrue(changed.wait(5))
+        self.assertEqual(received[0], [self.source])
+
+    def test_invalid_backend(self):
+        """Test that an unknown backend is rejected."""
+        with self.assertRaises(ValueError):
+            FileWatcher([self.root], backend='kqueue')
+
+@unittest.skipUnless(sys.platform.startswith('linux'), "inotify is only available on Linux.")
+class TestInotifyFileWatcher(TestFileWatcher):
+
+    backend = 'inotify'
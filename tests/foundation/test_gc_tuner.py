@@ -0,0 +1,76 @@
+import gc
+import unittest
+from orionis.luminate.foundation.memory.gc_tuner import GcTuner
+
+class TestGcTuner(unittest.TestCase):
+
+    def setUp(self):
+        """Save the state of the garbage collector."""
+        self.thresholds = gc.get_threshold()
+        self.tuners = []
+
+    def tearDown(self):
+        """Restore the state of the garbage collector."""
+        for tuner in self.tuners:
+            tuner.remove()
+        gc.unfreeze()
+        gc.set_threshold(*self.thresholds)
+
+    def _tuner(self, *args, **kwargs) -> GcTuner:
+        """Create a tuner removed at the end of the test."""
+        tuner = GcTuner(*args, **kwargs)
+        self.tuners.append(tuner)
+        return tuner
+
+    def test_freezes_the_heap_and_sets_thresholds(self):
+        """Test that applying the tuner freezes the surviving objects and sets the thresholds."""
+        result = self._tuner(thresholds=(50000, 20, 20)).apply()
+
+        self.assertGreater(result['frozen'], 0)
+        self.assertEqual(gc.get_freeze_count(), result['frozen'])
+        self.assertEqual(gc.get_threshold(), (50000, 20, 20))
+        self.assertEqual(result['thresholds'], (50000, 20, 20))
+
+    def test_thresholds_and_freeze_are_optional(self):
+        """Test that nothing but the collection happens when freezing is disabled."""
+        self._tuner(freeze=False).apply()
+
+        self.assertEqual(gc.get_freeze_count(), 0)
+        self.assertEqual(gc.get_threshold(), self.thresholds)
+
+    def test_reports_collection_pauses(self):
+        """Test that each collection is reported to the hook and recorded."""
+        pauses = []
+        tuner = self._tuner(on_pause=pauses.append)
+        tuner.apply()
+
+        # Only the explicit collections run during the test
+        gc.disable()
+        try:
+            gc.collect(1)
+            tuner.remove()
+            gc.collect()
+        finally:
+            gc.enable()
+
+        self.assertEqual([pause['generation'] for pause in pauses], [1])
+        self.assertGreaterEqual(pauses[0]['duration'], 0.0)
+        recorded = tuner.getPauses()
+        self.assertEqual(recorded['count'], 1)
+        self.assertEqual(recorded['generations'], [0, 1, 0])
+        self.assertEqual(recorded['max'], recorded['total'])
+
+    def test_failing_hook_is_reported(self):
+        """Test that an exception raised by the hook is reported as a warning and does not reach the collection."""
+        def hook(pause):
+            raise RuntimeError("Hook failure")
+
+        tuner = self._tuner(freeze=False, on_pause=hook)
+        with self.assertWarnsRegex(RuntimeWarning, "Hook failure"):
+            tuner.apply()
+            self.assertGreaterEqual(gc.collect(), 0)
+
+    def test_invalid_thresholds(self):
+        """Test that more than three thresholds are rejected."""
+        with self.assertRaises(ValueError):
+            GcTuner(thresholds=(1, 2, 3, 4))
@@ -0,0 +1,182 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Boots the application with hot reload, changes its sources, and reports what it sees
+SCENARIO = '''
+import json
+import os
+import time
+from orionis.luminate.application import orionis
+from orionis.luminate.container.container import Container
+from orionis.luminate.foundation.config.config_bootstrapper import ConfigBootstrapper
+from orionis.luminate.services.config.config_service import ConfigService
+
+application = orionis().withHotReload(interval=0.05, backend='poll')
+application.boot()
+container = Container()
+summaries = []
+application.onReload(summaries.append)
+
+def write(name, content):
+    # Replaced at once, so the watcher never reads a truncated source
+    with open(name + '.tmp', 'w') as file:
+        file.write(content)
+    os.replace(name + '.tmp', name)
+
+def until(condition):
+    deadline = time.monotonic() + 10
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+def snapshot():
+    return {
+        'name': container.make(ConfigService).get('app.name'),
+        'greet': container.make('greet').handle(),
+        'audit': container.has('audit'),
+        'report': container.has('report')
+    }
+
+results = {'watcher': application.getFileWatcher().backend(), 'before': snapshot()}
+
+write(os.path.join('config', 'app.py'), APP_CONFIG.replace('before', 'after'))
+write(os.path.join('app', 'console', 'commands', 'greet.py'), GREET.replace('Hello', 'Bonjour'))
+write(os.path.join('app', 'console', 'commands', 'audit.py'), GREET.replace('Greet', 'Audit').replace('greet', 'audit'))
+os.remove(os.path.join('app', 'console', 'commands', 'report.py'))
+until(lambda: snapshot() == {'name': 'after', 'greet': 'Bonjour', 'audit': True, 'report': False})
+results['after'] = snapshot()
+
+def commands():
+    return {signature: type(container.make(signature)).__name__ for signature in ('foo', 'zap') if container.has(signature)}
+
+results['extra'] = commands()
+write(os.path.join('app', 'console', 'commands', 'extra.py'), GREET.replace('Greet', 'Bar').replace('greet', 'foo'))
+until(lambda: commands() == {'foo': 'BarCommand'})
+results['renamed'] = commands()
+
+import app.console.tasks_manager
+write(os.path.join('config', 'app.py'), "raise RuntimeError('broken')")
+write(os.path.join('app', 'console', 'tasks_manager.py'), "class TaskManager:\\n    version = 2\\n")
+until(lambda: any(summary['tasks'] for summary in summaries))
+application.getFileWatcher().stop()
+results['broken'] = container.make(ConfigBootstrapper).get('app.name')
+results['tasks'] = app.console.tasks_manager.TaskManager.version
+results['summaries'] = summaries
+print(json.dumps(results))
+'''
+
+APP_CONFIG = '''
+from orionis.luminate.contracts.config.i_config import IConfig
+
+class Config(IConfig):
+    config = {"name": "before", "timezone": "UTC"}
+'''
+
+LOGGING_CONFIG = '''
+from orionis.luminate.contracts.config.i_config import IConfig
+
+class Config(IConfig):
+    config = {"default": "stack", "channels": {"stack": {"path": "storage/logs/orionis.log", "level": "info"}}}
+'''
+
+GREET = '''
+from orionis.luminate.console.base.command import BaseCommand
+
+class GreetCommand(BaseCommand):
+    signature = "greet"
+    description = "Hello"
+
+    def handle(self):
+        return "Hello"
+'''
+
+class TestHotReload(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Run the hot reload scenario in a temporary application."""
+        cls.directory = tempfile.TemporaryDirectory()
+
+        # The framework is discovered relative to the application, as in an installed project
+        shutil.copytree(
+            os.path.join(REPOSITORY, 'orionis'), os.path.join(cls.directory.name, 'orionis'),
+            ignore=shutil.ignore_patterns('__pycache__')
+        )
+        files = {
+            'scenario.py': f"APP_CONFIG = {APP_CONFIG!r}\nGREET = {GREET!r}\n{SCENARIO}",
+            '.env': '',
+            os.path.join('config', '__init__.py'): '',
+            os.path.join('config', 'app.py'): APP_CONFIG,
+            os.path.join('config', 'logging.py'): LOGGING_CONFIG,
+            os.path.join('app', '__init__.py'): '',
+            os.path.join('app', 'console', '__init__.py'): '',
+            os.path.join('app', 'console', 'tasks_manager.py'): "class TaskManager:\n    version = 1\n",
+            os.path.join('app', 'console', 'commands', '__init__.py'): '',
+            os.path.join('app', 'console', 'commands', 'greet.py'): GREET,
+            os.path.join('app', 'console', 'commands', 'report.py'): GREET.replace('Greet', 'Report').replace('greet', 'report'),
+            os.path.join('app', 'console', 'commands', 'extra.py'): (
+                GREET.replace('Greet', 'Foo').replace('greet', 'foo')
+                + GREET.replace('Greet', 'Zap').replace('greet', 'zap').split('\n', 2)[2]
+            )
+        }
+        for name, content in files.items():
+            path = os.path.join(cls.directory.name, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as file:
+                file.write(content)
+
+        environment = dict(os.environ, PYTHONPATH=cls.directory.name)
+        environment.pop('ORIONIS_HOT_RELOAD', None)
+        cls.result = subprocess.run(
+            [sys.executable, 'scenario.py'],
+            cwd=cls.directory.name, env=environment, capture_output=True, text=True, timeout=120
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary application."""
+        cls.directory.cleanup()
+
+    def _results(self) -> dict:
+        """Retrieve what the scenario reported."""
+        self.assertEqual(self.result.returncode, 0, self.result.stdout + self.result.stderr)
+        return json.loads(self.result.stdout.strip().splitlines()[-1])
+
+    def test_reloads_configuration_and_commands(self):
+        """Test that changed configuration and commands are swapped in the running application."""
+        results = self._results()
+
+        self.assertEqual(results['before'], {'name': 'before', 'greet': 'Hello', 'audit': False, 'report': True})
+        self.assertEqual(results['after'], {'name': 'after', 'greet': 'Bonjour', 'audit': True, 'report': False})
+        loaded = sorted(signature for summary in results['summaries'] for signature in summary['commands']['loaded'])
+        self.assertEqual(loaded, ['audit', 'foo', 'greet'])
+
+    def test_reload_forgets_renamed_and_deleted_classes(self):
+        """Test that the classes no longer defined by a changed file are not registered again."""
+        results = self._results()
+
+        self.assertEqual(results['extra'], {'foo': 'FooCommand', 'zap': 'ZapCommand'})
+        self.assertEqual(results['renamed'], {'foo': 'BarCommand'})
+        removed = [signature for summary in results['summaries'] for signature in summary['commands']['removed']]
+        self.assertIn('zap', removed)
+        self.assertNotIn('foo', removed)
+
+    def test_failed_reload_keeps_previous_configuration(self):
+        """Test that a configuration module failing to load leaves the configuration unchanged."""
+        results = self._results()
+
+        self.assertEqual(results['broken'], 'after')
+        self.assertIn('Error reloading module app', self.result.stderr)
+
+    def test_reloads_task_manager(self):
+        """Test that a changed task manager is imported again and reported to the hooks."""
+        results = self._results()
+
+        self.assertEqual(results['tasks'], 2)
+        self.assertTrue(results['summaries'][-1]['tasks'])
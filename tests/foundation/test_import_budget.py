@@ -0,0 +1,113 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+REACTOR = '''
+import sys
+from orionis.luminate.application import orionis
+from orionis.luminate.container.container import Container
+from orionis.luminate.services.commands.reactor_commands_service import ReactorCommandsService
+
+orionis().boot()
+Container().make(ReactorCommandsService).execute(None, {}, sys.argv)
+'''
+
+APP_CONFIG = '''
+from orionis.luminate.contracts.config.i_config import IConfig
+
+class Config(IConfig):
+    config = {"name": "budget", "timezone": "UTC"}
+'''
+
+LOGGING_CONFIG = '''
+from orionis.luminate.contracts.config.i_config import IConfig
+
+class Config(IConfig):
+    config = {"default": "stack", "channels": {"stack": {"path": "storage/logs/orionis.log", "level": "info"}}}
+'''
+
+# Modules only needed by some commands, which must not be imported by the light ones
+HEAVY_MODULES = ('apscheduler', 'dotenv', 'asyncio', 'concurrent.futures.process')
+
+# Cumulative import time allowed for the framework, generous to tolerate slow machines
+IMPORT_BUDGET_US = 1_000_000
+
+class TestImportBudget(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a minimal application in a temporary directory."""
+        cls.directory = tempfile.TemporaryDirectory()
+
+        # The framework is discovered relative to the application, as in an installed project
+        shutil.copytree(
+            os.path.join(REPOSITORY, 'orionis'), os.path.join(cls.directory.name, 'orionis'),
+            ignore=shutil.ignore_patterns('__pycache__')
+        )
+        files = {
+            'reactor': REACTOR,
+            '.env': "# Application\nAPP_NAME=budget\nexport APP_DEBUG='false'\nAPP_URL=\"http://localhost\"\n",
+            os.path.join('config', '__init__.py'): '',
+            os.path.join('config', 'app.py'): APP_CONFIG,
+            os.path.join('config', 'logging.py'): LOGGING_CONFIG,
+            os.path.join('app', '__init__.py'): '',
+            os.path.join('app', 'console', '__init__.py'): '',
+            os.path.join('app', 'console', 'commands', '__init__.py'): ''
+        }
+        for name, content in files.items():
+            path = os.path.join(cls.directory.name, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as file:
+                file.write(content)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary application."""
+        cls.directory.cleanup()
+
+    def _imports(self, command: str) -> dict:
+        """Run a reactor command with -X importtime and return the cumulative time of each module."""
+        environment = dict(os.environ, PYTHONPATH=self.directory.name)
+        environment.pop('ORIONIS_PROFILE_BOOT', None)
+        # The first run compiles the modules, only the second one is measured
+        for _ in range(2):
+            result = subprocess.run(
+                [sys.executable, '-X', 'importtime', 'reactor', command],
+                cwd=self.directory.name, env=environment, capture_output=True, text=True, timeout=120
+            )
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+
+        imports = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            imports[name.strip()] = int(cumulative)
+        return imports
+
+    def test_light_commands_skip_heavy_modules(self):
+        """Test that the version and help commands do not import the modules of other commands."""
+        for command in ('version', 'help'):
+            with self.subTest(command=command):
+                imports = self._imports(command)
+
+                self.assertIn('orionis.luminate.application', imports)
+                for module in HEAVY_MODULES:
+                    self.assertNotIn(module, imports)
+                self.assertLess(imports['orionis.luminate.application'], IMPORT_BUDGET_US)
+
+    def test_schedule_facade_does_not_import_apscheduler(self):
+        """Test that importing the Schedule facade leaves APScheduler to the deferred provider."""
+        environment = dict(os.environ, PYTHONPATH=self.directory.name)
+        result = subprocess.run(
+            [sys.executable, '-c', "import sys, orionis.luminate.facades.commands.scheduler_facade; print('apscheduler' in sys.modules)"],
+            cwd=self.directory.name, env=environment, capture_output=True, text=True, timeout=120
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), 'False')
@@ -0,0 +1,144 @@
+import logging
+import os
+import tempfile
+import time
+import unittest
+from orionis.luminate.foundation.prefork.prefork_supervisor import PreforkSupervisor, PreforkWorker
+from orionis.luminate.services.log.log_service import LogguerService
+
+@unittest.skipUnless(hasattr(os, 'fork'), "Forking is not supported on this platform.")
+class TestPreforkSupervisor(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a directory where the workers record their runs."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.hooks = list(PreforkSupervisor._hooks)
+        PreforkSupervisor._hooks[:] = []
+
+    def tearDown(self):
+        """Remove the directory and the hooks registered by the test."""
+        PreforkSupervisor._hooks[:] = self.hooks
+        self.directory.cleanup()
+
+    def _record(self, name: str) -> None:
+        """Record a run of the current worker."""
+        with open(os.path.join(self.directory.name, f"{name}-{os.getpid()}"), 'w'):
+            pass
+
+    def _records(self, name: str) -> int:
+        """Count the runs recorded under a name."""
+        return len([file for file in os.listdir(self.directory.name) if file.startswith(f"{name}-")])
+
+    def _superviseUntil(self, supervisor: PreforkSupervisor, condition, timeout: float = 10.0) -> None:
+        """Supervise the workers until a condition holds."""
+        deadline = time.monotonic() + timeout
+        while not condition():
+            self.assertLess(time.monotonic(), deadline, "The condition was not reached in time.")
+            supervisor.supervise(0.05)
+
+    def test_forks_workers_and_runs_hooks(self):
+        """Test that each worker runs the fork hooks, then its target until it is stopped."""
+        PreforkSupervisor.afterFork(lambda: self._record('hook'))
+
+        def target(worker: PreforkWorker):
+            self._record('worker')
+            while not worker.shouldStop():
+                time.sleep(0.01)
+
+        supervisor = PreforkSupervisor(target, workers=3)
+        supervisor.start()
+        try:
+            self._superviseUntil(supervisor, lambda: self._records('worker') == 3)
+            self.assertEqual(len(set(supervisor.pids())), 3)
+            self.assertEqual(self._records('hook'), 3)
+        finally:
+            supervisor.stop()
+
+        self.assertEqual(supervisor.pids(), [])
+        self.assertEqual(supervisor.getRestarts(), {'recycled': 3, 'crashed': 0})
+
+    def test_replaces_workers_reaching_their_job_limit(self):
+        """Test that a worker returning after its job limit is forked again."""
+        def target(worker: PreforkWorker):
+            while not worker.shouldStop():
+                worker.jobDone()
+            self._record('done')
+
+        supervisor = PreforkSupervisor(target, workers=1, max_jobs=5)
+        supervisor.start()
+        try:
+            self._superviseUntil(supervisor, lambda: supervisor.getRestarts()['recycled'] >= 2)
+        finally:
+            supervisor.stop()
+
+        self.assertGreaterEqual(self._records('done'), 2)
+        self.assertEqual(supervisor.getRestarts()['crashed'], 0)
+
+    def test_replaces_crashed_workers(self):
+        """Test that a crashing worker is forked again."""
+        def target(worker: PreforkWorker):
+            self._record('crash')
+            raise RuntimeError("Worker failure")
+
+        supervisor = PreforkSupervisor(target, workers=1)
+        supervisor.start()
+        try:
+            self._superviseUntil(supervisor, lambda: supervisor.getRestarts()['crashed'] >= 2)
+        finally:
+            supervisor.stop()
+
+        self.assertGreaterEqual(self._records('crash'), 2)
+
+    def test_bound_hooks_are_held_weakly(self):
+        """Test that the hook of a collected object is forgotten."""
+        class Service:
+            calls = 0
+            def reopen(self):
+                Service.calls += 1
+
+        service = Service()
+        PreforkSupervisor.afterFork(service.reopen)
+        PreforkSupervisor.runForkHooks()
+        del service
+        PreforkSupervisor.runForkHooks()
+
+        self.assertEqual(Service.calls, 1)
+        self.assertEqual(PreforkSupervisor._hooks, [])
+
+    def test_hooks_are_registered_once(self):
+        """Test that registering a hook again, or after others were collected, does not grow the hooks."""
+        class Service:
+            def reopen(self):
+                pass
+
+        def hook():
+            pass
+
+        for _ in range(3):
+            PreforkSupervisor.afterFork(Service().reopen)
+            PreforkSupervisor.afterFork(hook)
+
+        self.assertEqual(len(PreforkSupervisor._hooks), 1)
+        self.assertIs(PreforkSupervisor._hooks[0](), hook)
+
+    def test_log_files_are_reopened_lazily(self):
+        """Test that reopening the logs closes the inherited stream and opens a new one on the next record."""
+        path = os.path.join(self.directory.name, 'orionis.log')
+        handler = logging.FileHandler(path, encoding='utf-8')
+        root = logging.getLogger()
+        root.addHandler(handler)
+        try:
+            inherited = handler.stream
+            LogguerService.reopen(object.__new__(LogguerService))
+            self.assertTrue(inherited.closed)
+            self.assertIsNone(handler.stream)
+
+            handler.emit(logging.makeLogRecord({'msg': 'worker'}))
+            self.assertIsNotNone(handler.stream)
+            self.assertIsNot(handler.stream, inherited)
+        finally:
+            root.removeHandler(handler)
+            handler.close()
+
+        with open(path, encoding='utf-8') as file:
+            self.assertEqual(file.read(), 'worker\n')
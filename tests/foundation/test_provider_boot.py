@@ -0,0 +1,126 @@
+import threading
+import time
+import unittest
+from orionis.luminate.application import Application
+from orionis.luminate.container.container import Container
+from orionis.luminate.foundation.exceptions.exception_bootstrapper import BootstrapRuntimeError
+from orionis.luminate.providers.service_provider import ServiceProvider
+
+EVENTS = []
+LOCK = threading.Lock()
+
+class RecordingProvider(ServiceProvider):
+    """Provider recording when it is registered and booted."""
+
+    delay = 0.0
+    fails = False
+
+    def register(self) -> None:
+        with LOCK:
+            EVENTS.append(('register', type(self).__name__))
+
+    def boot(self) -> None:
+        time.sleep(self.delay)
+        if self.fails:
+            raise RuntimeError(f"{type(self).__name__} failure")
+        with LOCK:
+            EVENTS.append(('boot', type(self).__name__))
+
+class ConfigProvider(RecordingProvider):
+    pass
+
+class LogProvider(RecordingProvider):
+    dependencies = [ConfigProvider]
+
+class CacheProvider(RecordingProvider):
+    dependencies = ['ConfigProvider']
+
+class ReactorProvider(RecordingProvider):
+    dependencies = [LogProvider, CacheProvider]
+
+class SlowAProvider(RecordingProvider):
+    delay = 0.3
+
+class SlowBProvider(RecordingProvider):
+    delay = 0.3
+
+class FailingProvider(RecordingProvider):
+    fails = True
+
+class DependentProvider(RecordingProvider):
+    dependencies = [FailingProvider]
+
+class UnknownDependencyProvider(RecordingProvider):
+    dependencies = ['MissingProvider']
+
+class CycleAProvider(RecordingProvider):
+    dependencies = ['CycleBProvider']
+
+class CycleBProvider(RecordingProvider):
+    dependencies = [CycleAProvider]
+
+class TestProviderBoot(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a fresh application without booting it."""
+        EVENTS.clear()
+        Application.reset()
+        Container.reset()
+        self.app = Application(Container())
+
+    def tearDown(self):
+        """Discard the application used by the test."""
+        Application.reset()
+        Container.reset()
+
+    def _load(self, *providers):
+        """Load providers as the group booted after the bootstrapping."""
+        self.app._after_boot_service_providers = list(providers)
+        self.app._loadProviders(self.app._after_boot_service_providers)
+
+    def test_boots_dependencies_first(self):
+        """Test that each provider is registered and booted after its dependencies are booted."""
+        self._load(ReactorProvider, LogProvider, CacheProvider, ConfigProvider)
+
+        self.assertEqual(EVENTS[:4], [
+            ('register', 'ConfigProvider'), ('boot', 'ConfigProvider'),
+            ('register', 'CacheProvider'), ('register', 'LogProvider')
+        ])
+        self.assertEqual(sorted(EVENTS[4:6]), [('boot', 'CacheProvider'), ('boot', 'LogProvider')])
+        self.assertEqual(EVENTS[6:], [('register', 'ReactorProvider'), ('boot', 'ReactorProvider')])
+
+    def test_independent_providers_boot_concurrently(self):
+        """Test that independent providers overlap, unless a single worker is requested."""
+        started = time.perf_counter()
+        self._load(SlowAProvider, SlowBProvider)
+        concurrent = time.perf_counter() - started
+
+        self.app.withProviderWorkers(1)
+        started = time.perf_counter()
+        self._load(SlowAProvider, SlowBProvider)
+        sequential = time.perf_counter() - started
+
+        self.assertLess(concurrent, 0.5)
+        self.assertGreaterEqual(sequential, 0.6)
+
+    def test_failures_are_reported_together(self):
+        """Test that failures are sorted and the dependents of a failed provider are skipped."""
+        with self.assertRaises(BootstrapRuntimeError) as context:
+            self._load(DependentProvider, ConfigProvider, FailingProvider)
+
+        message = str(context.exception)
+        self.assertIn("Failed to boot 2 service provider(s)", message)
+        self.assertLess(message.index('DependentProvider: A dependency failed'), message.index('FailingProvider: FailingProvider failure'))
+        self.assertIn(('boot', 'ConfigProvider'), EVENTS)
+        self.assertNotIn(('boot', 'DependentProvider'), EVENTS)
+
+    def test_invalid_dependencies(self):
+        """Test that unknown and circular dependencies are rejected before any registration."""
+        with self.assertRaises(BootstrapRuntimeError) as context:
+            self._load(UnknownDependencyProvider)
+        self.assertIn("'MissingProvider'", str(context.exception))
+
+        with self.assertRaises(BootstrapRuntimeError) as context:
+            self._load(CycleAProvider, CycleBProvider)
+        self.assertIn("Circular dependency", str(context.exception))
+        self.assertEqual(EVENTS, [])
@@ -0,0 +1,89 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from orionis.luminate.foundation.discovery.static_discovery import StaticDiscovery
+
+COMMANDS_SOURCE = '''
+from orionis.luminate.console.base.command import BaseCommand as Command
+
+SIGNATURE_PREFIX = "report"
+
+class ReportBase(Command):
+    description = "Builds a report."
+
+class DailyReport(ReportBase):
+    signature = "report:daily"
+
+class DynamicReport(Command):
+    signature = SIGNATURE_PREFIX + ":dynamic"
+    description = "Computed signature."
+
+class Unrelated:
+    signature = "unrelated"
+'''
+
+class TestStaticDiscovery(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a temporary directory holding source files that are never importable."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = os.path.join(self.directory.name, 'cache', StaticDiscovery.CACHE_FILE)
+        self.files = [self._source('reports.py', COMMANDS_SOURCE), self._source('broken.py', 'class Broken(:\n')]
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def _source(self, name: str, content: str) -> str:
+        """Write a source file and return its path."""
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w') as file:
+            file.write(content)
+        return path
+
+    def test_finds_subclasses_without_importing(self):
+        """Test that direct, indirect and aliased subclasses are found with their literal attributes."""
+        entries = StaticDiscovery(self.cache).discover(self.files, 'BaseCommand')
+
+        found = {entry['class']: entry for entry in entries}
+        self.assertEqual(list(found), ['ReportBase', 'DailyReport', 'DynamicReport'])
+        self.assertEqual(found['DailyReport']['attributes'], {'description': 'Builds a report.', 'signature': 'report:daily'})
+        self.assertEqual(found['DynamicReport']['dynamic'], ['signature'])
+        self.assertNotIn('signature', found['DynamicReport']['attributes'])
+        self.assertNotIn('reports', sys.modules)
+
+    def test_unchanged_files_are_not_parsed_again(self):
+        """Test that the cache avoids parsing unchanged files, even once renamed."""
+        first = StaticDiscovery(self.cache).discover(self.files, 'BaseCommand')
+
+        with mock.patch.object(StaticDiscovery, 'parse', side_effect=AssertionError("parsed again")):
+            self.assertEqual(StaticDiscovery(self.cache).discover(self.files, 'BaseCommand'), first)
+            renamed = os.path.join(self.directory.name, 'renamed.py')
+            os.rename(self.files[0], renamed)
+            entries = StaticDiscovery(self.cache).discover([renamed], 'BaseCommand')
+
+        self.assertEqual([entry['class'] for entry in entries], ['ReportBase', 'DailyReport', 'DynamicReport'])
+
+    def test_changed_files_are_parsed_again(self):
+        """Test that editing a file refreshes its cached classes."""
+        StaticDiscovery(self.cache).discover(self.files, 'BaseCommand')
+        with open(self.files[0], 'a') as file:
+            file.write('\nclass WeeklyReport(ReportBase):\n    signature = "report:weekly"\n')
+
+        entries = StaticDiscovery(self.cache).discover(self.files, 'BaseCommand')
+
+        self.assertIn('WeeklyReport', [entry['class'] for entry in entries])
+
+    def test_process_pool_gives_the_same_result(self):
+        """Test that parsing across processes finds the same classes."""
+        files = [self._source(f'report_{index}.py', COMMANDS_SOURCE.replace('Report', f'Report{index}')) for index in range(8)]
+        sequential = StaticDiscovery(max_workers=1).discover(files, 'BaseCommand')
+
+        discovery = StaticDiscovery(max_workers=2)
+        discovery.PARALLEL_THRESHOLD = 4
+        parallel = discovery.discover(files, 'BaseCommand')
+
+        self.assertEqual(parallel, sequential)
+        self.assertEqual(len(parallel), 24)